@@ -2,6 +2,7 @@
 
 import asyncio
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_manager import HttpSessionManager
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -31,4 +32,5 @@ class ExitCommand:
         for notifier in self.notifiers:
             notifier.stop()
 
+        await HttpSessionManager.get_instance().close()
         self.app.exit()
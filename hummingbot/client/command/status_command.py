@@ -5,7 +5,7 @@ from collections import (
     OrderedDict
 )
 import inspect
-from typing import List, Dict
+from typing import Any, List, Dict
 from hummingbot import check_dev_mode
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.connector.connector_base import ConnectorBase
@@ -112,8 +112,43 @@ class StatusCommand:
         missing_configs = missing_required_configs(get_strategy_config_map(self.strategy_name))
         return missing_globals + missing_configs
 
+    def order_book_tracking_status(self,  # type: HummingbotApplication
+                                   ) -> str:
+        lines: List[str] = []
+        for market in self.markets.values():
+            order_book_tracker = getattr(market, "order_book_tracker", None)
+            if order_book_tracker is None:
+                continue
+            tracking_metrics: Dict[str, Dict[str, Any]] = order_book_tracker.get_tracking_metrics()
+            if len(tracking_metrics) == 0:
+                continue
+            metrics_df: pd.DataFrame = pd.DataFrame(
+                data=[[trading_pair,
+                       metrics["queue_depth"],
+                       f"{metrics['diffs_per_second']:.1f}",
+                       f"{metrics['latency_p50_ms']:.0f}",
+                       f"{metrics['latency_p99_ms']:.0f}",
+                       f"{metrics['latency_max_ms']:.0f}",
+                       metrics["rejected_messages"],
+                       metrics["snapshot_restores"],
+                       metrics["sequence_gaps"],
+                       "Yes" if order_book_tracker.is_order_book_healthy(trading_pair) else "No"]
+                      for trading_pair, metrics in tracking_metrics.items()],
+                columns=["Market", "Queued", "Diffs/s", "p50 ms", "p99 ms", "Max ms", "Rejected", "Snapshots", "Gaps",
+                         "Healthy"]
+            )
+            lines.append(f"\n  {market.display_name.capitalize()} order books:")
+            lines.extend(["    " + line for line in metrics_df.to_string(index=False).split("\n")])
+        if len(lines) == 0:
+            return "\n  No order books are being tracked."
+        return "\n".join(lines)
+
     def status(self,  # type: HummingbotApplication
-               live: bool = False):
+               live: bool = False,
+               order_books: bool = False):
+        if order_books:
+            self._notify(self.order_book_tracking_status())
+            return
         safe_ensure_future(self.status_check_all(live=live), loop=self.ev_loop)
 
     async def status_check_all(self,  # type: HummingbotApplication
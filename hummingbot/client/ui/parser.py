@@ -99,6 +99,8 @@ def load_parser(hummingbot) -> ThrowingArgumentParser:
 
     status_parser = subparsers.add_parser("status", help="Get the market status of the current bot")
     status_parser.add_argument("--live", default=False, action="store_true", dest="live", help="Show status updates")
+    status_parser.add_argument("-o", "--order_books", default=False, action="store_true", dest="order_books",
+                               help="Show order book tracking lag and throughput per trading pair")
     status_parser.set_defaults(func=hummingbot.status)
 
     history_parser = subparsers.add_parser("history", help="See the past performance of the current bot")
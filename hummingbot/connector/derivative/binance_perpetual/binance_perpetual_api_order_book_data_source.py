@@ -5,20 +5,23 @@ from typing import Dict, List, Optional, Any, AsyncIterable
 from decimal import Decimal
 
 import aiohttp
-import pandas as pd
 import ujson
 import requests
 import cachetools.func
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.data_type.last_traded_price_cache import LastTradedPriceCache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
-from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_manager import get_shared_client
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_order_book import BinancePerpetualOrderBook
-from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_to_exchange_trading_pair
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import (
+    convert_from_exchange_trading_pair,
+    convert_to_exchange_trading_pair
+)
 
 from hummingbot.connector.derivative.binance_perpetual.constants import (
     PERPETUAL_BASE_URL,
@@ -30,6 +33,7 @@ from hummingbot.connector.derivative.binance_perpetual.constants import (
 # API OrderBook Endpoints
 SNAPSHOT_REST_URL = "{}/fapi/v1/depth"
 TICKER_PRICE_URL = "{}/fapi/v1/ticker/bookTicker"
+LAST_PRICE_URL = "{}/fapi/v1/ticker/price"
 TICKER_PRICE_CHANGE_URL = "{}/fapi/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "{}/fapi/v1/exchangeInfo"
 RECENT_TRADES_URL = "{}/fapi/v1/trades"
@@ -54,17 +58,31 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str], domain=None) -> Dict[str, float]:
-        tasks = [cls.get_last_traded_price(t_pair, domain) for t_pair in trading_pairs]
-        results = await safe_gather(*tasks)
-        return {t_pair: result for t_pair, result in zip(trading_pairs, results)}
+        url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
+
+        async def fetch_all_prices() -> Dict[str, float]:
+            client: aiohttp.ClientSession = get_shared_client()
+            async with client.get(LAST_PRICE_URL.format(url)) as response:
+                if response.status != 200:
+                    raise IOError(f"Error fetching Binance Perpetual last traded prices. "
+                                  f"HTTP status is {response.status}.")
+                records: List[Dict[str, Any]] = await response.json()
+            prices: Dict[str, float] = {}
+            for record in records:
+                trading_pair: Optional[str] = convert_from_exchange_trading_pair(record["symbol"])
+                if trading_pair is not None:
+                    prices[trading_pair] = float(record["price"])
+            return prices
+
+        return await LastTradedPriceCache.get_instance(url).get_prices(fetch_all_prices, trading_pairs)
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str, domain=None) -> float:
-        async with aiohttp.ClientSession() as client:
-            url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
-            resp = await client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
-            resp_json = await resp.json()
-            return float(resp_json["lastPrice"])
+        client: aiohttp.ClientSession = get_shared_client()
+        url = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
+        resp = await client.get(f"{TICKER_PRICE_CHANGE_URL.format(url)}?symbol={convert_to_exchange_trading_pair(trading_pair)}")
+        resp_json = await resp.json()
+        return float(resp_json["lastPrice"])
 
     """
     async def get_trading_pairs(self) -> List[str]:
@@ -99,22 +117,22 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
         try:
             from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_utils import convert_from_exchange_trading_pair
             BASE_URL = TESTNET_BASE_URL if domain == "binance_perpetual_testnet" else PERPETUAL_BASE_URL
-            async with aiohttp.ClientSession() as client:
-                async with client.get(EXCHANGE_INFO_URL.format(BASE_URL), timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        raw_trading_pairs = [d["symbol"] for d in data["symbols"] if d["status"] == "TRADING"]
-                        trading_pair_list: List[str] = []
-                        for raw_trading_pair in raw_trading_pairs:
-                            try:
-                                trading_pair = convert_from_exchange_trading_pair(raw_trading_pair)
-                                if trading_pair is not None:
-                                    trading_pair_list.append(trading_pair)
-                                else:
-                                    continue
-                            except Exception:
-                                pass
-                        return trading_pair_list
+            client: aiohttp.ClientSession = get_shared_client()
+            async with client.get(EXCHANGE_INFO_URL.format(BASE_URL), timeout=10) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    raw_trading_pairs = [d["symbol"] for d in data["symbols"] if d["status"] == "TRADING"]
+                    trading_pair_list: List[str] = []
+                    for raw_trading_pair in raw_trading_pairs:
+                        try:
+                            trading_pair = convert_from_exchange_trading_pair(raw_trading_pair)
+                            if trading_pair is not None:
+                                trading_pair_list.append(trading_pair)
+                            else:
+                                continue
+                        except Exception:
+                            pass
+                    return trading_pair_list
         except Exception:
             pass
         return []
@@ -132,41 +150,41 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
             return data
 
     async def get_new_order_book(self, trading_pair: str) -> OrderBook:
-        async with aiohttp.ClientSession() as client:
-            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._base_url)
-            snapshot_timestamp: float = time.time()
-            snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
-                snapshot,
-                snapshot_timestamp,
-                metadata={"trading_pair": trading_pair}
-            )
-            order_book = self.order_book_create_function()
-            order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-            return order_book
+        client: aiohttp.ClientSession = get_shared_client()
+        snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000, self._base_url)
+        snapshot_timestamp: float = time.time()
+        snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+        order_book = self.order_book_create_function()
+        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        return order_book
 
     """
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
-        async with aiohttp.ClientSession() as client:
-            trading_pairs: List[str] = await self.get_trading_pairs()
-            return_val: Dict[str, OrderBookTrackerEntry] = {}
-            for trading_pair in trading_pairs:
-                try:
-                    snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
-                    snapshot_timestamp: float = time.time()
-                    snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
-                        snapshot,
-                        snapshot_timestamp,
-                        metadata={"trading_pair": trading_pair}
-                    )
-                    order_book: OrderBook = self.order_book_create_function()
-                    order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
-                    return_val[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
-                    self.logger().info(f"Initialized order book for {trading_pair}. ")
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    self.logger().error(f"Error getting snapshot for {trading_pair}: {e}", exc_info=True)
-                    await asyncio.sleep(5)
-            return return_val
+        client: aiohttp.ClientSession = get_shared_client()
+        trading_pairs: List[str] = await self.get_trading_pairs()
+        return_val: Dict[str, OrderBookTrackerEntry] = {}
+        for trading_pair in trading_pairs:
+            try:
+                snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
+                snapshot_timestamp: float = time.time()
+                snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
+                    snapshot,
+                    snapshot_timestamp,
+                    metadata={"trading_pair": trading_pair}
+                )
+                order_book: OrderBook = self.order_book_create_function()
+                order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+                return_val[trading_pair] = OrderBookTrackerEntry(trading_pair, snapshot_timestamp, order_book)
+                self.logger().info(f"Initialized order book for {trading_pair}. ")
+                await asyncio.sleep(1)
+            except Exception as e:
+                self.logger().error(f"Error getting snapshot for {trading_pair}: {e}", exc_info=True)
+                await asyncio.sleep(5)
+        return return_val
     """
 
     async def ws_messages(self, client: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
@@ -227,33 +245,13 @@ class BinancePerpetualAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 await asyncio.sleep(30)
 
     async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
-        while True:
-            try:
-                # trading_pairs: List[str] = await self.get_trading_pairs()
-                async with aiohttp.ClientSession() as client:
-                    for trading_pair in self._trading_pairs:
-                        try:
-                            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, domain=self._base_url)
-                            snapshot_timestamp: float = time.time()
-                            snapshot_msg: OrderBookMessage = BinancePerpetualOrderBook.snapshot_message_from_exchange(
-                                snapshot,
-                                snapshot_timestamp,
-                                metadata={"trading_pair": trading_pair}
-                            )
-                            output.put_nowait(snapshot_msg)
-                            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
-                            await asyncio.sleep(5)
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception:
-                            self.logger().error("Unexpected error.", exc_info=True)
-                            await asyncio.sleep(5)
-                    this_hour: pd.Timestamp = pd.Timestamp.utcnow().replace(minute=0, second=0, microsecond=0)
-                    next_hour: pd.Timestamp = this_hour + pd.Timedelta(hours=1)
-                    delta: float = next_hour.timestamp() - time.time()
-                    await asyncio.sleep(delta)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Unexpected error.", exc_info=True)
-                await asyncio.sleep(5.0)
+        client: aiohttp.ClientSession = get_shared_client()
+
+        async def fetch_snapshot(trading_pair: str) -> OrderBookMessage:
+            snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, domain=self._base_url)
+            return BinancePerpetualOrderBook.snapshot_message_from_exchange(
+                snapshot,
+                time.time(),
+                metadata={"trading_pair": trading_pair}
+            )
+        await self._listen_for_scheduled_snapshots(fetch_snapshot, output)
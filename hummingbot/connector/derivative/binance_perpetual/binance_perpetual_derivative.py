@@ -143,6 +143,11 @@ class BinancePerpetualDerivative(DerivativeBase):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_book_tracker.order_books
 
+    @property
+    def order_book_tracker(self):
+        # The tracker is set on the instance, not in ExchangeBase's slot.
+        return self._order_book_tracker
+
     @property
     def ready(self):
         return all(self.status_dict.values())
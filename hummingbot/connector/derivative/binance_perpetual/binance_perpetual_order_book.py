@@ -1,6 +1,7 @@
 import logging
 from typing import Optional, Dict
 
+from hummingbot.core.data_type.compact_order_book_message import CompactOrderBookMessage
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
@@ -19,28 +20,28 @@ class BinancePerpetualOrderBook(OrderBook):
 
     @classmethod
     def snapshot_message_from_exchange(cls, msg: Dict[str, any], timestamp: Optional[float] = None,
-                                       metadata: Optional[Dict] = None) -> OrderBookMessage:
+                                       metadata: Optional[Dict] = None) -> CompactOrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
-            "trading_pair": msg["trading_pair"],
-            "update_id": msg["lastUpdateId"],
-            "bids": msg["bids"],
-            "asks": msg["asks"]
-        }, timestamp=timestamp)
+        return CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                       msg["trading_pair"],
+                                       update_id=msg["lastUpdateId"],
+                                       raw_bids=msg["bids"],
+                                       raw_asks=msg["asks"],
+                                       timestamp=timestamp)
 
     @classmethod
     def diff_message_from_exchange(cls, msg: Dict[str, any], timestamp: Optional[float] = None,
-                                   metadata: Optional[Dict] = None) -> OrderBookMessage:
+                                   metadata: Optional[Dict] = None) -> CompactOrderBookMessage:
         data = msg["data"]
         if metadata:
             data.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
-            "trading_pair": binance_perpetual_utils.convert_from_exchange_trading_pair(data["s"]),
-            "update_id": data["u"],
-            "bids": data["b"],
-            "asks": data["a"]
-        }, timestamp=timestamp)
+        return CompactOrderBookMessage(OrderBookMessageType.DIFF,
+                                       binance_perpetual_utils.convert_from_exchange_trading_pair(data["s"]),
+                                       update_id=data["u"],
+                                       raw_bids=data["b"],
+                                       raw_asks=data["a"],
+                                       timestamp=timestamp)
 
     @classmethod
     def trade_message_from_exchange(cls, msg: Dict[str, any], metadata: Optional[Dict] = None):
@@ -9,6 +9,7 @@ from websockets import ConnectionClosed
 
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_manager import get_shared_client
 from hummingbot.logger import HummingbotLogger
 
 BINANCE_USER_STREAM_ENDPOINT = "/fapi/v1/listenKey"
@@ -37,26 +38,26 @@ class BinancePerpetualUserStreamDataSource(UserStreamTrackerDataSource):
         self._wss_stream_url = stream_url + "/ws/"
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
-            async with client.post(self._http_stream_url,
-                                   headers={"X-MBX-APIKEY": self._api_key}) as response:
-                response: aiohttp.ClientResponse = response
-                if response.status != 200:
-                    raise IOError(f"Error fetching Binance Perpetual user stream listen key. "
-                                  f"HTTP status is {response.status}.")
-                data: Dict[str, str] = await response.json()
-                return data["listenKey"]
+        client: aiohttp.ClientSession = get_shared_client()
+        async with client.post(self._http_stream_url,
+                               headers={"X-MBX-APIKEY": self._api_key}) as response:
+            response: aiohttp.ClientResponse = response
+            if response.status != 200:
+                raise IOError(f"Error fetching Binance Perpetual user stream listen key. "
+                              f"HTTP status is {response.status}.")
+            data: Dict[str, str] = await response.json()
+            return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
-            async with client.put(self._http_stream_url,
-                                  headers={"X-MBX-APIKEY": self._api_key},
-                                  params={"listenKey": listen_key}) as response:
-                data: [str, any] = await response.json()
-                if "code" in data:
-                    self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
-                    return False
-                return True
+        client: aiohttp.ClientSession = get_shared_client()
+        async with client.put(self._http_stream_url,
+                              headers={"X-MBX-APIKEY": self._api_key},
+                              params={"listenKey": listen_key}) as response:
+            data: [str, any] = await response.json()
+            if "code" in data:
+                self.logger().warning(f"Failed to refresh the listen key {listen_key}: {data}")
+                return False
+            return True
 
     async def ws_messages(self, client: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
         try:
@@ -13,7 +13,10 @@ import ujson
 import websockets
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.utils.async_utils import safe_ensure_future
-from binance.client import Client as BinanceClient
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.http_session_manager import get_shared_client
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRESTClient
+from hummingbot.connector.exchange.binance.binance_utils import RATE_LIMITS
 from hummingbot.logger import HummingbotLogger
 
 BINANCE_API_ENDPOINT = "https://api.binance.{}/api/v1/"
@@ -34,8 +37,12 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
             cls._bausds_logger = logging.getLogger(__name__)
         return cls._bausds_logger
 
-    def __init__(self, binance_client: BinanceClient, domain: str = "com"):
-        self._binance_client: BinanceClient = binance_client
+    def __init__(self, binance_client: BinanceRESTClient, domain: str = "com", throttler: Optional[Throttler] = None):
+        """
+        :param throttler: the exchange's REST throttler, a private one with the exchange's limits is used if None
+        """
+        self._binance_client: BinanceRESTClient = binance_client
+        self._throttler: Throttler = throttler or Throttler(rate_limits=RATE_LIMITS)
         self._current_listen_key = None
         self._listen_for_user_stream_task = None
         self._last_recv_time: float = 0
@@ -47,8 +54,9 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
         return self._last_recv_time
 
     async def get_listen_key(self):
-        async with aiohttp.ClientSession() as client:
-            url = BINANCE_API_ENDPOINT.format(self._domain)
+        client: aiohttp.ClientSession = get_shared_client()
+        url = BINANCE_API_ENDPOINT.format(self._domain)
+        async with self._throttler.weighted_task(request_weight=1):
             async with client.post(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
                                    headers={"X-MBX-APIKEY": self._binance_client.API_KEY}) as response:
                 response: aiohttp.ClientResponse = response
@@ -58,8 +66,9 @@ class BinanceAPIUserStreamDataSource(UserStreamTrackerDataSource):
                 return data["listenKey"]
 
     async def ping_listen_key(self, listen_key: str) -> bool:
-        async with aiohttp.ClientSession() as client:
-            url = BINANCE_API_ENDPOINT.format(self._domain)
+        client: aiohttp.ClientSession = get_shared_client()
+        url = BINANCE_API_ENDPOINT.format(self._domain)
+        async with self._throttler.weighted_task(request_weight=1):
             async with client.put(f"{url}{BINANCE_USER_STREAM_ENDPOINT}",
                                   headers={"X-MBX-APIKEY": self._binance_client.API_KEY},
                                   params={"listenKey": listen_key}) as response:
@@ -7,9 +7,6 @@ from aiokafka import (
 )
 import asyncio
 from async_timeout import timeout
-from binance.client import Client as BinanceClient
-from binance import client as binance_client_module
-from binance.exceptions import BinanceAPIException
 from decimal import Decimal
 from functools import partial
 import logging
@@ -21,13 +18,16 @@ from typing import (
     List,
     AsyncIterable,
     Optional,
-    Coroutine,
 )
 
 import conf
 from hummingbot.core.utils.asyncio_throttle import Throttler
 from hummingbot.core.utils import async_ttl_cache
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    CallFactory
+)
+from hummingbot.core.utils.http_session_manager import get_shared_client
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.utils.async_utils import (
@@ -58,13 +58,20 @@ from hummingbot.core.data_type.transaction_tracker import TransactionTracker
 from hummingbot.connector.trading_rule cimport TradingRule
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
+from hummingbot.core.data_type.multiprocess_order_book_tracker import MultiprocessOrderBookTracker
 from .binance_order_book_tracker import BinanceOrderBookTracker
 from .binance_user_stream_tracker import BinanceUserStreamTracker
 from .binance_time import BinanceTime
+from .binance_rest_client import (
+    BinanceAPIError,
+    BinanceRESTClient
+)
 from .binance_in_flight_order import BinanceInFlightOrder
 from .binance_utils import (
     convert_from_exchange_trading_pair,
-    convert_to_exchange_trading_pair)
+    convert_to_exchange_trading_pair,
+    ORDER_LIMIT_WEIGHTS,
+    RATE_LIMITS)
 from hummingbot.core.data_type.common import OpenOrder
 from hummingbot.core.data_type.trade import Trade
 s_logger = None
@@ -127,15 +134,31 @@ cdef class BinanceExchange(ExchangeBase):
                  binance_api_secret: str,
                  trading_pairs: Optional[List[str]] = None,
                  trading_required: bool = True,
-                 domain="com"
+                 domain="com",
+                 order_book_tracker_processes: int = 0
                  ):
+        """
+        :param order_book_tracker_processes: if above 0, track order books in this many worker processes, see
+                                             MultiprocessOrderBookTracker
+        """
         self._domain = domain
-        self.monkey_patch_binance_time()
+        BinanceTime.get_instance().start()
         super().__init__()
         self._trading_required = trading_required
-        self._order_book_tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs, domain=domain)
-        self._binance_client = BinanceClient(binance_api_key, binance_api_secret, tld=domain)
-        self._user_stream_tracker = BinanceUserStreamTracker(binance_client=self._binance_client, domain=domain)
+        self._throttler = Throttler(rate_limits=RATE_LIMITS)
+        if order_book_tracker_processes > 0:
+            # Worker processes can't share the throttler, they split the default snapshot budget between them.
+            self._order_book_tracker = MultiprocessOrderBookTracker(partial(BinanceOrderBookTracker, domain=domain),
+                                                                    trading_pairs=trading_pairs,
+                                                                    process_count=order_book_tracker_processes)
+        else:
+            self._order_book_tracker = BinanceOrderBookTracker(trading_pairs=trading_pairs,
+                                                               domain=domain,
+                                                               throttler=self._throttler)
+        self._binance_client = BinanceRESTClient(binance_api_key, binance_api_secret, domain=domain)
+        self._user_stream_tracker = BinanceUserStreamTracker(binance_client=self._binance_client,
+                                                             domain=domain,
+                                                             throttler=self._throttler)
         self._ev_loop = asyncio.get_event_loop()
         self._poll_notifier = asyncio.Event()
         self._last_timestamp = 0
@@ -150,7 +173,6 @@ cdef class BinanceExchange(ExchangeBase):
         self._trading_rules_polling_task = None
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
 
     @property
     def name(self) -> str:
@@ -164,7 +186,7 @@ cdef class BinanceExchange(ExchangeBase):
         return self._order_book_tracker.order_books
 
     @property
-    def binance_client(self) -> BinanceClient:
+    def binance_client(self) -> BinanceRESTClient:
         return self._binance_client
 
     @property
@@ -206,17 +228,13 @@ cdef class BinanceExchange(ExchangeBase):
     async def get_active_exchange_markets(self) -> pd.DataFrame:
         return await BinanceAPIOrderBookDataSource.get_active_exchange_markets()
 
-    def monkey_patch_binance_time(self):
-        if binance_client_module.time != BinanceTime.get_instance():
-            binance_client_module.time = BinanceTime.get_instance()
-            BinanceTime.get_instance().start()
-
     async def schedule_async_call(
             self,
-            coro: Coroutine,
+            call_factory: CallFactory,
             timeout_seconds: float,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.") -> any:
-        return await self._async_scheduler.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+        return await self._async_scheduler.schedule_async_call(call_factory, timeout_seconds,
+                                                               app_warning_msg=app_warning_msg)
 
     async def query_api(
             self,
@@ -224,13 +242,16 @@ cdef class BinanceExchange(ExchangeBase):
             *args,
             app_warning_msg: str = "Binance API call failed. Check API key and network connection.",
             request_weight: int = 1,
+            limit_weights: Optional[Dict[str, int]] = None,
             **kwargs) -> Dict[str, any]:
-        async with self._throttler.weighted_task(request_weight=request_weight):
+        async with self._throttler.weighted_task(request_weight=request_weight, limit_weights=limit_weights):
             try:
-                return await self._async_scheduler.call_async(partial(func, *args, **kwargs),
-                                                              timeout_seconds=self.API_CALL_TIMEOUT,
-                                                              app_warning_msg=app_warning_msg)
+                return await asyncio.wait_for(func(*args, **kwargs), timeout=self.API_CALL_TIMEOUT)
+            except asyncio.CancelledError:
+                raise
             except Exception as ex:
+                app_warning_msg += f" [[Got exception: {str(ex)}]]"
+                self.logger().debug(app_warning_msg, exc_info=True)
                 if "Timestamp for this request" in str(ex):
                     self.logger().warning("Got Binance timestamp error. "
                                           "Going to force update Binance server time offset...")
@@ -241,12 +262,12 @@ cdef class BinanceExchange(ExchangeBase):
 
     async def query_url(self, url, request_weight: int = 1) -> any:
         async with self._throttler.weighted_task(request_weight=request_weight):
-            async with aiohttp.ClientSession() as client:
-                async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
-                    if response.status != 200:
-                        raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
-                    data = await response.json()
-                    return data
+            client: aiohttp.ClientSession = get_shared_client()
+            async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
+                if response.status != 200:
+                    raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
+                data = await response.json()
+                return data
 
     async def _update_balances(self):
         cdef:
@@ -257,7 +278,7 @@ cdef class BinanceExchange(ExchangeBase):
             set remote_asset_names = set()
             set asset_names_to_remove
 
-        account_info = await self.query_api(self._binance_client.get_account)
+        account_info = await self.query_api(self._binance_client.get_account, request_weight=5)
         balances = account_info["balances"]
         for balance_entry in balances:
             asset_name = balance_entry["asset"]
@@ -328,6 +349,10 @@ cdef class BinanceExchange(ExchangeBase):
             self._trading_rules.clear()
             for trading_rule in trading_rules_list:
                 self._trading_rules[convert_from_exchange_trading_pair(trading_rule.trading_pair)] = trading_rule
+            self._order_book_tracker.set_price_increments({
+                trading_pair: trading_rule.min_price_increment
+                for trading_pair, trading_rule in self._trading_rules.items()
+            })
 
     def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
@@ -398,7 +423,9 @@ cdef class BinanceExchange(ExchangeBase):
                 trading_pairs_to_order_map[o.trading_pair][o.exchange_order_id] = o
 
             trading_pairs = list(trading_pairs_to_order_map.keys())
-            tasks = [self.query_api(self._binance_client.get_my_trades, symbol=convert_to_exchange_trading_pair(trading_pair))
+            tasks = [self.query_api(self._binance_client.get_my_trades,
+                                    symbol=convert_to_exchange_trading_pair(trading_pair),
+                                    request_weight=5)
                      for trading_pair in trading_pairs]
             self.logger().debug("Polling for order fills of %d trading pairs.", len(tasks))
             results = await safe_gather(*tasks, return_exceptions=True)
@@ -817,7 +844,7 @@ cdef class BinanceExchange(ExchangeBase):
         amount_str = f"{amount:f}"
         price_str = f"{price:f}"
         type_str = BinanceExchange.binance_order_type(order_type)
-        side_str = BinanceClient.SIDE_BUY if trade_type is TradeType.BUY else BinanceClient.SIDE_SELL
+        side_str = BinanceRESTClient.SIDE_BUY if trade_type is TradeType.BUY else BinanceRESTClient.SIDE_SELL
         api_params = {"symbol": convert_to_exchange_trading_pair(trading_pair),
                       "side": side_str,
                       "quantity": amount_str,
@@ -825,7 +852,7 @@ cdef class BinanceExchange(ExchangeBase):
                       "newClientOrderId": order_id,
                       "price": price_str}
         if order_type == OrderType.LIMIT:
-            api_params["timeInForce"] = BinanceClient.TIME_IN_FORCE_GTC
+            api_params["timeInForce"] = BinanceRESTClient.TIME_IN_FORCE_GTC
         self.c_start_tracking_order(order_id,
                                     "",
                                     trading_pair,
@@ -835,7 +862,9 @@ cdef class BinanceExchange(ExchangeBase):
                                     order_type
                                     )
         try:
-            order_result = await self.query_api(self._binance_client.create_order, **api_params)
+            order_result = await self.query_api(self._binance_client.create_order,
+                                                limit_weights=ORDER_LIMIT_WEIGHTS,
+                                                **api_params)
             exchange_order_id = str(order_result["orderId"])
             tracked_order = self._in_flight_orders.get(order_id)
             if tracked_order is not None:
@@ -889,7 +918,7 @@ cdef class BinanceExchange(ExchangeBase):
             cancel_result = await self.query_api(self._binance_client.cancel_order,
                                                  symbol=convert_to_exchange_trading_pair(trading_pair),
                                                  origClientOrderId=order_id)
-        except BinanceAPIException as e:
+        except BinanceAPIError as e:
             if "Unknown order sent" in e.message or e.code == 2011:
                 # The order was never there to begin with. So cancelling it is a no-op but semantically successful.
                 self.logger().debug(f"The order {order_id} does not exist on Binance. No cancellation needed.")
@@ -924,7 +953,7 @@ cdef class BinanceExchange(ExchangeBase):
             async with timeout(timeout_seconds):
                 cancellation_results = await safe_gather(*tasks, return_exceptions=True)
                 for cr in cancellation_results:
-                    if isinstance(cr, BinanceAPIException):
+                    if isinstance(cr, BinanceAPIError):
                         continue
                     if isinstance(cr, dict) and "origClientOrderId" in cr:
                         client_order_id = cr.get("origClientOrderId")
@@ -1036,7 +1065,8 @@ cdef class BinanceExchange(ExchangeBase):
         return self.c_get_order_book(trading_pair)
 
     async def get_open_orders(self) -> List[OpenOrder]:
-        orders = await self.query_api(self._binance_client.get_open_orders)
+        # Open orders of all symbols weigh 40.
+        orders = await self.query_api(self._binance_client.get_open_orders, request_weight=40)
         ret_val = []
         for order in orders:
             if BROKER_ID not in order["clientOrderId"]:
@@ -1061,7 +1091,8 @@ cdef class BinanceExchange(ExchangeBase):
     async def get_all_my_trades(self, trading_pair: str) -> List[Trade]:
         # Ths Binance API call rate is 5, so we cache to make sure we don't go over rate limit
         trades = await self.query_api(self._binance_client.get_my_trades,
-                                      symbol=convert_to_exchange_trading_pair(trading_pair))
+                                      symbol=convert_to_exchange_trading_pair(trading_pair),
+                                      request_weight=5)
         from hummingbot.connector.exchange.binance.binance_helper import format_trades
         return format_trades(trades)
 
@@ -16,6 +16,7 @@ from hummingbot.core.data_type.order_book_message import (
     OrderBookMessage,
     OrderBookMessageType
 )
+from hummingbot.core.data_type.compact_order_book_message import CompactOrderBookMessage
 from . import binance_utils
 
 _bob_logger = None
@@ -33,80 +34,79 @@ cdef class BinanceOrderBook(OrderBook):
     def snapshot_message_from_exchange(cls,
                                        msg: Dict[str, any],
                                        timestamp: float,
-                                       metadata: Optional[Dict] = None) -> OrderBookMessage:
+                                       metadata: Optional[Dict] = None) -> CompactOrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
-            "trading_pair": msg["trading_pair"],
-            "update_id": msg["lastUpdateId"],
-            "bids": msg["bids"],
-            "asks": msg["asks"]
-        }, timestamp=timestamp)
+        return CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                       msg["trading_pair"],
+                                       update_id=msg["lastUpdateId"],
+                                       raw_bids=msg["bids"],
+                                       raw_asks=msg["asks"],
+                                       timestamp=timestamp)
 
     @classmethod
     def diff_message_from_exchange(cls,
                                    msg: Dict[str, any],
                                    timestamp: Optional[float] = None,
-                                   metadata: Optional[Dict] = None) -> OrderBookMessage:
+                                   metadata: Optional[Dict] = None) -> CompactOrderBookMessage:
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
-            "trading_pair": binance_utils.convert_from_exchange_trading_pair(msg["s"]),
-            "first_update_id": msg["U"],
-            "update_id": msg["u"],
-            "bids": msg["b"],
-            "asks": msg["a"]
-        }, timestamp=timestamp)
+        return CompactOrderBookMessage(OrderBookMessageType.DIFF,
+                                       binance_utils.convert_from_exchange_trading_pair(msg["s"]),
+                                       update_id=msg["u"],
+                                       first_update_id=msg["U"],
+                                       raw_bids=msg["b"],
+                                       raw_asks=msg["a"],
+                                       timestamp=timestamp)
 
     @classmethod
-    def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
+    def snapshot_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> CompactOrderBookMessage:
         msg = record["json"] if type(record["json"])==dict else ujson.loads(record["json"])
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
-            "trading_pair": msg["trading_pair"],
-            "update_id": msg["lastUpdateId"],
-            "bids": msg["bids"],
-            "asks": msg["asks"]
-        }, timestamp=record["timestamp"] * 1e-3)
+        return CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                       msg["trading_pair"],
+                                       update_id=msg["lastUpdateId"],
+                                       raw_bids=msg["bids"],
+                                       raw_asks=msg["asks"],
+                                       timestamp=record["timestamp"] * 1e-3)
 
     @classmethod
-    def diff_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> OrderBookMessage:
+    def diff_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None) -> CompactOrderBookMessage:
         msg = ujson.loads(record["json"])  # Binance json in DB is TEXT
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
-            "trading_pair": binance_utils.convert_from_exchange_trading_pair(msg["s"]),
-            "first_update_id": msg["U"],
-            "update_id": msg["u"],
-            "bids": msg["b"],
-            "asks": msg["a"]
-        }, timestamp=record["timestamp"] * 1e-3)
+        return CompactOrderBookMessage(OrderBookMessageType.DIFF,
+                                       binance_utils.convert_from_exchange_trading_pair(msg["s"]),
+                                       update_id=msg["u"],
+                                       first_update_id=msg["U"],
+                                       raw_bids=msg["b"],
+                                       raw_asks=msg["a"],
+                                       timestamp=record["timestamp"] * 1e-3)
 
     @classmethod
-    def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
+    def snapshot_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> CompactOrderBookMessage:
         msg = ujson.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
-            "trading_pair": msg["trading_pair"],
-            "update_id": msg["lastUpdateId"],
-            "bids": msg["bids"],
-            "asks": msg["asks"]
-        }, timestamp=record.timestamp * 1e-3)
+        return CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                       msg["trading_pair"],
+                                       update_id=msg["lastUpdateId"],
+                                       raw_bids=msg["bids"],
+                                       raw_asks=msg["asks"],
+                                       timestamp=record.timestamp * 1e-3)
 
     @classmethod
-    def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> OrderBookMessage:
+    def diff_message_from_kafka(cls, record: ConsumerRecord, metadata: Optional[Dict] = None) -> CompactOrderBookMessage:
         msg = ujson.loads(record.value.decode("utf-8"))
         if metadata:
             msg.update(metadata)
-        return OrderBookMessage(OrderBookMessageType.DIFF, {
-            "trading_pair": binance_utils.convert_from_exchange_trading_pair(msg["s"]),
-            "update_id": msg["u"],
-            "bids": msg["b"],
-            "asks": msg["a"],
-
-        }, timestamp=record.timestamp * 1e-3)
+        return CompactOrderBookMessage(OrderBookMessageType.DIFF,
+                                       binance_utils.convert_from_exchange_trading_pair(msg["s"]),
+                                       update_id=msg["u"],
+                                       raw_bids=msg["b"],
+                                       raw_asks=msg["a"],
+                                       timestamp=record.timestamp * 1e-3)
 
     @classmethod
     def trade_message_from_db(cls, record: RowProxy, metadata: Optional[Dict] = None):
@@ -1,12 +1,8 @@
 #!/usr/bin/env python
 
 import asyncio
-from collections import deque, defaultdict
 import logging
-import time
 from typing import (
-    Deque,
-    Dict,
     List,
     Optional
 )
@@ -14,11 +10,18 @@ from typing import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
-from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book import OrderBook, OrderBookDiffRing
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_tracker_metrics import ReceiveTimeQueue
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
 class BinanceOrderBookTracker(OrderBookTracker):
+    # A 1000 level depth snapshot costs 10 of Binance's 1200 weight per minute.
+    SNAPSHOT_REQUEST_WEIGHT: int = 10
+    # Every depth update's U is the previous update's u plus one.
+    SEQUENCE_GAP_DETECTION: bool = True
     _bobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -29,17 +32,20 @@ class BinanceOrderBookTracker(OrderBookTracker):
 
     def __init__(self,
                  trading_pairs: Optional[List[str]] = None,
-                 domain: str = "com"):
+                 domain: str = "com",
+                 throttler: Optional[Throttler] = None):
+        # add_trading_pair() appends to the list, which the data source shares.
+        trading_pairs = trading_pairs or []
         super().__init__(
             data_source=BinanceAPIOrderBookDataSource(trading_pairs=trading_pairs, domain=domain),
             trading_pairs=trading_pairs,
-            domain=domain
+            domain=domain,
+            throttler=throttler
         )
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
+        self._order_book_diff_stream: asyncio.Queue = ReceiveTimeQueue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._domain = domain
-        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
 
     @property
     def exchange_name(self) -> str:
@@ -48,101 +54,23 @@ class BinanceOrderBookTracker(OrderBookTracker):
         else:
             return f"binance_{self._domain}"
 
-    async def _order_book_diff_router(self):
+    def add_trading_pair(self, trading_pair: str):
         """
-        Route the real-time order book diff messages to the correct order book.
+        Starts tracking a pair at runtime. Its streams are subscribed on a connection with room for them, without
+        reconnecting the other pairs, and its diffs are saved until its order book is initialized.
         """
-        last_message_timestamp: float = time.time()
-        messages_queued: int = 0
-        messages_accepted: int = 0
-        messages_rejected: int = 0
-
-        while True:
-            try:
-                ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
-                trading_pair: str = ob_message.trading_pair
-
-                if trading_pair not in self._tracking_message_queues:
-                    messages_queued += 1
-                    # Save diff messages received before snapshots are ready
-                    self._saved_message_queues[trading_pair].append(ob_message)
-                    continue
-                message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-                # Check the order book's initial update ID. If it's larger, don't bother.
-                order_book: OrderBook = self._order_books[trading_pair]
-
-                if order_book.snapshot_uid > ob_message.update_id:
-                    messages_rejected += 1
-                    continue
-                await message_queue.put(ob_message)
-                messages_accepted += 1
-
-                # Log some statistics.
-                now: float = time.time()
-                if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug("Diff messages processed: %d, rejected: %d, queued: %d",
-                                        messages_accepted,
-                                        messages_rejected,
-                                        messages_queued)
-                    messages_accepted = 0
-                    messages_rejected = 0
-                    messages_queued = 0
-
-                last_message_timestamp = now
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    "Unexpected error routing order book messages.",
-                    exc_info=True,
-                    app_warning_msg="Unexpected error routing order book messages. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
-
-    async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[OrderBookMessage] = deque()
-        self._past_diffs_windows[trading_pair] = past_diffs_window
-
-        message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: OrderBook = self._order_books[trading_pair]
-        last_message_timestamp: float = time.time()
-        diff_messages_accepted: int = 0
-
-        while True:
-            try:
-                message: OrderBookMessage = None
-                saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
-
-                # Process saved messages first if there are any
-                if len(saved_messages) > 0:
-                    message = saved_messages.popleft()
-                else:
-                    message = await message_queue.get()
-
-                if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
-
-                    # Output some statistics periodically.
-                    now: float = time.time()
-                    if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
-                        diff_messages_accepted = 0
-                    last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug("Processed order book snapshot for %s.", trading_pair)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Unexpected error tracking order book for {trading_pair}.",
-                    exc_info=True,
-                    app_warning_msg="Unexpected error tracking order book. Retrying after 5 seconds."
-                )
-                await asyncio.sleep(5.0)
+        if trading_pair in self._order_books or trading_pair in self._tracking_tasks:
+            return
+        if trading_pair not in self._trading_pairs:
+            self._trading_pairs.append(trading_pair)
+        self._data_source.add_trading_pair(trading_pair)
+        # Cancelled by stop() like the tracking tasks, and replaced by the pair's tracking task once initialized.
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._init_order_book(trading_pair))
+
+    def _apply_diff_batch(self, order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        bids, asks = self._merge_raw_diff_messages(diff_messages)
+        order_book.apply_raw_diffs(bids, asks, diff_messages[-1].update_id)
+
+    def _append_past_diffs(self, past_diffs_window: OrderBookDiffRing, diff_messages: List[OrderBookMessage]):
+        for message in diff_messages:
+            past_diffs_window.append_levels(message.raw_bids, message.raw_asks, message.update_id)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+import hashlib
+import hmac
+from typing import (
+    Any,
+    Dict,
+    Optional
+)
+from urllib.parse import urlencode
+
+import aiohttp
+
+from hummingbot.connector.exchange.binance.binance_time import BinanceTime
+from hummingbot.core.utils.http_session_manager import get_shared_client
+
+API_URL = "https://api.binance.{}/api"
+WITHDRAW_API_URL = "https://api.binance.{}/wapi"
+
+
+class BinanceAPIError(IOError):
+    """
+    Error response of the Binance REST API, with the same code and message attributes as python-binance's
+    BinanceAPIException.
+    """
+
+    def __init__(self, status_code: int, code: int, message: str):
+        super().__init__(f"APIError(code={code}): {message}")
+        self.status_code: int = status_code
+        self.code: int = code
+        self.message: str = message
+
+
+class BinanceRESTClient:
+    """
+    Asynchronous client of the Binance REST endpoints BinanceExchange uses, replacing python-binance's blocking
+    Client. Requests go through the shared aiohttp session, see HttpSessionManager, and are signed on the event loop
+    with timestamps from BinanceTime.
+
+    Methods take the same keyword parameters as the Binance API, and return the decoded JSON response.
+    """
+    SIDE_BUY = "BUY"
+    SIDE_SELL = "SELL"
+    TIME_IN_FORCE_GTC = "GTC"
+
+    def __init__(self, api_key: str, api_secret: str, domain: str = "com"):
+        self._api_key: str = api_key
+        self._api_secret: bytes = api_secret.encode("utf-8")
+        self._api_url: str = API_URL.format(domain)
+        self._withdraw_api_url: str = WITHDRAW_API_URL.format(domain)
+
+    @property
+    def API_KEY(self) -> str:
+        return self._api_key
+
+    def _signed_query(self, params: Dict[str, Any]) -> str:
+        params["timestamp"] = int(BinanceTime.get_instance().time() * 1e3)
+        query: str = urlencode(params)
+        signature: str = hmac.new(self._api_secret, query.encode("utf-8"), hashlib.sha256).hexdigest()
+        return f"{query}&signature={signature}"
+
+    async def _request(self,
+                       method: str,
+                       url: str,
+                       signed: bool = False,
+                       params: Optional[Dict[str, Any]] = None) -> Any:
+        params = dict(params or {})
+        query: str = self._signed_query(params) if signed else urlencode(params)
+        if len(query) > 0:
+            url = f"{url}?{query}"
+        client: aiohttp.ClientSession = get_shared_client()
+        async with client.request(method, url, headers={"X-MBX-APIKEY": self._api_key}) as response:
+            try:
+                data: Any = await response.json(content_type=None)
+            except ValueError:
+                raise BinanceAPIError(response.status, 0, f"Invalid JSON response: {await response.text()}")
+            if response.status >= 400:
+                if not isinstance(data, dict):
+                    # E.g. a null or plain string body from a proxy or an outage page.
+                    raise BinanceAPIError(response.status, 0, str(data))
+                raise BinanceAPIError(response.status, data.get("code", 0), data.get("msg", ""))
+            if isinstance(data, dict) and data.get("success") is False:
+                # Withdraw API errors come with status 200.
+                raise BinanceAPIError(response.status, data.get("code", 0), data.get("msg", ""))
+            return data
+
+    async def ping(self) -> Dict[str, Any]:
+        return await self._request("GET", f"{self._api_url}/v1/ping")
+
+    async def get_server_time(self) -> Dict[str, Any]:
+        return await self._request("GET", f"{self._api_url}/v1/time")
+
+    async def get_exchange_info(self) -> Dict[str, Any]:
+        return await self._request("GET", f"{self._api_url}/v1/exchangeInfo")
+
+    async def get_account(self, **params) -> Dict[str, Any]:
+        return await self._request("GET", f"{self._api_url}/v3/account", signed=True, params=params)
+
+    async def get_trade_fee(self, **params) -> Dict[str, Any]:
+        return await self._request("GET", f"{self._withdraw_api_url}/v3/tradeFee.html", signed=True, params=params)
+
+    async def get_my_trades(self, **params) -> Any:
+        return await self._request("GET", f"{self._api_url}/v3/myTrades", signed=True, params=params)
+
+    async def get_order(self, **params) -> Dict[str, Any]:
+        return await self._request("GET", f"{self._api_url}/v3/order", signed=True, params=params)
+
+    async def get_open_orders(self, **params) -> Any:
+        return await self._request("GET", f"{self._api_url}/v3/openOrders", signed=True, params=params)
+
+    async def create_order(self, **params) -> Dict[str, Any]:
+        return await self._request("POST", f"{self._api_url}/v3/order", signed=True, params=params)
+
+    async def cancel_order(self, **params) -> Dict[str, Any]:
+        return await self._request("DELETE", f"{self._api_url}/v3/order", signed=True, params=params)
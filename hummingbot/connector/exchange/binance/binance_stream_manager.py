@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+import asyncio
+import itertools
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional
+)
+
+import ujson
+import websockets
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.ws_connection_manager import (
+    WSConnection,
+    WSConnectionManager
+)
+from hummingbot.logger import HummingbotLogger
+from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
+
+COMBINED_STREAM_URL = "wss://stream.binance.{}:9443/stream"
+
+TRADE_STREAM = "trade"
+DEPTH_STREAM = "depth"
+
+MessageParser = Callable[[Dict[str, Any]], OrderBookMessage]
+
+
+class BinanceStreamManager(WSConnectionManager):
+    """
+    Market data streams of a data source's pairs over Binance's combined stream endpoint. The trade and depth streams
+    of every pair go through as few connections as the per connection stream limit allows, with the streams of one
+    pair on the same connection. Connections subscribe with SUBSCRIBE frames instead of listing streams in the URL,
+    so add_trading_pair() and remove_trading_pair() change one connection's subscriptions without reconnecting.
+
+    listen() demultiplexes the combined frames by stream type into the output queues of the data source's
+    listen_for_trades() and listen_for_order_book_diffs().
+    """
+    MAX_TOPICS_PER_CONNECTION = 1024
+    MAX_TOPICS_PER_FRAME = 200
+    # Binance allows 5 incoming messages per second on a connection.
+    FRAME_INTERVAL = 0.25
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+
+    _bsm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._bsm_logger is None:
+            cls._bsm_logger = logging.getLogger(__name__)
+        return cls._bsm_logger
+
+    def __init__(self,
+                 trading_pairs: Optional[List[str]],
+                 domain: str = "com",
+                 stream_types: Optional[List[str]] = None,
+                 hot_standby: bool = True):
+        """
+        :param stream_types: streams of every pair, trade and depth streams if None
+        :param hot_standby: see WSConnectionManager
+        """
+        super().__init__(hot_standby=hot_standby)
+        self._domain: str = domain
+        self._stream_types: List[str] = list(stream_types or [TRADE_STREAM, DEPTH_STREAM])
+        self._pair_connections: Dict[str, WSConnection] = {}
+        self._outputs: Dict[str, asyncio.Queue] = {}
+        self._parsers: Dict[str, MessageParser] = {}
+        self._request_ids: Iterator[int] = itertools.count(1)
+        for trading_pair in trading_pairs or []:
+            self.add_trading_pair(trading_pair)
+
+    def _pair_streams(self, trading_pair: str) -> List[str]:
+        symbol: str = convert_to_exchange_trading_pair(trading_pair).lower()
+        return [f"{symbol}@{stream_type}" for stream_type in self._stream_types]
+
+    def add_trading_pair(self, trading_pair: str):
+        """
+        Subscribes the pair's streams on a connection with room for them, or on a new connection.
+        """
+        if trading_pair in self._pair_connections:
+            return
+        self._pair_connections[trading_pair] = self.add_topics(self._pair_streams(trading_pair))
+
+    def remove_trading_pair(self, trading_pair: str):
+        if self._pair_connections.pop(trading_pair, None) is not None:
+            self.remove_topics(self._pair_streams(trading_pair))
+
+    async def listen(self, stream_type: str, output: asyncio.Queue, parse_message: MessageParser):
+        """
+        Puts the messages of a stream type into output, until cancelled. The connections run while any stream type
+        is listened to.
+
+        :param stream_type: e.g. TRADE_STREAM
+        :param parse_message: converts the data of a combined stream frame into an order book message
+        """
+        self._outputs[stream_type] = output
+        self._parsers[stream_type] = parse_message
+        self.start()
+        try:
+            # Until cancelled.
+            await asyncio.Event().wait()
+        finally:
+            del self._outputs[stream_type]
+            del self._parsers[stream_type]
+            if len(self._outputs) == 0:
+                self.stop()
+
+    async def _connect(self) -> websockets.WebSocketClientProtocol:
+        return await websockets.connect(COMBINED_STREAM_URL.format(self._domain))
+
+    async def _send_subscription(self, ws: websockets.WebSocketClientProtocol, topics: List[str], subscribe: bool):
+        await ws.send(ujson.dumps({"method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+                                   "params": topics,
+                                   "id": next(self._request_ids)}))
+
+    def _process_message(self, connection: WSConnection, raw_msg: str):
+        msg: Dict[str, Any] = ujson.loads(raw_msg)
+        stream: Optional[str] = msg.get("stream")
+        if stream is None:
+            # Results of subscription frames.
+            if msg.get("error") is not None:
+                self.logger().warning(f"Binance stream subscription failed: {msg}")
+            return
+        stream_type: str = stream.split("@", 1)[1]
+        output: Optional[asyncio.Queue] = self._outputs.get(stream_type)
+        if output is not None:
+            output.put_nowait(self._parsers[stream_type](msg["data"]))
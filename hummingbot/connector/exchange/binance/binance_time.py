@@ -8,6 +8,7 @@ from typing import Dict, Deque, Optional
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.http_session_manager import get_shared_client
 
 
 class BinanceTime:
@@ -99,11 +100,11 @@ class BinanceTime:
     async def update_server_time_offset(self):
         try:
             local_before_ms: float = time.perf_counter() * 1e3
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.BINANCE_TIME_API) as resp:
-                    resp_data: Dict[str, float] = await resp.json()
-                    binance_server_time_ms: float = float(resp_data["serverTime"])
-                    local_after_ms: float = time.perf_counter() * 1e3
+            session: aiohttp.ClientSession = get_shared_client()
+            async with session.get(self.BINANCE_TIME_API) as resp:
+                resp_data: Dict[str, float] = await resp.json()
+                binance_server_time_ms: float = float(resp_data["serverTime"])
+                local_after_ms: float = time.perf_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = binance_server_time_ms - local_server_time_pre_image_ms
             self.add_time_offset_ms_sample(time_offset_ms)
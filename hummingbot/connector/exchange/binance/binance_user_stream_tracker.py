@@ -13,7 +13,8 @@ from hummingbot.core.utils.async_utils import (
     safe_gather,
 )
 from .binance_api_user_stream_data_source import BinanceAPIUserStreamDataSource
-from binance.client import Client as BinanceClient
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRESTClient
+from hummingbot.core.utils.asyncio_throttle import Throttler
 
 
 class BinanceUserStreamTracker(UserStreamTracker):
@@ -25,9 +26,13 @@ class BinanceUserStreamTracker(UserStreamTracker):
             cls._bust_logger = logging.getLogger(__name__)
         return cls._bust_logger
 
-    def __init__(self, binance_client: Optional[BinanceClient] = None, domain: str = "com"):
+    def __init__(self,
+                 binance_client: Optional[BinanceRESTClient] = None,
+                 domain: str = "com",
+                 throttler: Optional[Throttler] = None):
         super().__init__()
-        self._binance_client: BinanceClient = binance_client
+        self._binance_client: BinanceRESTClient = binance_client
+        self._throttler: Optional[Throttler] = throttler
         self._ev_loop: asyncio.events.AbstractEventLoop = asyncio.get_event_loop()
         self._data_source: Optional[UserStreamTrackerDataSource] = None
         self._user_stream_tracking_task: Optional[asyncio.Task] = None
@@ -36,7 +41,9 @@ class BinanceUserStreamTracker(UserStreamTracker):
     @property
     def data_source(self) -> UserStreamTrackerDataSource:
         if not self._data_source:
-            self._data_source = BinanceAPIUserStreamDataSource(binance_client=self._binance_client, domain=self._domain)
+            self._data_source = BinanceAPIUserStreamDataSource(binance_client=self._binance_client,
+                                                               domain=self._domain,
+                                                               throttler=self._throttler)
         return self._data_source
 
     @property
@@ -5,6 +5,10 @@ from typing import (
 
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.client.config.config_methods import using_exchange
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    REQUEST_WEIGHT
+)
 
 
 CENTRALIZED = True
@@ -16,6 +20,17 @@ RE_3_LETTERS_QUOTE = re.compile(r"^(\w+)(BTC|ETH|BNB|DAI|XRP|PAX|TRX|NGN|RUB|TRY
 
 USD_QUOTES = ["DAI", "USDT", "USDC", "USDS", "TUSD", "PAX", "BUSD", "USD"]
 
+ORDERS = "ORDERS"
+ORDERS_24HR = "ORDERS_24HR"
+# Limits of the account and IP, as in the rateLimits of exchangeInfo.
+RATE_LIMITS = [
+    RateLimit(REQUEST_WEIGHT, 1200, 60.0),
+    RateLimit(ORDERS, 10, 1.0),
+    RateLimit(ORDERS_24HR, 100000, 86400.0),
+]
+# Throttler weights of placing an order, on top of its request weight.
+ORDER_LIMIT_WEIGHTS = {ORDERS: 1, ORDERS_24HR: 1}
+
 
 def split_trading_pair(trading_pair: str) -> Optional[Tuple[str, str]]:
     try:
@@ -19,6 +19,7 @@ from typing import (
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from hummingbot.core.data_type.last_traded_price_cache import LastTradedPriceCache
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -31,6 +32,7 @@ from hummingbot.core.data_type.order_book_message import (
 )
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.http_session_manager import get_shared_client
 from hummingbot.logger import HummingbotLogger
 from hummingbot.connector.exchange.bitfinex import (
     BITFINEX_REST_URL,
@@ -366,9 +368,21 @@ class BitfinexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
-        tasks = [cls.get_last_traded_price(t_pair) for t_pair in trading_pairs]
-        results = await safe_gather(*tasks)
-        return {t_pair: result for t_pair, result in zip(trading_pairs, results)}
+        async def fetch_all_prices() -> Dict[str, float]:
+            client: aiohttp.ClientSession = get_shared_client()
+            async with client.get(f"{BITFINEX_REST_URL}/tickers?symbols=ALL") as response:
+                if response.status != 200:
+                    raise IOError(f"Error fetching Bitfinex last traded prices. HTTP status is {response.status}.")
+                records: List[List[Any]] = await response.json()
+            prices: Dict[str, float] = {}
+            for record in records:
+                # Funding tickers start with "f" and have other fields.
+                if record[0].startswith("t") and valid_exchange_trading_pair(record[0]):
+                    ticker = Ticker(*record[1:11])
+                    prices[convert_from_exchange_trading_pair(record[0])] = float(ticker.last_price)
+            return prices
+
+        return await LastTradedPriceCache.get_instance("bitfinex").get_prices(fetch_all_prices, trading_pairs)
 
     @classmethod
     async def get_last_traded_price(cls, trading_pair: str) -> float:
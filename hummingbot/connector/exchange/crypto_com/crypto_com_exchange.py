@@ -101,6 +101,11 @@ class CryptoComExchange(ExchangeBase):
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_book_tracker.order_books
 
+    @property
+    def order_book_tracker(self):
+        # The tracker is set on the instance, not in ExchangeBase's slot.
+        return self._order_book_tracker
+
     @property
     def trading_rules(self) -> Dict[str, TradingRule]:
         return self._trading_rules
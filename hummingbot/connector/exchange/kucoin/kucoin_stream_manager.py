@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import defaultdict
+from enum import Enum
+import json
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    List,
+    Optional,
+    Set
+)
+
+import aiohttp
+import websockets
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.http_session_manager import get_shared_client
+from hummingbot.core.utils.ws_connection_manager import (
+    WSConnection,
+    WSConnectionManager
+)
+from hummingbot.logger import HummingbotLogger
+
+PUBLIC_BULLET_URL = "https://api.kucoin.com/api/v1/bullet-public"
+
+MessageParser = Callable[[Dict[str, Any]], OrderBookMessage]
+
+
+class StreamType(Enum):
+    Depth = "depth"
+    Trade = "trade"
+
+
+STREAM_TOPICS: Dict[StreamType, str] = {
+    StreamType.Depth: "/market/level2",
+    StreamType.Trade: "/market/match",
+}
+TOPIC_STREAMS: Dict[str, StreamType] = {topic: stream_type for stream_type, topic in STREAM_TOPICS.items()}
+
+
+class KucoinStreamManager(WSConnectionManager):
+    """
+    Level 2 and match topics of a data source's pairs over Kucoin's public websocket. The topics of every pair are
+    sharded over connections within Kucoin's per connection topic limit, and added or removed without reconnecting.
+    Connections send Kucoin's application level pings, and are opened with a token from the bullet-public endpoint.
+
+    listen() puts the messages of a stream type into the output queues of the data source's listen_for_trades() and
+    listen_for_order_book_diffs().
+    """
+    # Kucoin allows 300 topics per connection, 100 topics per subscription and 100 messages per 10 seconds, pings
+    # included. Every subscription message is followed by FRAME_INTERVAL, so a connection sends at most 84 of them
+    # and 3 pings in any 10 seconds.
+    MAX_TOPICS_PER_CONNECTION = 300
+    MAX_TOPICS_PER_FRAME = 100
+    FRAME_INTERVAL = 0.12
+    HEARTBEAT_INTERVAL = 5.0
+    PING_TIMEOUT = 10.0
+    MESSAGE_TIMEOUT = PING_TIMEOUT + HEARTBEAT_INTERVAL
+
+    _ksm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ksm_logger is None:
+            cls._ksm_logger = logging.getLogger(__name__)
+        return cls._ksm_logger
+
+    def __init__(self, trading_pairs: Optional[List[str]] = None, hot_standby: bool = True):
+        """
+        :param hot_standby: see WSConnectionManager
+        """
+        super().__init__(hot_standby=hot_standby)
+        self._trading_pairs: Set[str] = set()
+        self._outputs: Dict[StreamType, asyncio.Queue] = {}
+        self._parsers: Dict[StreamType, MessageParser] = {}
+        self._last_nonce: int = int(time.time() * 1e3)
+        for trading_pair in trading_pairs or []:
+            self.add_trading_pair(trading_pair)
+
+    @property
+    def trading_pairs(self) -> Set[str]:
+        return self._trading_pairs.copy()
+
+    @staticmethod
+    def _pair_topics(trading_pair: str) -> List[str]:
+        return [f"{topic}:{trading_pair}" for topic in STREAM_TOPICS.values()]
+
+    def add_trading_pair(self, trading_pair: str):
+        if trading_pair in self._trading_pairs:
+            return
+        self._trading_pairs.add(trading_pair)
+        self.add_topics(self._pair_topics(trading_pair))
+
+    def remove_trading_pair(self, trading_pair: str):
+        if trading_pair in self._trading_pairs:
+            self._trading_pairs.remove(trading_pair)
+            self.remove_topics(self._pair_topics(trading_pair))
+
+    async def listen(self, stream_type: StreamType, output: asyncio.Queue, parse_message: MessageParser):
+        """
+        Puts the messages of a stream type into output, until cancelled. The connections run while any stream type
+        is listened to.
+
+        :param parse_message: converts a Kucoin message into an order book message
+        """
+        self._outputs[stream_type] = output
+        self._parsers[stream_type] = parse_message
+        self.start()
+        try:
+            # Until cancelled.
+            await asyncio.Event().wait()
+        finally:
+            del self._outputs[stream_type]
+            del self._parsers[stream_type]
+            if len(self._outputs) == 0:
+                self.stop()
+
+    def get_nonce(self) -> int:
+        now_ms: int = int(time.time() * 1e3)
+        if now_ms <= self._last_nonce:
+            now_ms = self._last_nonce + 1
+        self._last_nonce = now_ms
+        return now_ms
+
+    async def _connect(self) -> websockets.WebSocketClientProtocol:
+        client: aiohttp.ClientSession = get_shared_client()
+        async with client.post(PUBLIC_BULLET_URL, data=b'') as response:
+            response: aiohttp.ClientResponse = response
+            if response.status != 200:
+                raise IOError(f"Error fetching Kucoin websocket connection data. "
+                              f"HTTP status is {response.status}.")
+            data: Dict[str, Any] = await response.json()
+
+        endpoint: str = data["data"]["instanceServers"][0]["endpoint"]
+        token: str = data["data"]["token"]
+        return await websockets.connect(f"{endpoint}?token={token}&acceptUserMessage=true")
+
+    async def _send_subscription(self, ws: websockets.WebSocketClientProtocol, topics: List[str], subscribe: bool):
+        # One request per topic, e.g. "/market/level2:BTC-USDT,ETH-USDT" for the level 2 topics of two pairs.
+        # Kucoin counts messages rather than frames, so the requests are FRAME_INTERVAL apart too, and the last one
+        # is followed by the interval after the frame.
+        trading_pairs: DefaultDict[str, List[str]] = defaultdict(list)
+        for topic in topics:
+            prefix, trading_pair = topic.split(":", 1)
+            trading_pairs[prefix].append(trading_pair)
+        for index, (prefix, prefix_trading_pairs) in enumerate(trading_pairs.items()):
+            if index > 0:
+                await asyncio.sleep(self.FRAME_INTERVAL)
+            await ws.send(json.dumps({
+                "id": self.get_nonce(),
+                "type": "subscribe" if subscribe else "unsubscribe",
+                "topic": f"{prefix}:{','.join(prefix_trading_pairs)}",
+                "privateChannel": False,
+                "response": True
+            }))
+
+    async def _send_heartbeat(self, ws: websockets.WebSocketClientProtocol):
+        await ws.send(json.dumps({"id": self.get_nonce(), "type": "ping"}))
+
+    def _process_message(self, connection: WSConnection, raw_msg: str):
+        msg: Dict[str, Any] = json.loads(raw_msg)
+        msg_type: str = msg.get("type", "")
+        if msg_type in {"ack", "welcome", "pong"}:
+            pass
+        elif msg_type == "message":
+            stream_type: Optional[StreamType] = TOPIC_STREAMS.get(msg["topic"].split(":", 1)[0])
+            output: Optional[asyncio.Queue] = self._outputs.get(stream_type)
+            if output is not None:
+                output.put_nowait(self._parsers[stream_type](msg))
+        elif msg_type == "error":
+            self.logger().error(f"WS error message from Kucoin: {msg}")
+        else:
+            self.logger().warning(f"Unrecognized message type from Kucoin: {msg_type}. Message = {msg}.")
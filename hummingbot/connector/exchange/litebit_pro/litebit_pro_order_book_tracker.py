@@ -67,11 +67,11 @@ class LitebitProOrderBookTracker(OrderBookTracker):
                 # just one side of the book (either bids or asks), we have to manually check for existing entries here
                 # and include them with 0 amount.
                 if "asks" in ob_message.content and len(ob_message.content["asks"]) > 0:
-                    for price in order_book.snapshot[1].price:
+                    for price in order_book.to_numpy()[1][:, 0]:
                         if price not in [float(p[0]) for p in ob_message.content["asks"]]:
                             ob_message.content["asks"].append([str(price), str(0)])
                 elif "bids" in ob_message.content and len(ob_message.content["bids"]) > 0:
-                    for price in order_book.snapshot[0].price:
+                    for price in order_book.to_numpy()[0][:, 0]:
                         if price not in [float(p[0]) for p in ob_message.content["bids"]]:
                             ob_message.content["bids"].append([str(price), str(0)])
                 await message_queue.put(ob_message)
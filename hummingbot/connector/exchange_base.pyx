@@ -52,6 +52,10 @@ cdef class ExchangeBase(ConnectorBase):
     def order_books(self) -> Dict[str, OrderBook]:
         raise NotImplementedError
 
+    @property
+    def order_book_tracker(self):
+        return self._order_book_tracker
+
     @property
     def limit_orders(self) -> List[LimitOrder]:
         raise NotImplementedError
@@ -216,6 +220,17 @@ cdef class ExchangeBase(ConnectorBase):
     def get_order_book(self, trading_pair: str) -> OrderBook:
         raise NotImplementedError
 
+    def is_order_book_healthy(self, trading_pair: str) -> bool:
+        """
+        Whether the pair's order book is ready and in sync with the exchange, see
+        OrderBookTracker.is_order_book_healthy(). True for exchanges without an order book tracker.
+        """
+        # Through the property, which Python subclasses keeping their own tracker override.
+        order_book_tracker = self.order_book_tracker
+        if order_book_tracker is None:
+            return True
+        return order_book_tracker.is_order_book_healthy(trading_pair)
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -264,7 +279,7 @@ cdef class ExchangeBase(ConnectorBase):
 
     def get_price_by_type(self, trading_pair: str, price_type: PriceType) -> Decimal:
         """
-        Gets price by type (BestBid, BestAsk, MidPrice or LastTrade)
+        Gets price by type (BestBid, BestAsk, MidPrice, LastTrade, MicroPrice or WeightedMidPrice)
         :param trading_pair: The market trading pair
         :param price_type: The price type
         :returns The price
@@ -277,6 +292,10 @@ cdef class ExchangeBase(ConnectorBase):
             return (self.c_get_price(trading_pair, True) + self.c_get_price(trading_pair, False)) / Decimal("2")
         elif price_type is PriceType.LastTrade:
             return Decimal(self.c_get_order_book(trading_pair).last_trade_price)
+        elif price_type is PriceType.MicroPrice:
+            return Decimal(str(self.c_get_order_book(trading_pair).get_micro_price()))
+        elif price_type is PriceType.WeightedMidPrice:
+            return Decimal(str(self.c_get_order_book(trading_pair).get_weighted_mid_price()))
 
     async def get_quote_price(self, trading_pair: str, is_buy: bool, amount: Decimal) -> Decimal:
         """
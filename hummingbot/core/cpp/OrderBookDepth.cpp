@@ -0,0 +1,323 @@
+#include "OrderBookDepth.h"
+#include <algorithm>
+#include <cmath>
+#include <functional>
+
+template <typename Iterator>
+static DepthQueryResult priceForVolume(Iterator it, const Iterator end, const double volume, const bool isQuote) {
+    DepthQueryResult result = {std::nan(""), 0};
+    for (; it != end; ++it) {
+        const OrderBookEntry &entry = *it;
+        result.volume += isQuote ? entry.getAmount() * entry.getPrice() : entry.getAmount();
+        if (result.volume >= volume) {
+            result.price = entry.getPrice();
+            break;
+        }
+    }
+    return result;
+}
+
+template <typename Iterator>
+static DepthQueryResult vwapForVolume(Iterator it, const Iterator end, const double volume) {
+    DepthQueryResult result = {std::nan(""), 0};
+    double totalCost = 0;
+    for (; it != end; ++it) {
+        const OrderBookEntry &entry = *it;
+        totalCost += entry.getAmount() * entry.getPrice();
+        result.volume += entry.getAmount();
+        if (result.volume >= volume) {
+            totalCost -= entry.getAmount() * entry.getPrice();
+            result.volume -= entry.getAmount();
+            double incrementalAmount = volume - result.volume;
+            totalCost += incrementalAmount * entry.getPrice();
+            result.volume += incrementalAmount;
+            result.price = totalCost / result.volume;
+            break;
+        }
+    }
+    return result;
+}
+
+template <typename Iterator>
+static DepthQueryResult quoteVolumeForBaseAmount(Iterator it, const Iterator end, const double baseAmount) {
+    DepthQueryResult result = {std::nan(""), 0};
+    double cumulativeBaseAmount = 0;
+    for (; it != end; ++it) {
+        const OrderBookEntry &entry = *it;
+        double rowAmount = entry.getAmount();
+        if (rowAmount + cumulativeBaseAmount >= baseAmount) {
+            rowAmount = baseAmount - cumulativeBaseAmount;
+        }
+        cumulativeBaseAmount += rowAmount;
+        result.volume += rowAmount * entry.getPrice();
+        if (cumulativeBaseAmount >= baseAmount) {
+            break;
+        }
+    }
+    return result;
+}
+
+template <typename Iterator>
+static DepthQueryResult volumeForPrice(Iterator it, const Iterator end, const bool isBuy, const double price,
+                                       const bool isQuote) {
+    DepthQueryResult result = {std::nan(""), 0};
+    for (; it != end; ++it) {
+        const OrderBookEntry &entry = *it;
+        if (isBuy ? entry.getPrice() > price : entry.getPrice() < price) {
+            break;
+        }
+        result.volume += isQuote ? entry.getAmount() * entry.getPrice() : entry.getAmount();
+        result.price = entry.getPrice();
+    }
+    return result;
+}
+
+DepthQueryResult getPriceForVolume(const std::set<OrderBookEntry> &book, const bool isBuy, const double volume) {
+    if (isBuy) {
+        return priceForVolume(book.begin(), book.end(), volume, false);
+    }
+    return priceForVolume(book.rbegin(), book.rend(), volume, false);
+}
+
+DepthQueryResult getVWAPForVolume(const std::set<OrderBookEntry> &book, const bool isBuy, const double volume) {
+    if (isBuy) {
+        return vwapForVolume(book.begin(), book.end(), volume);
+    }
+    return vwapForVolume(book.rbegin(), book.rend(), volume);
+}
+
+DepthQueryResult getPriceForQuoteVolume(const std::set<OrderBookEntry> &book, const bool isBuy, const double quoteVolume) {
+    if (isBuy) {
+        return priceForVolume(book.begin(), book.end(), quoteVolume, true);
+    }
+    return priceForVolume(book.rbegin(), book.rend(), quoteVolume, true);
+}
+
+DepthQueryResult getQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, const bool isBuy, const double baseAmount) {
+    if (isBuy) {
+        return quoteVolumeForBaseAmount(book.begin(), book.end(), baseAmount);
+    }
+    return quoteVolumeForBaseAmount(book.rbegin(), book.rend(), baseAmount);
+}
+
+DepthQueryResult getVolumeForPrice(const std::set<OrderBookEntry> &book, const bool isBuy, const double price) {
+    if (isBuy) {
+        return volumeForPrice(book.begin(), book.end(), isBuy, price, false);
+    }
+    return volumeForPrice(book.rbegin(), book.rend(), isBuy, price, false);
+}
+
+DepthQueryResult getQuoteVolumeForPrice(const std::set<OrderBookEntry> &book, const bool isBuy, const double price) {
+    if (isBuy) {
+        return volumeForPrice(book.begin(), book.end(), isBuy, price, true);
+    }
+    return volumeForPrice(book.rbegin(), book.rend(), isBuy, price, true);
+}
+
+DepthQueryResult getPriceForVolume(const OrderBookFlatSide &side, const bool isBuy, const double volume) {
+    return priceForVolume(side.walkBegin(), side.walkEnd(), volume, false);
+}
+
+DepthQueryResult getVWAPForVolume(const OrderBookFlatSide &side, const bool isBuy, const double volume) {
+    return vwapForVolume(side.walkBegin(), side.walkEnd(), volume);
+}
+
+DepthQueryResult getPriceForQuoteVolume(const OrderBookFlatSide &side, const bool isBuy, const double quoteVolume) {
+    return priceForVolume(side.walkBegin(), side.walkEnd(), quoteVolume, true);
+}
+
+DepthQueryResult getQuoteVolumeForBaseAmount(const OrderBookFlatSide &side, const bool isBuy, const double baseAmount) {
+    return quoteVolumeForBaseAmount(side.walkBegin(), side.walkEnd(), baseAmount);
+}
+
+DepthQueryResult getVolumeForPrice(const OrderBookFlatSide &side, const bool isBuy, const double price) {
+    return volumeForPrice(side.walkBegin(), side.walkEnd(), isBuy, price, false);
+}
+
+DepthQueryResult getQuoteVolumeForPrice(const OrderBookFlatSide &side, const bool isBuy, const double price) {
+    return volumeForPrice(side.walkBegin(), side.walkEnd(), isBuy, price, true);
+}
+
+OrderBookDepthIndex::OrderBookDepthIndex() : OrderBookDepthIndex(true) {
+}
+
+OrderBookDepthIndex::OrderBookDepthIndex(const bool isBuy) {
+    this->isBuy = isBuy;
+    this->invalidateAll();
+}
+
+void OrderBookDepthIndex::setPriceGrid(const PriceGrid &grid) {
+    this->grid = grid;
+    this->priceKeys.clear();
+    this->prices.clear();
+    this->cumulativeVolumes.clear();
+    this->cumulativeQuoteVolumes.clear();
+    this->invalidateAll();
+}
+
+void OrderBookDepthIndex::invalidate(const double price) {
+    int64_t key = this->grid.toKey(price);
+    if (!this->dirty) {
+        this->dirty = true;
+        this->dirtyKey = key;
+    } else if (this->isBuy) {
+        this->dirtyKey = std::min(this->dirtyKey, key);
+    } else {
+        this->dirtyKey = std::max(this->dirtyKey, key);
+    }
+}
+
+void OrderBookDepthIndex::invalidateAll() {
+    this->dirty = true;
+    this->dirtyKey = this->isBuy ? INT64_MIN : INT64_MAX;
+}
+
+bool OrderBookDepthIndex::isDirty() const {
+    return this->dirty;
+}
+
+size_t OrderBookDepthIndex::size() const {
+    return this->prices.size();
+}
+
+template <typename Iterator>
+static void appendLevels(Iterator it, const Iterator end, std::vector<int64_t> &priceKeys, std::vector<double> &prices,
+                         std::vector<double> &cumulativeVolumes, std::vector<double> &cumulativeQuoteVolumes) {
+    double cumulativeVolume = cumulativeVolumes.empty() ? 0 : cumulativeVolumes.back();
+    double cumulativeQuoteVolume = cumulativeQuoteVolumes.empty() ? 0 : cumulativeQuoteVolumes.back();
+    for (; it != end; ++it) {
+        const OrderBookEntry &entry = *it;
+        cumulativeVolume += entry.getAmount();
+        cumulativeQuoteVolume += entry.getAmount() * entry.getPrice();
+        priceKeys.push_back(entry.getPriceKey());
+        prices.push_back(entry.getPrice());
+        cumulativeVolumes.push_back(cumulativeVolume);
+        cumulativeQuoteVolumes.push_back(cumulativeQuoteVolume);
+    }
+}
+
+size_t OrderBookDepthIndex::truncateToDirtyLevel() {
+    // Levels ahead of the first dirty price in walk order are unchanged, keep their prefix sums.
+    size_t keep;
+    if (this->isBuy) {
+        keep = std::lower_bound(this->priceKeys.begin(), this->priceKeys.end(), this->dirtyKey) -
+               this->priceKeys.begin();
+    } else {
+        keep = std::lower_bound(this->priceKeys.begin(), this->priceKeys.end(), this->dirtyKey,
+                                std::greater<int64_t>()) - this->priceKeys.begin();
+    }
+    this->priceKeys.resize(keep);
+    this->prices.resize(keep);
+    this->cumulativeVolumes.resize(keep);
+    this->cumulativeQuoteVolumes.resize(keep);
+    return keep;
+}
+
+void OrderBookDepthIndex::update(const std::set<OrderBookEntry> &book) {
+    if (!this->dirty) {
+        return;
+    }
+
+    OrderBookEntry dirtyEntry(0, 0, 0, this->dirtyKey);
+    this->truncateToDirtyLevel();
+    if (this->isBuy) {
+        appendLevels(book.lower_bound(dirtyEntry), book.end(),
+                     this->priceKeys, this->prices, this->cumulativeVolumes, this->cumulativeQuoteVolumes);
+    } else {
+        appendLevels(std::set<OrderBookEntry>::const_reverse_iterator(book.upper_bound(dirtyEntry)), book.rend(),
+                     this->priceKeys, this->prices, this->cumulativeVolumes, this->cumulativeQuoteVolumes);
+    }
+    this->dirty = false;
+}
+
+void OrderBookDepthIndex::update(const OrderBookFlatSide &side) {
+    if (!this->dirty) {
+        return;
+    }
+
+    // The kept levels are exactly the first levels of the side in walk order.
+    size_t keep = this->truncateToDirtyLevel();
+    appendLevels(side.walkBegin() + keep, side.walkEnd(),
+                 this->priceKeys, this->prices, this->cumulativeVolumes, this->cumulativeQuoteVolumes);
+    this->dirty = false;
+}
+
+DepthQueryResult OrderBookDepthIndex::getPriceForVolume(const double volume) const {
+    DepthQueryResult result = {std::nan(""), this->cumulativeVolumes.empty() ? 0 : this->cumulativeVolumes.back()};
+    std::vector<double>::const_iterator it = std::lower_bound(this->cumulativeVolumes.begin(),
+                                                              this->cumulativeVolumes.end(), volume);
+    if (it != this->cumulativeVolumes.end()) {
+        result.price = this->prices[it - this->cumulativeVolumes.begin()];
+        result.volume = *it;
+    }
+    return result;
+}
+
+DepthQueryResult OrderBookDepthIndex::getVWAPForVolume(const double volume) const {
+    DepthQueryResult result = {std::nan(""), this->cumulativeVolumes.empty() ? 0 : this->cumulativeVolumes.back()};
+    std::vector<double>::const_iterator it = std::lower_bound(this->cumulativeVolumes.begin(),
+                                                              this->cumulativeVolumes.end(), volume);
+    if (it != this->cumulativeVolumes.end()) {
+        size_t level = it - this->cumulativeVolumes.begin();
+        double previousVolume = level > 0 ? this->cumulativeVolumes[level - 1] : 0;
+        double previousQuoteVolume = level > 0 ? this->cumulativeQuoteVolumes[level - 1] : 0;
+        result.price = (previousQuoteVolume + (volume - previousVolume) * this->prices[level]) / volume;
+        result.volume = volume;
+    }
+    return result;
+}
+
+DepthQueryResult OrderBookDepthIndex::getPriceForQuoteVolume(const double quoteVolume) const {
+    DepthQueryResult result = {std::nan(""),
+                               this->cumulativeQuoteVolumes.empty() ? 0 : this->cumulativeQuoteVolumes.back()};
+    std::vector<double>::const_iterator it = std::lower_bound(this->cumulativeQuoteVolumes.begin(),
+                                                              this->cumulativeQuoteVolumes.end(), quoteVolume);
+    if (it != this->cumulativeQuoteVolumes.end()) {
+        result.price = this->prices[it - this->cumulativeQuoteVolumes.begin()];
+        result.volume = *it;
+    }
+    return result;
+}
+
+DepthQueryResult OrderBookDepthIndex::getQuoteVolumeForBaseAmount(const double baseAmount) const {
+    DepthQueryResult result = {std::nan(""),
+                               this->cumulativeQuoteVolumes.empty() ? 0 : this->cumulativeQuoteVolumes.back()};
+    std::vector<double>::const_iterator it = std::lower_bound(this->cumulativeVolumes.begin(),
+                                                              this->cumulativeVolumes.end(), baseAmount);
+    if (it != this->cumulativeVolumes.end()) {
+        size_t level = it - this->cumulativeVolumes.begin();
+        double previousVolume = level > 0 ? this->cumulativeVolumes[level - 1] : 0;
+        double previousQuoteVolume = level > 0 ? this->cumulativeQuoteVolumes[level - 1] : 0;
+        result.volume = previousQuoteVolume + (baseAmount - previousVolume) * this->prices[level];
+    }
+    return result;
+}
+
+static size_t levelsWithinKey(const std::vector<int64_t> &priceKeys, const bool isBuy, const int64_t key) {
+    if (isBuy) {
+        return std::upper_bound(priceKeys.begin(), priceKeys.end(), key) - priceKeys.begin();
+    }
+    return std::upper_bound(priceKeys.begin(), priceKeys.end(), key, std::greater<int64_t>()) - priceKeys.begin();
+}
+
+DepthQueryResult OrderBookDepthIndex::getVolumeForPrice(const double price) const {
+    DepthQueryResult result = {std::nan(""), 0};
+    // Buys take asks up to the price, sells take bids down to it.
+    size_t levels = levelsWithinKey(this->priceKeys, this->isBuy, this->grid.toKey(price, this->isBuy ? -1 : 1));
+    if (levels > 0) {
+        result.price = this->prices[levels - 1];
+        result.volume = this->cumulativeVolumes[levels - 1];
+    }
+    return result;
+}
+
+DepthQueryResult OrderBookDepthIndex::getQuoteVolumeForPrice(const double price) const {
+    DepthQueryResult result = {std::nan(""), 0};
+    // Buys take asks up to the price, sells take bids down to it.
+    size_t levels = levelsWithinKey(this->priceKeys, this->isBuy, this->grid.toKey(price, this->isBuy ? -1 : 1));
+    if (levels > 0) {
+        result.price = this->prices[levels - 1];
+        result.volume = this->cumulativeQuoteVolumes[levels - 1];
+    }
+    return result;
+}
@@ -0,0 +1,66 @@
+#ifndef _ORDER_BOOK_DEPTH_H
+#define _ORDER_BOOK_DEPTH_H
+
+#include <set>
+#include <vector>
+#include "OrderBookEntry.h"
+#include "OrderBookFlatSide.h"
+
+struct DepthQueryResult {
+    double price;
+    double volume;
+};
+
+// All depth queries walk the side of the book a taker would consume: the ask book from the lowest price upwards for
+// buys, and the bid book from the highest price downwards for sells.
+DepthQueryResult getPriceForVolume(const std::set<OrderBookEntry> &book, const bool isBuy, const double volume);
+DepthQueryResult getVWAPForVolume(const std::set<OrderBookEntry> &book, const bool isBuy, const double volume);
+DepthQueryResult getPriceForQuoteVolume(const std::set<OrderBookEntry> &book, const bool isBuy, const double quoteVolume);
+DepthQueryResult getQuoteVolumeForBaseAmount(const std::set<OrderBookEntry> &book, const bool isBuy, const double baseAmount);
+DepthQueryResult getVolumeForPrice(const std::set<OrderBookEntry> &book, const bool isBuy, const double price);
+DepthQueryResult getQuoteVolumeForPrice(const std::set<OrderBookEntry> &book, const bool isBuy, const double price);
+
+DepthQueryResult getPriceForVolume(const OrderBookFlatSide &side, const bool isBuy, const double volume);
+DepthQueryResult getVWAPForVolume(const OrderBookFlatSide &side, const bool isBuy, const double volume);
+DepthQueryResult getPriceForQuoteVolume(const OrderBookFlatSide &side, const bool isBuy, const double quoteVolume);
+DepthQueryResult getQuoteVolumeForBaseAmount(const OrderBookFlatSide &side, const bool isBuy, const double baseAmount);
+DepthQueryResult getVolumeForPrice(const OrderBookFlatSide &side, const bool isBuy, const double price);
+DepthQueryResult getQuoteVolumeForPrice(const OrderBookFlatSide &side, const bool isBuy, const double price);
+
+// Prefix sums of base and quote volume per level of one book side, in the same walk order as the queries above.
+// Diffs only mark the index dirty from the first touched level onwards; update() then rebuilds just that tail, so
+// repeated queries between book updates become binary searches instead of linear walks. Levels are located by the
+// int64 price keys of the book's entries, see PriceGrid, so the index must share the book's grid.
+class OrderBookDepthIndex {
+    bool isBuy;
+    bool dirty;
+    int64_t dirtyKey;
+    PriceGrid grid;
+    std::vector<int64_t> priceKeys;
+    std::vector<double> prices;
+    std::vector<double> cumulativeVolumes;
+    std::vector<double> cumulativeQuoteVolumes;
+
+    size_t truncateToDirtyLevel();
+
+    public:
+        OrderBookDepthIndex();
+        OrderBookDepthIndex(const bool isBuy);
+
+        void setPriceGrid(const PriceGrid &grid);
+        void invalidate(const double price);
+        void invalidateAll();
+        void update(const std::set<OrderBookEntry> &book);
+        void update(const OrderBookFlatSide &side);
+        bool isDirty() const;
+        size_t size() const;
+
+        DepthQueryResult getPriceForVolume(const double volume) const;
+        DepthQueryResult getVWAPForVolume(const double volume) const;
+        DepthQueryResult getPriceForQuoteVolume(const double quoteVolume) const;
+        DepthQueryResult getQuoteVolumeForBaseAmount(const double baseAmount) const;
+        DepthQueryResult getVolumeForPrice(const double price) const;
+        DepthQueryResult getQuoteVolumeForPrice(const double price) const;
+};
+
+#endif
@@ -1,32 +1,108 @@
 #include "OrderBookEntry.h"
+#include <cmath>
+#include <cstring>
 #include <iostream>
 
+int64_t orderedPriceKey(const double price) {
+    int64_t bits;
+    std::memcpy(&bits, &price, sizeof(bits));
+    // Negative doubles order by descending magnitude bits, flip them to keep the order of the prices.
+    return bits >= 0 ? bits : bits ^ INT64_MAX;
+}
+
+PriceGrid::PriceGrid() : PriceGrid(0) {
+}
+
+PriceGrid::PriceGrid(const double increment) {
+    this->increment = increment > 0 ? increment : 0;
+    this->ticksPerUnit = 0;
+    if (this->increment > 0) {
+        double ticksPerUnit = std::round(1 / this->increment);
+        if (ticksPerUnit >= 1 && std::fabs(ticksPerUnit * this->increment - 1) < 1e-9) {
+            this->ticksPerUnit = ticksPerUnit;
+        }
+    }
+}
+
+bool PriceGrid::isEnabled() const {
+    return this->increment > 0;
+}
+
+double PriceGrid::getIncrement() const {
+    return this->increment;
+}
+
+int64_t PriceGrid::toTicks(const double price) const {
+    if (this->ticksPerUnit > 0) {
+        return std::llround(price * this->ticksPerUnit);
+    }
+    return std::llround(price / this->increment);
+}
+
+double PriceGrid::fromTicks(const int64_t ticks) const {
+    if (this->ticksPerUnit > 0) {
+        return ticks / this->ticksPerUnit;
+    }
+    return ticks * this->increment;
+}
+
+double PriceGrid::snap(const double price) const {
+    if (!this->isEnabled()) {
+        return price;
+    }
+    return this->fromTicks(this->toTicks(price));
+}
+
+int64_t PriceGrid::toKey(const double price, const int rounding) const {
+    if (!this->isEnabled()) {
+        return orderedPriceKey(price);
+    }
+    int64_t ticks = this->toTicks(price);
+    if (rounding < 0 && this->fromTicks(ticks) > price) {
+        ticks--;
+    } else if (rounding > 0 && this->fromTicks(ticks) < price) {
+        ticks++;
+    }
+    return ticks;
+}
+
 OrderBookEntry::OrderBookEntry() {
     this->price = this->amount = 0;
     this->updateId = 0;
+    this->priceKey = 0;
 }
 
 OrderBookEntry::OrderBookEntry(double price, double amount, int64_t updateId) {
     this->price = price;
     this->amount = amount;
     this->updateId = updateId;
+    this->priceKey = orderedPriceKey(price);
+}
+
+OrderBookEntry::OrderBookEntry(double price, double amount, int64_t updateId, int64_t priceKey) {
+    this->price = price;
+    this->amount = amount;
+    this->updateId = updateId;
+    this->priceKey = priceKey;
 }
 
 OrderBookEntry::OrderBookEntry(const OrderBookEntry &other) {
     this->price = other.price;
     this->amount = other.amount;
     this->updateId = other.updateId;
+    this->priceKey = other.priceKey;
 }
 
 OrderBookEntry &OrderBookEntry::operator=(const OrderBookEntry &other) {
     this->price = other.price;
     this->amount = other.amount;
     this->updateId = other.updateId;
+    this->priceKey = other.priceKey;
     return *this;
 }
 
 bool operator<(OrderBookEntry const &a, OrderBookEntry const &b) {
-    return a.price < b.price;
+    return a.priceKey < b.priceKey;
 }
 
 void truncateOverlapEntries(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook, const int &dex) {
@@ -79,10 +155,37 @@ void truncateOverlapEntriesCentralised(std::set<OrderBookEntry> &bidBook, std::s
     }
 }
 
+double trimOrderBookSide(std::set<OrderBookEntry> &book, const bool isBid, const size_t maxDepth, const double worstPrice) {
+    // Removes the levels furthest from the top of the book, beyond maxDepth levels (0 for no limit) or priced worse
+    // than worstPrice. Returns the trimmed price closest to the top of the book, or NaN if nothing was trimmed.
+    double trimmedPrice = std::nan("");
+    while (!book.empty()) {
+        std::set<OrderBookEntry>::iterator worst = isBid ? book.begin() : std::prev(book.end());
+        bool beyondDepth = maxDepth > 0 && book.size() > maxDepth;
+        bool beyondPrice = isBid ? worst->price < worstPrice : worst->price > worstPrice;
+        if (!beyondDepth && !beyondPrice) {
+            break;
+        }
+        trimmedPrice = worst->price;
+        book.erase(worst);
+    }
+    return trimmedPrice;
+}
+
 double OrderBookEntry::getPrice() const {
     return this->price;
 }
 
+int64_t OrderBookEntry::getPriceKey() const {
+    return this->priceKey;
+}
+
+void OrderBookEntry::snapPrice(const PriceGrid &grid) {
+    // Also rekeys entries of a book whose grid was removed.
+    this->price = grid.snap(this->price);
+    this->priceKey = grid.toKey(this->price);
+}
+
 double OrderBookEntry::getAmount() const {
     return this->amount;
 }
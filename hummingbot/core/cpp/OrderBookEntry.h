@@ -5,22 +5,64 @@
 #include <set>
 #include <iterator>
 
+// What applying one diff entry did to a side of the book.
+enum LevelChange {
+    LevelUnchanged = 0,
+    LevelInserted = 1,
+    LevelUpdated = 2,
+    LevelDeleted = 3
+};
+
+// Order preserving int64 image of a double price, the sort key of entries of books without a price grid.
+int64_t orderedPriceKey(const double price);
+
+// Snaps prices onto a pair's tick grid. Every price within half a tick of a level maps to the same integer tick and
+// back to one bit-identical double. For increments like 0.01 or 0.5, ticks are divided by the integral number of
+// ticks per unit, which yields the same double as parsing the decimal price string.
+//
+// Entries of a book with a grid are keyed by their tick, so set lookups and ordering compare int64 ticks and stay
+// exact even when the exchange, or an upstream float conversion, spells the same level differently. Without a grid,
+// toKey() falls back to orderedPriceKey().
+class PriceGrid {
+    double increment;
+    double ticksPerUnit;
+
+    public:
+        PriceGrid();
+        PriceGrid(const double increment);
+
+        bool isEnabled() const;
+        double getIncrement() const;
+        int64_t toTicks(const double price) const;
+        double fromTicks(const int64_t ticks) const;
+        double snap(const double price) const;
+        // Sort key of a price. rounding < 0 and > 0 give the key of the closest level at or below, and at or above,
+        // an off grid price.
+        int64_t toKey(const double price, const int rounding = 0) const;
+};
+
 class OrderBookEntry {
     double price;
     double amount;
     int64_t updateId;
+    // Sort key: the price's tick on the book's grid once snapped, orderedPriceKey(price) before.
+    int64_t priceKey;
 
     public:
         OrderBookEntry();
         OrderBookEntry(double price, double amount, int64_t updateId);
+        OrderBookEntry(double price, double amount, int64_t updateId, int64_t priceKey);
         OrderBookEntry(const OrderBookEntry &other);
         OrderBookEntry &operator=(const OrderBookEntry &other);
         friend bool operator<(OrderBookEntry const &a, OrderBookEntry const &b);
         friend void truncateOverlapEntries(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook, const int &dex);
         friend void truncateOverlapEntriesDex(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook);
         friend void truncateOverlapEntriesCentralised(std::set<OrderBookEntry> &bidBook, std::set<OrderBookEntry> &askBook);
+        friend double trimOrderBookSide(std::set<OrderBookEntry> &book, const bool isBid, const size_t maxDepth, const double worstPrice);
 
         double getPrice() const;
+        int64_t getPriceKey() const;
+        void snapPrice(const PriceGrid &grid);
         double getAmount() const;
         int64_t getUpdateId() const;
 };
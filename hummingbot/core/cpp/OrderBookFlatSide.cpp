@@ -0,0 +1,116 @@
+#include "OrderBookFlatSide.h"
+#include <algorithm>
+#include <cmath>
+
+struct FlatSideOrder {
+    bool isBid;
+    bool operator()(const OrderBookEntry &a, const OrderBookEntry &b) const {
+        return this->isBid ? a.getPriceKey() < b.getPriceKey() : a.getPriceKey() > b.getPriceKey();
+    }
+};
+
+OrderBookFlatSide::OrderBookFlatSide() : OrderBookFlatSide(true) {
+}
+
+OrderBookFlatSide::OrderBookFlatSide(const bool isBid) {
+    this->isBid = isBid;
+}
+
+void OrderBookFlatSide::clear() {
+    this->levels.clear();
+}
+
+void OrderBookFlatSide::assign(const std::vector<OrderBookEntry> &entries) {
+    FlatSideOrder order = {this->isBid};
+    this->levels = entries;
+    // Like std::set::insert(), keep the first entry of any duplicated price.
+    std::stable_sort(this->levels.begin(), this->levels.end(), order);
+    this->levels.erase(std::unique(this->levels.begin(), this->levels.end(),
+                                   [](const OrderBookEntry &a, const OrderBookEntry &b) {
+                                       return a.getPriceKey() == b.getPriceKey();
+                                   }),
+                       this->levels.end());
+}
+
+LevelChange OrderBookFlatSide::applyDiff(const OrderBookEntry &entry) {
+    FlatSideOrder order = {this->isBid};
+    std::vector<OrderBookEntry>::iterator it = std::lower_bound(this->levels.begin(), this->levels.end(), entry, order);
+    bool found = it != this->levels.end() && it->getPriceKey() == entry.getPriceKey();
+    if (entry.getAmount() > 0) {
+        if (found) {
+            *it = entry;
+            return LevelUpdated;
+        }
+        this->levels.insert(it, entry);
+        return LevelInserted;
+    } else if (found) {
+        this->levels.erase(it);
+        return LevelDeleted;
+    }
+    return LevelUnchanged;
+}
+
+void OrderBookFlatSide::popTop() {
+    this->levels.pop_back();
+}
+
+double OrderBookFlatSide::trim(const size_t maxDepth, const double worstPrice) {
+    // Same contract as trimOrderBookSide(). The worst levels sit at the front of the vector.
+    size_t trimCount = maxDepth > 0 && this->levels.size() > maxDepth ? this->levels.size() - maxDepth : 0;
+    while (trimCount < this->levels.size()) {
+        double price = this->levels[trimCount].getPrice();
+        if (this->isBid ? price >= worstPrice : price <= worstPrice) {
+            break;
+        }
+        trimCount++;
+    }
+    if (trimCount == 0) {
+        return std::nan("");
+    }
+    double trimmedPrice = this->levels[trimCount - 1].getPrice();
+    this->levels.erase(this->levels.begin(), this->levels.begin() + trimCount);
+    return trimmedPrice;
+}
+
+bool OrderBookFlatSide::empty() const {
+    return this->levels.empty();
+}
+
+size_t OrderBookFlatSide::size() const {
+    return this->levels.size();
+}
+
+size_t OrderBookFlatSide::capacity() const {
+    return this->levels.capacity();
+}
+
+const OrderBookEntry &OrderBookFlatSide::top(const size_t depth) const {
+    return this->levels[this->levels.size() - 1 - depth];
+}
+
+OrderBookFlatSide::WalkIterator OrderBookFlatSide::walkBegin() const {
+    return this->levels.rbegin();
+}
+
+OrderBookFlatSide::WalkIterator OrderBookFlatSide::walkEnd() const {
+    return this->levels.rend();
+}
+
+void truncateOverlapEntriesFlat(OrderBookFlatSide &bidSide, OrderBookFlatSide &askSide, const int &dex) {
+    // Same rules as truncateOverlapEntries(): dex keeps the larger quote volume, centralised keeps the newer entry.
+    while (!bidSide.empty() && !askSide.empty()) {
+        const OrderBookEntry &topBid = bidSide.top(0);
+        const OrderBookEntry &topAsk = askSide.top(0);
+        if (topBid.getPrice() < topAsk.getPrice()) {
+            break;
+        }
+        bool keepBid = dex != 0 ?
+            topBid.getAmount() * topBid.getPrice() > topAsk.getAmount() * topAsk.getPrice() :
+            topBid.getUpdateId() > topAsk.getUpdateId();
+        if (keepBid) {
+            askSide.popTop();
+        } else {
+            bidSide.popTop();
+        }
+    }
+}
@@ -0,0 +1,39 @@
+#ifndef _ORDER_BOOK_FLAT_SIDE_H
+#define _ORDER_BOOK_FLAT_SIDE_H
+
+#include <stdint.h>
+#include <vector>
+#include "OrderBookEntry.h"
+
+// One side of an order book kept in a contiguous vector, sorted so that the best price is at the back. Exchange
+// depth streams mostly touch the first few levels, so inserts and erases only move a handful of entries, and walks
+// from the top of the book read memory sequentially.
+class OrderBookFlatSide {
+    bool isBid;
+    std::vector<OrderBookEntry> levels;
+
+    public:
+        typedef std::vector<OrderBookEntry>::const_reverse_iterator WalkIterator;
+
+        OrderBookFlatSide();
+        OrderBookFlatSide(const bool isBid);
+
+        void clear();
+        void assign(const std::vector<OrderBookEntry> &entries);
+        LevelChange applyDiff(const OrderBookEntry &entry);
+        void popTop();
+        double trim(const size_t maxDepth, const double worstPrice);
+
+        bool empty() const;
+        size_t size() const;
+        size_t capacity() const;
+        const OrderBookEntry &top(const size_t depth) const;
+
+        // Walks from the best price outwards.
+        WalkIterator walkBegin() const;
+        WalkIterator walkEnd() const;
+};
+
+void truncateOverlapEntriesFlat(OrderBookFlatSide &bidSide, OrderBookFlatSide &askSide, const int &dex);
+
+#endif
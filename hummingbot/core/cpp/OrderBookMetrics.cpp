@@ -0,0 +1,136 @@
+#include "OrderBookMetrics.h"
+#include <cmath>
+
+template <typename Iterator>
+static double sumLevels(Iterator it, const Iterator end, const size_t depth,
+                        double &bestPrice, double &bestAmount, double &volume, double &quoteVolume) {
+    // Returns the worst price of the summed levels, or NaN if the side has fewer levels than the depth.
+    bestPrice = std::nan("");
+    bestAmount = volume = quoteVolume = 0;
+    for (size_t level = 0; it != end && level < depth; ++it, ++level) {
+        const OrderBookEntry &entry = *it;
+        if (level == 0) {
+            bestPrice = entry.getPrice();
+            bestAmount = entry.getAmount();
+        }
+        volume += entry.getAmount();
+        quoteVolume += entry.getAmount() * entry.getPrice();
+        if (level + 1 == depth) {
+            return entry.getPrice();
+        }
+    }
+    return std::nan("");
+}
+
+OrderBookMetrics::OrderBookMetrics() : OrderBookMetrics(1) {
+}
+
+OrderBookMetrics::OrderBookMetrics(const size_t depth) {
+    this->depth = depth;
+    this->bestBid = this->bestAsk = std::nan("");
+    this->bestBidAmount = this->bestAskAmount = 0;
+    this->bidVolume = this->askVolume = this->bidQuoteVolume = this->askQuoteVolume = 0;
+    this->resetLevelChanges();
+    this->invalidate();
+}
+
+void OrderBookMetrics::setDepth(const size_t depth) {
+    this->depth = depth;
+    this->invalidate();
+}
+
+size_t OrderBookMetrics::getDepth() const {
+    return this->depth;
+}
+
+void OrderBookMetrics::recordChange(const bool isBid, const double price, const LevelChange change) {
+    if (isBid) {
+        this->bidChanges[change] += 1;
+        // NaN boundaries mean the side has fewer levels than the depth, so every level is tracked.
+        if (change != LevelUnchanged && !(price < this->bidBoundary)) {
+            this->dirty = true;
+        }
+    } else {
+        this->askChanges[change] += 1;
+        if (change != LevelUnchanged && !(price > this->askBoundary)) {
+            this->dirty = true;
+        }
+    }
+}
+
+void OrderBookMetrics::invalidate() {
+    this->dirty = true;
+    this->bidBoundary = this->askBoundary = std::nan("");
+}
+
+void OrderBookMetrics::update(const std::set<OrderBookEntry> &bidBook, const std::set<OrderBookEntry> &askBook) {
+    if (!this->dirty) {
+        return;
+    }
+    this->bidBoundary = sumLevels(bidBook.rbegin(), bidBook.rend(), this->depth,
+                                  this->bestBid, this->bestBidAmount, this->bidVolume, this->bidQuoteVolume);
+    this->askBoundary = sumLevels(askBook.begin(), askBook.end(), this->depth,
+                                  this->bestAsk, this->bestAskAmount, this->askVolume, this->askQuoteVolume);
+    this->dirty = false;
+}
+
+void OrderBookMetrics::update(const OrderBookFlatSide &bidSide, const OrderBookFlatSide &askSide) {
+    if (!this->dirty) {
+        return;
+    }
+    this->bidBoundary = sumLevels(bidSide.walkBegin(), bidSide.walkEnd(), this->depth,
+                                  this->bestBid, this->bestBidAmount, this->bidVolume, this->bidQuoteVolume);
+    this->askBoundary = sumLevels(askSide.walkBegin(), askSide.walkEnd(), this->depth,
+                                  this->bestAsk, this->bestAskAmount, this->askVolume, this->askQuoteVolume);
+    this->dirty = false;
+}
+
+bool OrderBookMetrics::isDirty() const {
+    return this->dirty;
+}
+
+uint64_t OrderBookMetrics::getLevelChanges(const bool isBid, const LevelChange change) const {
+    return isBid ? this->bidChanges[change] : this->askChanges[change];
+}
+
+void OrderBookMetrics::resetLevelChanges() {
+    for (size_t i = 0; i < 4; ++i) {
+        this->bidChanges[i] = this->askChanges[i] = 0;
+    }
+}
+
+double OrderBookMetrics::getBidVolume() const {
+    return this->bidVolume;
+}
+
+double OrderBookMetrics::getAskVolume() const {
+    return this->askVolume;
+}
+
+double OrderBookMetrics::getImbalance() const {
+    double totalVolume = this->bidVolume + this->askVolume;
+    return totalVolume > 0 ? (this->bidVolume - this->askVolume) / totalVolume : std::nan("");
+}
+
+double OrderBookMetrics::getMicroPrice() const {
+    double totalAmount = this->bestBidAmount + this->bestAskAmount;
+    if (!(totalAmount > 0)) {
+        return std::nan("");
+    }
+    return (this->bestBid * this->bestAskAmount + this->bestAsk * this->bestBidAmount) / totalAmount;
+}
+
+double OrderBookMetrics::getWeightedMidPrice() const {
+    double totalVolume = this->bidVolume + this->askVolume;
+    if (!(this->bidVolume > 0 && this->askVolume > 0)) {
+        return std::nan("");
+    }
+    double bidPrice = this->bidQuoteVolume / this->bidVolume;
+    double askPrice = this->askQuoteVolume / this->askVolume;
+    return (bidPrice * this->askVolume + askPrice * this->bidVolume) / totalVolume;
+}
+
+double OrderBookMetrics::getSpreadBps() const {
+    double midPrice = (this->bestBid + this->bestAsk) / 2;
+    return (this->bestAsk - this->bestBid) / midPrice * 10000;
+}
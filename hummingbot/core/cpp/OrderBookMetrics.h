@@ -0,0 +1,54 @@
+#ifndef _ORDER_BOOK_METRICS_H
+#define _ORDER_BOOK_METRICS_H
+
+#include <stdint.h>
+#include <set>
+#include "OrderBookEntry.h"
+#include "OrderBookFlatSide.h"
+
+// Microstructure metrics over the top levels of an order book, kept up to date as diffs are applied so that reading
+// them is O(1). Diffs beyond the tracked levels can't move any of the metrics, so only diffs that touch the tracked
+// levels mark them dirty, and update() then re-sums just those levels.
+class OrderBookMetrics {
+    size_t depth;
+    bool dirty;
+    double bidBoundary;
+    double askBoundary;
+    double bestBid;
+    double bestAsk;
+    double bestBidAmount;
+    double bestAskAmount;
+    double bidVolume;
+    double askVolume;
+    double bidQuoteVolume;
+    double askQuoteVolume;
+    uint64_t bidChanges[4];
+    uint64_t askChanges[4];
+
+    public:
+        OrderBookMetrics();
+        OrderBookMetrics(const size_t depth);
+
+        void setDepth(const size_t depth);
+        size_t getDepth() const;
+        void recordChange(const bool isBid, const double price, const LevelChange change);
+        void invalidate();
+        void update(const std::set<OrderBookEntry> &bidBook, const std::set<OrderBookEntry> &askBook);
+        void update(const OrderBookFlatSide &bidSide, const OrderBookFlatSide &askSide);
+        bool isDirty() const;
+
+        uint64_t getLevelChanges(const bool isBid, const LevelChange change) const;
+        void resetLevelChanges();
+
+        double getBidVolume() const;
+        double getAskVolume() const;
+        // (bid volume - ask volume) / (bid volume + ask volume) over the tracked levels, in [-1, 1].
+        double getImbalance() const;
+        // Best bid and ask weighted by the size resting on the opposite side of the top level.
+        double getMicroPrice() const;
+        // Volume weighted average prices of the tracked levels, weighted by the opposite side's volume.
+        double getWeightedMidPrice() const;
+        double getSpreadBps() const;
+};
+
+#endif
@@ -0,0 +1,44 @@
+# distutils: language=c++
+
+from libcpp cimport bool
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry, PriceGrid
+from hummingbot.core.data_type.OrderBookFlatSide cimport OrderBookFlatSide
+
+cdef extern from "../cpp/OrderBookDepth.h" nogil:
+    cdef struct DepthQueryResult:
+        double price
+        double volume
+
+    DepthQueryResult getPriceForVolume(const set[OrderBookEntry] &book, const bool isBuy, const double volume)
+    DepthQueryResult getVWAPForVolume(const set[OrderBookEntry] &book, const bool isBuy, const double volume)
+    DepthQueryResult getPriceForQuoteVolume(const set[OrderBookEntry] &book, const bool isBuy, const double quoteVolume)
+    DepthQueryResult getQuoteVolumeForBaseAmount(const set[OrderBookEntry] &book, const bool isBuy,
+                                                 const double baseAmount)
+    DepthQueryResult getVolumeForPrice(const set[OrderBookEntry] &book, const bool isBuy, const double price)
+    DepthQueryResult getQuoteVolumeForPrice(const set[OrderBookEntry] &book, const bool isBuy, const double price)
+
+    DepthQueryResult getPriceForVolume(const OrderBookFlatSide &side, const bool isBuy, const double volume)
+    DepthQueryResult getVWAPForVolume(const OrderBookFlatSide &side, const bool isBuy, const double volume)
+    DepthQueryResult getPriceForQuoteVolume(const OrderBookFlatSide &side, const bool isBuy, const double quoteVolume)
+    DepthQueryResult getQuoteVolumeForBaseAmount(const OrderBookFlatSide &side, const bool isBuy,
+                                                 const double baseAmount)
+    DepthQueryResult getVolumeForPrice(const OrderBookFlatSide &side, const bool isBuy, const double price)
+    DepthQueryResult getQuoteVolumeForPrice(const OrderBookFlatSide &side, const bool isBuy, const double price)
+
+    cdef cppclass OrderBookDepthIndex:
+        OrderBookDepthIndex()
+        OrderBookDepthIndex(const bool isBuy)
+        void setPriceGrid(const PriceGrid &grid)
+        void invalidate(const double price)
+        void invalidateAll()
+        void update(const set[OrderBookEntry] &book)
+        void update(const OrderBookFlatSide &side)
+        bool isDirty() const
+        size_t size() const
+        DepthQueryResult getPriceForVolume(const double volume) const
+        DepthQueryResult getVWAPForVolume(const double volume) const
+        DepthQueryResult getPriceForQuoteVolume(const double quoteVolume) const
+        DepthQueryResult getQuoteVolumeForBaseAmount(const double baseAmount) const
+        DepthQueryResult getVolumeForPrice(const double price) const
+        DepthQueryResult getQuoteVolumeForPrice(const double price) const
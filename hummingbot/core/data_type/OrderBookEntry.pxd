@@ -3,14 +3,34 @@
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
 
-cdef extern from "../cpp/OrderBookEntry.h":
+cdef extern from "../cpp/OrderBookEntry.h" nogil:
+    cdef enum LevelChange:
+        LevelUnchanged
+        LevelInserted
+        LevelUpdated
+        LevelDeleted
+
+    cdef cppclass PriceGrid:
+        PriceGrid()
+        PriceGrid(const double increment)
+        bint isEnabled() const
+        double getIncrement() const
+        int64_t toTicks(const double price) const
+        double fromTicks(const int64_t ticks) const
+        double snap(const double price) const
+        int64_t toKey(const double price, const int rounding) const
+
     cdef cppclass OrderBookEntry:
         OrderBookEntry()
         OrderBookEntry(double price, double amount, int64_t updateId)
+        OrderBookEntry(double price, double amount, int64_t updateId, int64_t priceKey)
         OrderBookEntry(const OrderBookEntry &other)
         OrderBookEntry &operator=(const OrderBookEntry &other)
         double getPrice() const
+        int64_t getPriceKey() const
+        void snapPrice(const PriceGrid &grid)
         double getAmount() const
         int64_t getUpdateId() const
 
     void truncateOverlapEntries(set[OrderBookEntry] &bid_book, set[OrderBookEntry] &ask_book, const bint &dex)
+    double trimOrderBookSide(set[OrderBookEntry] &book, const bint isBid, const size_t maxDepth, const double worstPrice)
@@ -0,0 +1,20 @@
+# distutils: language=c++
+
+from libcpp cimport bool
+from libcpp.vector cimport vector
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry, LevelChange
+
+cdef extern from "../cpp/OrderBookFlatSide.h" nogil:
+    cdef cppclass OrderBookFlatSide:
+        OrderBookFlatSide()
+        OrderBookFlatSide(const bool isBid)
+        void clear()
+        void assign(const vector[OrderBookEntry] &entries)
+        LevelChange applyDiff(const OrderBookEntry &entry)
+        double trim(const size_t maxDepth, const double worstPrice)
+        bool empty() const
+        size_t size() const
+        size_t capacity() const
+        const OrderBookEntry &top(const size_t depth) const
+
+    void truncateOverlapEntriesFlat(OrderBookFlatSide &bidSide, OrderBookFlatSide &askSide, const bint &dex)
@@ -0,0 +1,27 @@
+# distutils: language=c++
+
+from libc.stdint cimport uint64_t
+from libcpp cimport bool
+from libcpp.set cimport set
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry, LevelChange
+from hummingbot.core.data_type.OrderBookFlatSide cimport OrderBookFlatSide
+
+cdef extern from "../cpp/OrderBookMetrics.h" nogil:
+    cdef cppclass OrderBookMetrics:
+        OrderBookMetrics()
+        OrderBookMetrics(const size_t depth)
+        void setDepth(const size_t depth)
+        size_t getDepth() const
+        void recordChange(const bool isBid, const double price, const LevelChange change)
+        void invalidate()
+        void update(const set[OrderBookEntry] &bidBook, const set[OrderBookEntry] &askBook)
+        void update(const OrderBookFlatSide &bidSide, const OrderBookFlatSide &askSide)
+        bool isDirty() const
+        uint64_t getLevelChanges(const bool isBid, const LevelChange change) const
+        void resetLevelChanges()
+        double getBidVolume() const
+        double getAskVolume() const
+        double getImbalance() const
+        double getMicroPrice() const
+        double getWeightedMidPrice() const
+        double getSpreadBps() const
@@ -0,0 +1,21 @@
+# distutils: language=c++
+
+from libc.stdint cimport int64_t
+
+
+cdef class CompactOrderBookMessage:
+    cdef:
+        readonly object type
+        readonly object timestamp
+        readonly str trading_pair
+        readonly int64_t update_id
+        readonly int64_t first_update_id
+        readonly int64_t trade_id
+        readonly list raw_bids
+        readonly list raw_asks
+        bint _is_book_message
+        dict _content
+        list _bids
+        list _asks
+
+    cdef list c_parse_rows(self, list raw_rows)
@@ -0,0 +1,143 @@
+# distutils: language=c++
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional
+)
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+cdef object SNAPSHOT_TYPE = OrderBookMessageType.SNAPSHOT
+cdef object DIFF_TYPE = OrderBookMessageType.DIFF
+cdef object TRADE_TYPE = OrderBookMessageType.TRADE
+
+
+cdef class CompactOrderBookMessage:
+    """
+    Drop-in replacement for OrderBookMessage, with the fields the order book tracker reads for every message
+    extracted once at construction, and levels decoded into OrderBookRow lists only when first accessed.
+
+    raw_bids and raw_asks keep the exchange's [price, amount, ...] lists, see OrderBook.apply_raw_diffs(). The content
+    dict of OrderBookMessage is built on first access for snapshots and diffs, and must be passed in for trades.
+    """
+
+    def __init__(self,
+                 message_type: OrderBookMessageType,
+                 str trading_pair,
+                 int64_t update_id=-1,
+                 list raw_bids=None,
+                 list raw_asks=None,
+                 timestamp: Optional[float] = None,
+                 int64_t first_update_id=-1,
+                 dict content=None):
+        """
+        :param update_id: update id of snapshots and diffs, ignored for trades
+        :param first_update_id: first update id a diff covers, the update id if -1
+        :param content: OrderBookMessage style content, required for trades and otherwise built when first accessed
+        """
+        self.type = message_type
+        self.timestamp = timestamp
+        self.trading_pair = trading_pair
+        self._is_book_message = message_type is SNAPSHOT_TYPE or message_type is DIFF_TYPE
+        self.update_id = update_id if self._is_book_message else -1
+        if message_type is DIFF_TYPE:
+            self.first_update_id = first_update_id if first_update_id >= 0 else update_id
+        else:
+            self.first_update_id = -1
+        self.trade_id = -1
+        if message_type is TRADE_TYPE:
+            if content is None:
+                raise ValueError("content must not be None for trade messages.")
+            self.trade_id = content["trade_id"]
+        self.raw_bids = raw_bids if raw_bids is not None else []
+        self.raw_asks = raw_asks if raw_asks is not None else []
+        self._content = content
+        self._bids = None
+        self._asks = None
+
+    cdef list c_parse_rows(self, list raw_rows):
+        cdef:
+            object update_id = self.update_id
+            list rows = []
+        for raw_row in raw_rows:
+            rows.append(OrderBookRow(float(raw_row[0]), float(raw_row[1]), update_id))
+        return rows
+
+    @property
+    def content(self) -> Dict[str, Any]:
+        if self._content is None:
+            self._content = {
+                "trading_pair": self.trading_pair,
+                "update_id": self.update_id,
+                "bids": self.raw_bids,
+                "asks": self.raw_asks
+            }
+            if self.type is DIFF_TYPE:
+                self._content["first_update_id"] = self.first_update_id
+        return self._content
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        if self._bids is None:
+            self._bids = self.c_parse_rows(self.raw_bids)
+        return self._bids
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        if self._asks is None:
+            self._asks = self.c_parse_rows(self.raw_asks)
+        return self._asks
+
+    @property
+    def has_update_id(self) -> bool:
+        return self._is_book_message
+
+    @property
+    def has_trade_id(self) -> bool:
+        return self.type is TRADE_TYPE
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CompactOrderBookMessage):
+            if self._is_book_message and (<CompactOrderBookMessage>other)._is_book_message:
+                return self.update_id == (<CompactOrderBookMessage>other).update_id
+        if self.has_update_id and other.has_update_id:
+            return self.update_id == other.update_id
+        elif self.has_trade_id and other.has_trade_id:
+            return self.trade_id == other.trade_id
+        else:
+            return False
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __lt__(self, other) -> bool:
+        # Snapshot replay bisects diff windows with this, so comparing two book messages skips the property lookups.
+        if isinstance(other, CompactOrderBookMessage):
+            if self._is_book_message and (<CompactOrderBookMessage>other)._is_book_message:
+                return self.update_id < (<CompactOrderBookMessage>other).update_id
+        if self.has_update_id and other.has_update_id:
+            return self.update_id < other.update_id
+        elif self.has_trade_id and other.has_trade_id:
+            return self.trade_id < other.trade_id
+        else:
+            if self.timestamp != other.timestamp:
+                return self.timestamp < other.timestamp
+            else:
+                # For messages of same timestamp, order book messages come before trade messages.
+                return self.has_update_id
+
+    def __le__(self, other) -> bool:
+        return self < other or self == other
+
+    def __gt__(self, other) -> bool:
+        return not self <= other
+
+    def __ge__(self, other) -> bool:
+        return not self < other
+
+    def __repr__(self) -> str:
+        return (f"CompactOrderBookMessage(type={self.type}, trading_pair={self.trading_pair!r}, "
+                f"update_id={self.update_id}, timestamp={self.timestamp})")
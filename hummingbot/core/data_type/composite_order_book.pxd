@@ -1,8 +1,24 @@
 # distutils: language=c++
+from libc.stdint cimport int64_t
+from libcpp.set cimport set
+from libcpp.vector cimport vector
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookDepth cimport OrderBookDepthIndex
 
 cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
+        set[OrderBookEntry] _composite_bid_book
+        set[OrderBookEntry] _composite_ask_book
+        bint _composite_bids_dirty
+        bint _composite_asks_dirty
 
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_trim_depth(self)
+    cdef c_invalidate_composite_books(self)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef set[OrderBookEntry] *c_get_query_book(self, bint is_buy)
+    cdef size_t c_get_side_size(self, bint is_buy)
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy)
@@ -2,6 +2,7 @@
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
 from typing import Iterator
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from cython.operator cimport(
     postincrement as inc,
@@ -24,6 +25,8 @@ cdef class CompositeOrderBook(OrderBook):
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
         self._traded_order_book = OrderBook()
+        self._composite_bids_dirty = True
+        self._composite_asks_dirty = True
 
     @property
     def traded_order_book(self) -> OrderBook:
@@ -32,6 +35,24 @@ cdef class CompositeOrderBook(OrderBook):
     def clear_traded_order_book(self):
         self._traded_order_book._bid_book.clear()
         self._traded_order_book._ask_book.clear()
+        self.c_invalidate_composite_books()
+
+    cdef c_invalidate_composite_books(self):
+        # The composite sides are rebuilt on the next depth query, after the book or the recorded fills changed.
+        self._composite_bids_dirty = True
+        self._composite_asks_dirty = True
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_diffs(self, bids, asks, update_id)
+        self.c_invalidate_composite_books()
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_snapshot(self, bids, asks, update_id)
+        self.c_invalidate_composite_books()
+
+    cdef c_trim_depth(self):
+        OrderBook.c_trim_depth(self)
+        self.c_invalidate_composite_books()
 
     def record_filled_order(self, order_fill_event):
         cdef:
@@ -75,6 +96,7 @@ cdef class CompositeOrderBook(OrderBook):
             cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
 
         self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+        self.c_invalidate_composite_books()
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
         return super().bid_entries()
@@ -196,3 +218,28 @@ cdef class CompositeOrderBook(OrderBook):
                 return best_bid.price
         except Exception:
             raise
+
+    cdef set[OrderBookEntry] *c_get_query_book(self, bint is_buy):
+        # Depth queries must see the composite entries, so materialize them before handing the side to the kernels.
+        # The materialized side is kept until the book or the recorded fills change.
+        cdef:
+            set[OrderBookEntry] *book = ref(self._composite_ask_book) if is_buy else ref(self._composite_bid_book)
+        if is_buy and self._composite_asks_dirty:
+            deref(book).clear()
+            for row in self.ask_entries():
+                deref(book).insert(OrderBookEntry(row.price, row.amount, row.update_id))
+            self._composite_asks_dirty = False
+        elif not is_buy and self._composite_bids_dirty:
+            deref(book).clear()
+            for row in self.bid_entries():
+                deref(book).insert(OrderBookEntry(row.price, row.amount, row.update_id))
+            self._composite_bids_dirty = False
+        return book
+
+    cdef size_t c_get_side_size(self, bint is_buy):
+        # The cached composite side, which is only rebuilt if the book changed since the last query.
+        return deref(self.c_get_query_book(is_buy)).size()
+
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy):
+        # The cumulative depth index follows the original book, not the composite entries.
+        return NULL
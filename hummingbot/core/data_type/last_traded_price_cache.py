@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+import asyncio
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional
+)
+
+AllPricesFetcher = Callable[[], Awaitable[Dict[str, float]]]
+
+
+class LastTradedPriceCache:
+    """
+    Last traded prices of every pair of an exchange, fetched with one all-tickers request and reused for ttl seconds.
+
+    Data sources get the cache of their exchange with get_instance(), so that all trackers and callers of
+    get_last_traded_prices() on one exchange share the result. Callers arriving while a request is in flight wait
+    for that request instead of sending their own.
+    """
+    _instances: Dict[str, "LastTradedPriceCache"] = {}
+
+    @classmethod
+    def get_instance(cls, key: str, ttl: float = 1.0) -> "LastTradedPriceCache":
+        """
+        :param key: exchange and domain the prices come from, e.g. "binance_com"
+        """
+        if key not in cls._instances:
+            cls._instances[key] = cls(ttl)
+        return cls._instances[key]
+
+    def __init__(self, ttl: float = 1.0):
+        self._ttl: float = ttl
+        self._prices: Dict[str, float] = {}
+        self._fetch_time: float = 0
+        self._fetch_task: Optional[asyncio.Task] = None
+
+    @property
+    def prices(self) -> Dict[str, float]:
+        """
+        Prices of the last fetch, possibly expired.
+        """
+        return dict(self._prices)
+
+    def _fetch_done(self, fetch_task: asyncio.Task):
+        self._fetch_task = None
+        if not fetch_task.cancelled() and fetch_task.exception() is None:
+            self._prices = fetch_task.result()
+            self._fetch_time = time.time()
+
+    async def get_prices(self, fetch_all_prices: AllPricesFetcher, trading_pairs: List[str]) -> Dict[str, float]:
+        """
+        :param fetch_all_prices: coroutine function fetching the last traded price of every pair on the exchange
+        :return: prices of the given pairs, leaving out pairs the exchange didn't report
+        """
+        if time.time() - self._fetch_time > self._ttl:
+            if self._fetch_task is None:
+                self._fetch_task = asyncio.ensure_future(fetch_all_prices())
+                self._fetch_task.add_done_callback(self._fetch_done)
+            # Shielded, so that a cancelled caller doesn't cancel the request for the others.
+            prices: Dict[str, float] = await asyncio.shield(self._fetch_task)
+        else:
+            prices = self._prices
+        return {trading_pair: prices[trading_pair] for trading_pair in trading_pairs if trading_pair in prices}
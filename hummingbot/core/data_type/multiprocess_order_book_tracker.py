@@ -0,0 +1,364 @@
+#!/usr/bin/env python
+import asyncio
+import logging
+import multiprocessing
+import queue
+import time
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.asyncio_throttle import REQUEST_WEIGHT, RateLimit, Throttler
+from hummingbot.logger import HummingbotLogger
+
+# Layout of one pair's slot in a shard's shared array: a header, then `depth` bid rows and `depth` ask rows of
+# [price, amount, update_id], best price first. BOOK_VERSION only changes with the rows, so that a new last trade
+# price or health doesn't make the main process copy the rows again.
+SEQUENCE, SNAPSHOT_UID, LAST_DIFF_UID, BID_ROWS, ASK_ROWS, LAST_TRADE_PRICE, BOOK_VERSION, HEALTHY = range(8)
+HEADER_SIZE = 8
+
+# Seconds between tracking metrics reports of the workers.
+METRICS_INTERVAL = 1.0
+
+# Called as tracker_factory(trading_pairs, throttler=throttler) in the workers.
+TrackerFactory = Callable[..., OrderBookTracker]
+
+
+def slot_size(depth: int) -> int:
+    return HEADER_SIZE + 2 * depth * 3
+
+
+def slot_views(shared_array, index: int, depth: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Header, bid rows and ask rows of the index-th slot of a shared array, as NumPy views.
+    """
+    array: np.ndarray = np.frombuffer(shared_array, dtype=np.float64)
+    start: int = index * slot_size(depth)
+    rows_start: int = start + HEADER_SIZE
+    header: np.ndarray = array[start:rows_start]
+    bids: np.ndarray = array[rows_start:rows_start + depth * 3].reshape(depth, 3)
+    asks: np.ndarray = array[rows_start + depth * 3:rows_start + 2 * depth * 3].reshape(depth, 3)
+    return header, bids, asks
+
+
+def publish_order_book(order_book: OrderBook,
+                       healthy: bool,
+                       header: np.ndarray,
+                       bids: np.ndarray,
+                       asks: np.ndarray,
+                       rows_changed: bool = True):
+    # Seqlock: the sequence is odd while the slot is written, readers retry if it changed under them.
+    header[SEQUENCE] += 1
+    if rows_changed:
+        bid_rows, ask_rows = order_book.to_numpy_into(bids, asks)
+        header[SNAPSHOT_UID] = order_book.snapshot_uid
+        header[LAST_DIFF_UID] = order_book.last_diff_uid
+        header[BID_ROWS] = bid_rows
+        header[ASK_ROWS] = ask_rows
+        header[BOOK_VERSION] += 1
+    header[LAST_TRADE_PRICE] = order_book.last_trade_price
+    header[HEALTHY] = healthy
+    header[SEQUENCE] += 1
+
+
+def read_order_book(header: np.ndarray,
+                    bids: np.ndarray,
+                    asks: np.ndarray,
+                    copy_rows: bool = True) -> Optional[Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]]:
+    """
+    Consistent copy of a published slot, or None if the worker is writing it right now.
+
+    :param copy_rows: whether to copy the rows, or only the header
+    :return: (header, bids, asks), bids and asks are None without copy_rows
+    """
+    sequence: float = header[SEQUENCE]
+    if sequence % 2 == 1:
+        return None
+    header_copy: np.ndarray = header.copy()
+    bids_copy: Optional[np.ndarray] = None
+    asks_copy: Optional[np.ndarray] = None
+    if copy_rows:
+        bids_copy = bids[:int(header_copy[BID_ROWS])].copy()
+        asks_copy = asks[:int(header_copy[ASK_ROWS])].copy()
+    if header[SEQUENCE] != sequence:
+        return None
+    return header_copy, bids_copy, asks_copy
+
+
+async def publish_loop(tracker: OrderBookTracker,
+                       trading_pairs: List[str],
+                       shared_array,
+                       depth: int,
+                       publish_interval: float,
+                       trade_queue: multiprocessing.Queue,
+                       metrics_queue: multiprocessing.Queue):
+    slots: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {
+        trading_pair: slot_views(shared_array, index, depth) for index, trading_pair in enumerate(trading_pairs)
+    }
+    published_uids: Dict[str, Tuple[int, int]] = {}
+    published_states: Dict[str, Tuple[float, bool]] = {}
+    trade_forwarders: Dict[str, EventForwarder] = {}
+    last_metrics_report: float = 0.0
+    while True:
+        for trading_pair, (header, bids, asks) in slots.items():
+            order_book: Optional[OrderBook] = tracker.order_books.get(trading_pair)
+            if order_book is None:
+                continue
+            if trading_pair not in trade_forwarders:
+                trade_forwarders[trading_pair] = EventForwarder(trade_queue.put_nowait)
+                order_book.add_listener(OrderBookEvent.TradeEvent, trade_forwarders[trading_pair])
+            uids: Tuple[int, int] = (order_book.snapshot_uid, order_book.last_diff_uid)
+            state: Tuple[float, bool] = (order_book.last_trade_price, tracker.is_order_book_healthy(trading_pair))
+            rows_changed: bool = uids != published_uids.get(trading_pair)
+            if rows_changed or state != published_states.get(trading_pair):
+                publish_order_book(order_book, state[1], header, bids, asks, rows_changed)
+                published_uids[trading_pair] = uids
+                published_states[trading_pair] = state
+        now: float = time.time()
+        if now - last_metrics_report >= METRICS_INTERVAL:
+            metrics_queue.put_nowait(tracker.get_tracking_metrics(trading_pairs))
+            last_metrics_report = now
+        await asyncio.sleep(publish_interval)
+
+
+def run_worker(tracker_factory: TrackerFactory,
+               trading_pairs: List[str],
+               shared_array,
+               depth: int,
+               publish_interval: float,
+               trade_queue: multiprocessing.Queue,
+               metrics_queue: multiprocessing.Queue,
+               snapshot_rate_limit: RateLimit):
+    """
+    Entry point of a worker process: tracks its shard of pairs with a regular tracker, and publishes the books.
+    """
+    ev_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    asyncio.set_event_loop(ev_loop)
+    tracker: OrderBookTracker = tracker_factory(trading_pairs, throttler=Throttler(rate_limits=[snapshot_rate_limit]))
+    tracker.start()
+    ev_loop.run_until_complete(publish_loop(tracker, trading_pairs, shared_array, depth, publish_interval,
+                                            trade_queue, metrics_queue))
+
+
+class MultiprocessOrderBookTracker(OrderBookTracker):
+    """
+    Runs the data source listeners and diff application of another tracker class in worker processes, sharded by
+    pair. Workers publish the top `depth` levels of every book into shared memory, and this tracker mirrors them into
+    regular OrderBook objects in the main process, so that order_books and ExchangeBase.get_order_book() work as
+    usual while JSON parsing and diff application use other cores.
+
+    Main process books only hold the published levels. Trade events are forwarded from the workers and fired on the
+    main process books. is_order_book_healthy() and get_tracking_metrics() report the workers' trackers, and
+    set_price_increments() applies to the main process books, which snap the published levels to the tick size.
+    diff_coalescing_stats stays empty, as no diffs are applied in the main process.
+
+    Worker processes can't share a throttler, so the snapshot request budget is split between them: each worker's
+    throttler allows the budget's weight in process_count times its period.
+    """
+    _mobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mobt_logger is None:
+            cls._mobt_logger = logging.getLogger(__name__)
+        return cls._mobt_logger
+
+    def __init__(self,
+                 tracker_factory: TrackerFactory,
+                 trading_pairs: List[str],
+                 process_count: int = 2,
+                 depth: int = 200,
+                 publish_interval: float = 0.005,
+                 snapshot_rate_limit: Optional[RateLimit] = None):
+        """
+        :param tracker_factory: picklable callable creating the real tracker for a list of pairs and a throttler
+                                keyword, e.g. functools.partial(BinanceOrderBookTracker, domain="com")
+        :param process_count: number of worker processes, pairs are assigned round robin
+        :param depth: levels per side published to the main process
+        :param publish_interval: seconds between publishing passes in the workers, and sync passes here
+        :param snapshot_rate_limit: snapshot request budget of all workers together, by default the one of the
+                                    tracker class without an exchange throttler
+        """
+        trading_pairs = trading_pairs or []
+        self._local_tracker: OrderBookTracker = tracker_factory([])
+        super().__init__(self._local_tracker.data_source, trading_pairs)
+        self._tracker_factory: TrackerFactory = tracker_factory
+        self._process_count: int = max(1, min(process_count, len(trading_pairs)))
+        if snapshot_rate_limit is None:
+            snapshot_rate_limit = RateLimit(
+                REQUEST_WEIGHT,
+                self._local_tracker.DEFAULT_SNAPSHOTS_PER_SECOND * self._local_tracker.SNAPSHOT_REQUEST_WEIGHT,
+                1.0
+            )
+        self._worker_rate_limit: RateLimit = RateLimit(snapshot_rate_limit.limit_id,
+                                                       snapshot_rate_limit.limit,
+                                                       snapshot_rate_limit.period * self._process_count)
+        self._depth: int = depth
+        self._publish_interval: float = publish_interval
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._shards: List[Tuple[List[str], object]] = []
+        self._processes: List[multiprocessing.Process] = []
+        self._trade_queue: Optional[multiprocessing.Queue] = None
+        self._metrics_queue: Optional[multiprocessing.Queue] = None
+        self._sync_task: Optional[asyncio.Task] = None
+        self._price_increments: Dict[str, Decimal] = {}
+        self._healthy: Dict[str, bool] = {}
+        self._worker_metrics: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def exchange_name(self) -> str:
+        return self._local_tracker.exchange_name
+
+    @property
+    def worker_rate_limit(self) -> RateLimit:
+        """
+        Snapshot request rate limit of each worker's throttler.
+        """
+        return self._worker_rate_limit
+
+    def is_order_book_healthy(self, trading_pair: str) -> bool:
+        return self.is_order_book_ready(trading_pair) and self._healthy.get(trading_pair, False)
+
+    def get_tracking_metrics(self, trading_pairs: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Tracking metrics last reported by the workers, up to METRICS_INTERVAL old.
+        """
+        if trading_pairs is None:
+            trading_pairs = list(self._order_books.keys())
+        return {trading_pair: self._worker_metrics[trading_pair]
+                for trading_pair in trading_pairs
+                if trading_pair in self._worker_metrics}
+
+    def set_price_increments(self, price_increments: Dict[str, Decimal]):
+        # Kept for books mirrored after this call.
+        self._price_increments.update(price_increments)
+        super().set_price_increments(price_increments)
+
+    def start(self):
+        self.stop()
+        self._trade_queue = self._mp_context.Queue()
+        self._metrics_queue = self._mp_context.Queue()
+        self._shards = []
+        for shard_index in range(self._process_count):
+            trading_pairs: List[str] = self._trading_pairs[shard_index::self._process_count]
+            shared_array = self._mp_context.RawArray("d", len(trading_pairs) * slot_size(self._depth))
+            self._shards.append((trading_pairs, shared_array))
+            self._processes.append(self._start_worker(trading_pairs, shared_array))
+        self._sync_task = safe_ensure_future(self._sync_loop())
+
+    def _start_worker(self, trading_pairs: List[str], shared_array) -> multiprocessing.Process:
+        process: multiprocessing.Process = self._mp_context.Process(
+            target=run_worker,
+            args=(self._tracker_factory, trading_pairs, shared_array, self._depth, self._publish_interval,
+                  self._trade_queue, self._metrics_queue, self._worker_rate_limit),
+            daemon=True
+        )
+        process.start()
+        return process
+
+    def stop(self):
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+        super().stop()
+
+    def _sync_order_books(self,
+                          slots: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray]],
+                          synced_sequences: Dict[str, float],
+                          synced_versions: Dict[str, float]):
+        for trading_pair, header, bids, asks in slots:
+            if header[SEQUENCE] == synced_sequences.get(trading_pair, 0):
+                continue
+            rows_changed: bool = header[BOOK_VERSION] != synced_versions.get(trading_pair, 0)
+            published: Optional[Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]] = read_order_book(
+                header, bids, asks, copy_rows=rows_changed
+            )
+            if published is None:
+                continue
+            header_copy, bids_copy, asks_copy = published
+            if header_copy[BOOK_VERSION] != synced_versions.get(trading_pair, 0) and not rows_changed:
+                # The rows changed after the first check, copy them on the next pass.
+                continue
+            order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+            if order_book is None:
+                order_book = self._order_books[trading_pair] = OrderBook(flat=True)
+                if trading_pair in self._price_increments:
+                    order_book.price_increment = float(self._price_increments[trading_pair])
+            if rows_changed:
+                order_book.apply_numpy_snapshot(bids_copy, asks_copy)
+                synced_versions[trading_pair] = header_copy[BOOK_VERSION]
+            order_book.last_trade_price = header_copy[LAST_TRADE_PRICE]
+            self._healthy[trading_pair] = bool(header_copy[HEALTHY])
+            synced_sequences[trading_pair] = header_copy[SEQUENCE]
+            if not self._order_book_ready_events[trading_pair].is_set():
+                self._order_book_ready_events[trading_pair].set()
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{len(self._order_books)}/{len(self._trading_pairs)} completed.")
+                if len(self._order_books) == len(self._trading_pairs):
+                    self._order_books_initialized.set()
+
+    def _forward_trades(self):
+        while True:
+            try:
+                trade_event: OrderBookTradeEvent = self._trade_queue.get_nowait()
+            except queue.Empty:
+                return
+            order_book: Optional[OrderBook] = self._order_books.get(trade_event.trading_pair)
+            if order_book is not None:
+                order_book.apply_trade(trade_event)
+
+    def _update_worker_metrics(self):
+        while True:
+            try:
+                self._worker_metrics.update(self._metrics_queue.get_nowait())
+            except queue.Empty:
+                return
+
+    async def _sync_loop(self):
+        slots: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray]] = [
+            (trading_pair,) + slot_views(shared_array, index, self._depth)
+            for trading_pairs, shared_array in self._shards
+            for index, trading_pair in enumerate(trading_pairs)
+        ]
+        synced_sequences: Dict[str, float] = {}
+        synced_versions: Dict[str, float] = {}
+        while True:
+            try:
+                self._sync_order_books(slots, synced_sequences, synced_versions)
+                self._forward_trades()
+                self._update_worker_metrics()
+                for shard_index, process in enumerate(self._processes):
+                    if not process.is_alive():
+                        # The restarted worker fetches new snapshots, and overwrites the shard's slots once ready.
+                        self.logger().error(f"Order book worker process {process.pid} exited with code "
+                                            f"{process.exitcode}. Restarting it.")
+                        self._processes[shard_index] = self._start_worker(*self._shards[shard_index])
+                await asyncio.sleep(self._publish_interval)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error syncing order books from worker processes.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error syncing order books from worker processes. "
+                                    "Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
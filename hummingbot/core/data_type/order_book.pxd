@@ -3,7 +3,10 @@
 from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
-from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry, PriceGrid
+from hummingbot.core.data_type.OrderBookDepth cimport OrderBookDepthIndex
+from hummingbot.core.data_type.OrderBookFlatSide cimport OrderBookFlatSide
+from hummingbot.core.data_type.OrderBookMetrics cimport OrderBookMetrics
 from hummingbot.core.pubsub cimport PubSub
 from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
@@ -12,6 +15,13 @@ cimport numpy as np
 cdef class OrderBook(PubSub):
     cdef set[OrderBookEntry] _bid_book
     cdef set[OrderBookEntry] _ask_book
+    cdef OrderBookFlatSide _flat_bid_book
+    cdef OrderBookFlatSide _flat_ask_book
+    cdef bint _flat
+    cdef size_t _max_depth
+    cdef double _max_mid_distance
+    cdef double _bid_trim_price
+    cdef double _ask_trim_price
     cdef int64_t _snapshot_uid
     cdef int64_t _last_diff_uid
     cdef double _best_bid
@@ -20,9 +30,19 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef bint _depth_index_enabled
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
+    cdef bint _metrics_enabled
+    cdef OrderBookMetrics _metrics
+    cdef PriceGrid _price_grid
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_flat_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_apply_flat_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
+    cdef c_trim_depth(self)
+    cdef c_notify_best_price_change(self, double previous_best_bid, double previous_best_ask, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
@@ -31,9 +51,28 @@ cdef class OrderBook(PubSub):
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef double c_get_price(self, bint is_buy) except? -1
+    cdef Py_ssize_t c_copy_entries(self, bint is_buy, double[:, ::1] buffer) except -1
+    cdef set[OrderBookEntry] *c_get_query_book(self, bint is_buy)
+    cdef OrderBookFlatSide *c_get_flat_side(self, bint is_buy)
+    cdef size_t c_get_side_size(self, bint is_buy)
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy)
+    cdef OrderBookMetrics *c_get_metrics(self)
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price)
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount)
+    cdef Py_ssize_t c_apply_diff_rows(self, const double[:, ::1] diff_rows, int64_t min_update_id) except -1
+
+
+cdef class OrderBookDiffRing:
+    cdef object _rows
+    cdef double[:, ::1] _rows_view
+    cdef Py_ssize_t _capacity
+    cdef Py_ssize_t _start
+    cdef Py_ssize_t _size
+    cdef object _diff_rows
+
+    cdef c_evict_for(self, Py_ssize_t row_count)
+    cdef c_append_row(self, double side, double price, double amount, double update_id)
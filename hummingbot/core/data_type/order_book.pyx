@@ -1,15 +1,38 @@
 # distutils: language=c++
-# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+# distutils: sources=['hummingbot/core/cpp/OrderBookEntry.cpp', 'hummingbot/core/cpp/OrderBookDepth.cpp', 'hummingbot/core/cpp/OrderBookFlatSide.cpp', 'hummingbot/core/cpp/OrderBookMetrics.cpp']
 from cython.operator cimport(
     postincrement as inc,
     dereference as deref,
     address as ref
 )
-from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
+from libc.math cimport INFINITY, isnan
+from hummingbot.core.data_type.OrderBookEntry cimport (
+    LevelChange,
+    LevelUnchanged,
+    LevelInserted,
+    LevelUpdated,
+    LevelDeleted,
+    PriceGrid,
+    truncateOverlapEntries,
+    trimOrderBookSide
+)
+from hummingbot.core.data_type.OrderBookFlatSide cimport truncateOverlapEntriesFlat
+from hummingbot.core.data_type.OrderBookDepth cimport (
+    DepthQueryResult,
+    OrderBookDepthIndex,
+    getPriceForVolume,
+    getVWAPForVolume,
+    getPriceForQuoteVolume,
+    getQuoteVolumeForBaseAmount,
+    getVolumeForPrice,
+    getQuoteVolumeForPrice
+)
+from hummingbot.core.data_type.OrderBookMetrics cimport OrderBookMetrics
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
-    OrderBookTradeEvent
+    OrderBookTradeEvent,
+    OrderBookBestPriceChangeEvent
 )
 from typing import (
     List,
@@ -27,14 +50,58 @@ from .order_book_row import OrderBookRow
 from .order_book_query_result import OrderBookQueryResult
 from sqlalchemy.engine import RowProxy
 import bisect
+from collections import deque
 import logging
 cimport numpy as np
+from cpython.ref cimport PyObject
 ob_logger = None
 NaN = float("nan")
+cdef double DIFF_ROW_BID = 0
+cdef double DIFF_ROW_ASK = 1
+
+# Rough heap cost of one std::set level: the entry, the red-black tree node header and the allocator overhead.
+cdef size_t SET_LEVEL_BYTES = sizeof(OrderBookEntry) + 48
+cdef int64_t BEST_PRICE_CHANGE_EVENT_TAG = OrderBookEvent.BestPriceChangeEvent.value
+
+
+cdef extern from "Python.h":
+    const char *PyUnicode_AsUTF8(object unicode) except NULL
+    double PyOS_string_to_double(const char *s, char **endptr, PyObject *overflow_exception) except? -1.0
+
+
+cdef inline double c_parse_raw_number(object value) except? -1.0:
+    # Exchanges send prices and amounts as decimal strings. Parse them in C, like float() does, without creating
+    # intermediate float objects. Anything else still goes through float().
+    if type(value) is str:
+        return PyOS_string_to_double(PyUnicode_AsUTF8(value), NULL, NULL)
+    return float(value)
+
+
+cdef inline LevelChange c_get_level_change(bint found, double amount):
+    if amount > 0:
+        return LevelUpdated if found else LevelInserted
+    return LevelDeleted if found else LevelUnchanged
+
+
+cdef inline void c_snap_prices(vector[OrderBookEntry] &entries, const PriceGrid &grid):
+    cdef:
+        size_t i
+    for i in range(entries.size()):
+        entries[i].snapPrice(grid)
+
+
+cdef vector[OrderBookEntry] c_parse_raw_entries(object rows, int64_t update_id) except *:
+    cdef:
+        vector[OrderBookEntry] entries
+    entries.reserve(len(rows))
+    for row in rows:
+        entries.push_back(OrderBookEntry(c_parse_raw_number(row[0]), c_parse_raw_number(row[1]), update_id))
+    return entries
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_BEST_PRICE_CHANGE_EVENT_TAG = OrderBookEvent.BestPriceChangeEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -43,7 +110,17 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, flat=False, max_depth=0, max_mid_distance=0.0, price_increment=0.0):
+        """
+        :param dex: resolve crossed levels by quote volume instead of recency
+        :param flat: keep each side in a sorted vector instead of a tree. Faster on books whose updates concentrate
+                     near the top, like most CEX depth streams.
+        :param max_depth: keep at most this many levels per side, 0 for no limit
+        :param max_mid_distance: drop levels further than this fraction away from the mid price, 0 for no limit
+        :param price_increment: snap incoming prices to this tick size, usually the trading rule's
+                                min_price_increment, and key levels by their int64 tick. 0 to keep prices as
+                                received.
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -52,6 +129,20 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._flat = flat
+        self._flat_bid_book = OrderBookFlatSide(True)
+        self._flat_ask_book = OrderBookFlatSide(False)
+        self._max_depth = max_depth
+        self._max_mid_distance = max_mid_distance
+        self._bid_trim_price = self._ask_trim_price = NaN
+        self._depth_index_enabled = False
+        self._bid_depth_index = OrderBookDepthIndex(False)
+        self._ask_depth_index = OrderBookDepthIndex(True)
+        self._metrics_enabled = False
+        self._metrics = OrderBookMetrics(5)
+        self._price_grid = PriceGrid(price_increment)
+        self._bid_depth_index.setPriceGrid(self._price_grid)
+        self._ask_depth_index.setPriceGrid(self._price_grid)
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -62,23 +153,57 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            size_t bid_book_size
+            size_t ask_book_size
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        if self._price_grid.isEnabled():
+            c_snap_prices(bids, self._price_grid)
+            c_snap_prices(asks, self._price_grid)
+        if self._flat:
+            self.c_apply_flat_diffs(bids, asks, update_id)
+            return
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
+            if bid.getPrice() <= self._bid_trim_price:
+                continue
             result = self._bid_book.find(bid)
             if result != bid_book_end:
                 self._bid_book.erase(result)
+            if self._metrics_enabled:
+                self._metrics.recordChange(True, bid.getPrice(),
+                                           c_get_level_change(result != bid_book_end, bid.getAmount()))
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
+            if self._depth_index_enabled:
+                self._bid_depth_index.invalidate(bid.getPrice())
         for ask in asks:
+            if ask.getPrice() >= self._ask_trim_price:
+                continue
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
+            if self._metrics_enabled:
+                self._metrics.recordChange(False, ask.getPrice(),
+                                           c_get_level_change(result != ask_book_end, ask.getAmount()))
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
+            if self._depth_index_enabled:
+                self._ask_depth_index.invalidate(ask.getPrice())
 
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
+        bid_book_size = self._bid_book.size()
+        ask_book_size = self._ask_book.size()
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
+        # Truncation removes levels from the top of the book, outside of the prices touched by the diffs.
+        if self._bid_book.size() != bid_book_size:
+            self._bid_depth_index.invalidateAll()
+            self._metrics.invalidate()
+        if self._ask_book.size() != ask_book_size:
+            self._ask_depth_index.invalidateAll()
+            self._metrics.invalidate()
 
         # Record the current best prices, for faster c_get_price() calls.
         bid_iterator = self._bid_book.rbegin()
@@ -90,8 +215,13 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        self.c_trim_depth()
+        if self._metrics_enabled:
+            self._metrics.update(self._bid_book, self._ask_book)
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
+        self.c_notify_best_price_change(previous_best_bid, previous_best_ask, update_id)
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -101,8 +231,18 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        if self._price_grid.isEnabled():
+            c_snap_prices(bids, self._price_grid)
+            c_snap_prices(asks, self._price_grid)
+        if self._flat:
+            self.c_apply_flat_snapshot(bids, asks, update_id)
+            return
 
         # Start with an empty order book, and then insert all entries.
+        self._bid_trim_price = self._ask_trim_price = NaN
         self._bid_book.clear()
         self._ask_book.clear()
         for bid in bids:
@@ -130,8 +270,136 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        self._bid_depth_index.invalidateAll()
+        self._ask_depth_index.invalidateAll()
+        self._metrics.invalidate()
+        self.c_trim_depth()
+        if self._metrics_enabled:
+            self._metrics.update(self._bid_book, self._ask_book)
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
+        self.c_notify_best_price_change(previous_best_bid, previous_best_ask, update_id)
+
+    cdef c_apply_flat_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            size_t bid_book_size
+            size_t ask_book_size
+            LevelChange level_change
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        for bid in bids:
+            if bid.getPrice() <= self._bid_trim_price:
+                continue
+            level_change = self._flat_bid_book.applyDiff(bid)
+            if self._metrics_enabled:
+                self._metrics.recordChange(True, bid.getPrice(), level_change)
+            if self._depth_index_enabled:
+                self._bid_depth_index.invalidate(bid.getPrice())
+        for ask in asks:
+            if ask.getPrice() >= self._ask_trim_price:
+                continue
+            level_change = self._flat_ask_book.applyDiff(ask)
+            if self._metrics_enabled:
+                self._metrics.recordChange(False, ask.getPrice(), level_change)
+            if self._depth_index_enabled:
+                self._ask_depth_index.invalidate(ask.getPrice())
+
+        bid_book_size = self._flat_bid_book.size()
+        ask_book_size = self._flat_ask_book.size()
+        truncateOverlapEntriesFlat(self._flat_bid_book, self._flat_ask_book, self._dex)
+        if self._flat_bid_book.size() != bid_book_size:
+            self._bid_depth_index.invalidateAll()
+            self._metrics.invalidate()
+        if self._flat_ask_book.size() != ask_book_size:
+            self._ask_depth_index.invalidateAll()
+            self._metrics.invalidate()
+
+        if not self._flat_bid_book.empty():
+            self._best_bid = self._flat_bid_book.top(0).getPrice()
+        if not self._flat_ask_book.empty():
+            self._best_ask = self._flat_ask_book.top(0).getPrice()
+
+        self.c_trim_depth()
+        if self._metrics_enabled:
+            self._metrics.update(self._flat_bid_book, self._flat_ask_book)
+        self._last_diff_uid = update_id
+        self.c_notify_best_price_change(previous_best_bid, previous_best_ask, update_id)
+
+    cdef c_apply_flat_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        self._bid_trim_price = self._ask_trim_price = NaN
+        self._flat_bid_book.assign(bids)
+        self._flat_ask_book.assign(asks)
+        if self._dex:
+            truncateOverlapEntriesFlat(self._flat_bid_book, self._flat_ask_book, self._dex)
+
+        self._best_bid = NaN if self._flat_bid_book.empty() else self._flat_bid_book.top(0).getPrice()
+        self._best_ask = NaN if self._flat_ask_book.empty() else self._flat_ask_book.top(0).getPrice()
+
+        self._bid_depth_index.invalidateAll()
+        self._ask_depth_index.invalidateAll()
+        self._metrics.invalidate()
+        self.c_trim_depth()
+        if self._metrics_enabled:
+            self._metrics.update(self._flat_bid_book, self._flat_ask_book)
+
+        self._snapshot_uid = update_id
+        self.c_notify_best_price_change(previous_best_bid, previous_best_ask, update_id)
+
+    cdef c_notify_best_price_change(self, double previous_best_bid, double previous_best_ask, int64_t update_id):
+        # NaN marks an empty side, and should compare equal to itself here.
+        if ((previous_best_bid == self._best_bid or (isnan(previous_best_bid) and isnan(self._best_bid))) and
+                (previous_best_ask == self._best_ask or (isnan(previous_best_ask) and isnan(self._best_ask)))):
+            return
+        # Most books have no listeners for this event, don't build the event object for them.
+        if self._events.find(BEST_PRICE_CHANGE_EVENT_TAG) == self._events.end():
+            return
+        self.c_trigger_event(BEST_PRICE_CHANGE_EVENT_TAG,
+                             OrderBookBestPriceChangeEvent(time.time(), update_id, self._best_bid, self._best_ask))
+
+    cdef c_trim_depth(self):
+        """
+        Drops the levels beyond the configured depth limits. The trimmed region is no longer tracked: the best trimmed
+        price of each side is remembered, and diffs at or beyond it are ignored until the next snapshot refills the
+        book. Otherwise a later diff could resurrect a far level next to gaps left by levels that were dropped.
+        """
+        cdef:
+            double bid_worst_price = -INFINITY
+            double ask_worst_price = INFINITY
+            double mid_price
+            double bid_trimmed_price
+            double ask_trimmed_price
+
+        if self._max_depth == 0 and self._max_mid_distance <= 0:
+            return
+        if self._max_mid_distance > 0 and not (isnan(self._best_bid) or isnan(self._best_ask)):
+            mid_price = (self._best_bid + self._best_ask) / 2
+            bid_worst_price = mid_price * (1 - self._max_mid_distance)
+            ask_worst_price = mid_price * (1 + self._max_mid_distance)
+
+        if self._flat:
+            bid_trimmed_price = self._flat_bid_book.trim(self._max_depth, bid_worst_price)
+            ask_trimmed_price = self._flat_ask_book.trim(self._max_depth, ask_worst_price)
+        else:
+            bid_trimmed_price = trimOrderBookSide(self._bid_book, True, self._max_depth, bid_worst_price)
+            ask_trimmed_price = trimOrderBookSide(self._ask_book, False, self._max_depth, ask_worst_price)
+
+        if not isnan(bid_trimmed_price):
+            if not (bid_trimmed_price <= self._bid_trim_price):
+                self._bid_trim_price = bid_trimmed_price
+            self._bid_depth_index.invalidate(bid_trimmed_price)
+            self._metrics.invalidate()
+        if not isnan(ask_trimmed_price):
+            if not (ask_trimmed_price >= self._ask_trim_price):
+                self._ask_trim_price = ask_trimmed_price
+            self._ask_depth_index.invalidate(ask_trimmed_price)
+            self._metrics.invalidate()
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -158,6 +426,197 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def flat(self) -> bool:
+        return self._flat
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @max_depth.setter
+    def max_depth(self, size_t value):
+        self._max_depth = value
+        self.c_trim_depth()
+
+    @property
+    def max_mid_distance(self) -> float:
+        return self._max_mid_distance
+
+    @max_mid_distance.setter
+    def max_mid_distance(self, double value):
+        self._max_mid_distance = value
+        self.c_trim_depth()
+
+    @property
+    def trimmed_prices(self) -> Tuple[float, float]:
+        """
+        Best bid and ask prices dropped by the depth limits since the last snapshot, NaN for untrimmed sides. The
+        book is only known up to, and excluding, these prices.
+        """
+        return self._bid_trim_price, self._ask_trim_price
+
+    @property
+    def level_counts(self) -> Tuple[int, int]:
+        return self.c_get_side_size(False), self.c_get_side_size(True)
+
+    @property
+    def estimated_memory_bytes(self) -> int:
+        """
+        Approximate heap memory held by the book's levels, including the depth index if enabled.
+        """
+        cdef:
+            size_t level_bytes
+        if self._flat:
+            level_bytes = (self._flat_bid_book.capacity() + self._flat_ask_book.capacity()) * sizeof(OrderBookEntry)
+        else:
+            level_bytes = (self._bid_book.size() + self._ask_book.size()) * SET_LEVEL_BYTES
+        # Per indexed level: price key, price and the two prefix sums.
+        return level_bytes + (self._bid_depth_index.size() + self._ask_depth_index.size()) * 4 * sizeof(double)
+
+    @property
+    def depth_index_enabled(self) -> bool:
+        return self._depth_index_enabled
+
+    @depth_index_enabled.setter
+    def depth_index_enabled(self, bint value):
+        """
+        Maintains cumulative base and quote volumes per level, so depth queries become binary searches. Worth enabling
+        on books that are queried many times between updates.
+        """
+        self._depth_index_enabled = value
+        self._bid_depth_index.invalidateAll()
+        self._ask_depth_index.invalidateAll()
+
+    @property
+    def price_increment(self) -> float:
+        return self._price_grid.getIncrement()
+
+    @price_increment.setter
+    def price_increment(self, double value):
+        """
+        Snaps prices to a tick grid, including the levels already in the book, and keys levels by their int64 tick:
+        lookups and ordering in both backends and the depth index then compare integers. Levels that land on the same
+        tick are merged, keeping the first one. 0 keeps prices as received.
+        """
+        cdef:
+            vector[OrderBookEntry] bids
+            vector[OrderBookEntry] asks
+            double bid_trim_price = self._bid_trim_price
+            double ask_trim_price = self._ask_trim_price
+            size_t i
+        if value == self._price_grid.getIncrement():
+            return
+        self._price_grid = PriceGrid(value)
+        self._bid_depth_index.setPriceGrid(self._price_grid)
+        self._ask_depth_index.setPriceGrid(self._price_grid)
+        if self._flat:
+            for i in range(self._flat_bid_book.size()):
+                bids.push_back(self._flat_bid_book.top(i))
+            for i in range(self._flat_ask_book.size()):
+                asks.push_back(self._flat_ask_book.top(i))
+        else:
+            for entry in self._bid_book:
+                bids.push_back(entry)
+            for entry in self._ask_book:
+                asks.push_back(entry)
+        # Rekeys the levels even when the grid is removed, which c_apply_snapshot() skips.
+        c_snap_prices(bids, self._price_grid)
+        c_snap_prices(asks, self._price_grid)
+        self.c_apply_snapshot(bids, asks, self._snapshot_uid)
+        self._bid_trim_price = bid_trim_price
+        self._ask_trim_price = ask_trim_price
+
+    def price_to_ticks(self, double price) -> int:
+        """
+        Integer tick index of a price on the book's price grid.
+        """
+        if not self._price_grid.isEnabled():
+            raise ValueError("Order book has no price increment.")
+        return self._price_grid.toTicks(price)
+
+    def ticks_to_price(self, int64_t ticks) -> float:
+        if not self._price_grid.isEnabled():
+            raise ValueError("Order book has no price increment.")
+        return self._price_grid.fromTicks(ticks)
+
+    @property
+    def metrics_enabled(self) -> bool:
+        return self._metrics_enabled
+
+    @metrics_enabled.setter
+    def metrics_enabled(self, bint value):
+        """
+        Keeps the microstructure metrics up to date as the book is updated, so reading them costs nothing. Without it,
+        every read re-sums the top metrics_depth levels.
+        """
+        self._metrics_enabled = value
+        self._metrics.invalidate()
+        self.c_get_metrics()
+
+    @property
+    def metrics_depth(self) -> int:
+        return self._metrics.getDepth()
+
+    @metrics_depth.setter
+    def metrics_depth(self, int value):
+        """
+        Number of levels per side that imbalance and weighted mid price are computed over.
+        """
+        if value < 1:
+            raise ValueError(f"Metrics depth must be at least 1, got {value}.")
+        self._metrics.setDepth(value)
+        self.c_get_metrics()
+
+    cdef OrderBookMetrics *c_get_metrics(self):
+        if not self._metrics_enabled:
+            self._metrics.invalidate()
+        if self._metrics.isDirty():
+            if self._flat:
+                self._metrics.update(self._flat_bid_book, self._flat_ask_book)
+            else:
+                self._metrics.update(self._bid_book, self._ask_book)
+        return &self._metrics
+
+    def get_imbalance(self) -> float:
+        """
+        (bid volume - ask volume) / (bid volume + ask volume) over the top metrics_depth levels, from -1 to 1.
+        """
+        return deref(self.c_get_metrics()).getImbalance()
+
+    def get_micro_price(self) -> float:
+        """
+        Best bid and best ask weighted by the amount resting on the opposite side of the top level.
+        """
+        return deref(self.c_get_metrics()).getMicroPrice()
+
+    def get_weighted_mid_price(self) -> float:
+        """
+        Average prices of the top metrics_depth levels of each side, weighted by the opposite side's volume.
+        """
+        return deref(self.c_get_metrics()).getWeightedMidPrice()
+
+    def get_spread_bps(self) -> float:
+        return deref(self.c_get_metrics()).getSpreadBps()
+
+    @property
+    def level_change_counts(self) -> Dict[str, Dict[str, int]]:
+        """
+        Number of levels inserted, updated and deleted by diffs on each side since metrics were enabled or the counts
+        were last reset.
+        """
+        return {
+            side: {
+                "inserted": self._metrics.getLevelChanges(is_bid, LevelInserted),
+                "updated": self._metrics.getLevelChanges(is_bid, LevelUpdated),
+                "deleted": self._metrics.getLevelChanges(is_bid, LevelDeleted)
+            }
+            for side, is_bid in (("bids", True), ("asks", False))
+        }
+
+    def reset_level_change_counts(self):
+        self._metrics.resetLevelChanges()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -168,12 +627,74 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.to_numpy()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, copy=False)
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, copy=False)
         return bids_df, asks_df
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exports the book as two contiguous float64 arrays of [price, amount, update_id] rows, best price first.
+
+        :param depth: maximum number of levels per side, or None for the whole book
+        :return: (bids, asks) arrays
+        """
+        cdef:
+            size_t bid_rows = self.c_get_side_size(False)
+            size_t ask_rows = self.c_get_side_size(True)
+        if depth is not None:
+            bid_rows = min(bid_rows, <size_t>max(depth, 0))
+            ask_rows = min(ask_rows, <size_t>max(depth, 0))
+        bids_array = np.empty((bid_rows, 3), dtype="float64")
+        asks_array = np.empty((ask_rows, 3), dtype="float64")
+        self.c_copy_entries(False, bids_array)
+        self.c_copy_entries(True, asks_array)
+        return bids_array, asks_array
+
+    def to_numpy_into(self, bids_buffer: np.ndarray, asks_buffer: np.ndarray) -> Tuple[int, int]:
+        """
+        Same as to_numpy(), but fills caller owned C contiguous float64 (n, 3) buffers, so repeated exports don't
+        allocate. Each side is filled up to the buffer's row count.
+
+        :return: number of bid and ask rows written
+        """
+        return self.c_copy_entries(False, bids_buffer), self.c_copy_entries(True, asks_buffer)
+
+    cdef Py_ssize_t c_copy_entries(self, bint is_buy, double[:, ::1] buffer) except -1:
+        cdef:
+            OrderBookFlatSide *flat_side = self.c_get_flat_side(is_buy)
+            set[OrderBookEntry] *book = self.c_get_query_book(is_buy)
+            set[OrderBookEntry].iterator it = deref(book).begin()
+            set[OrderBookEntry].reverse_iterator rit = deref(book).rbegin()
+            Py_ssize_t rows = 0
+            Py_ssize_t max_rows = buffer.shape[0]
+            OrderBookEntry entry
+
+        if buffer.shape[1] != 3:
+            raise ValueError(f"Order book buffers must have 3 columns, got {buffer.shape[1]}.")
+        if flat_side != NULL:
+            max_rows = min(max_rows, <Py_ssize_t>deref(flat_side).size())
+        with nogil:
+            while rows < max_rows:
+                if flat_side != NULL:
+                    entry = deref(flat_side).top(rows)
+                # The ask side is walked from the lowest price up, the bid side from the highest price down.
+                elif is_buy:
+                    if it == deref(book).end():
+                        break
+                    entry = deref(it)
+                    inc(it)
+                else:
+                    if rit == deref(book).rend():
+                        break
+                    entry = deref(rit)
+                    inc(rit)
+                buffer[rows, 0] = entry.getPrice()
+                buffer[rows, 1] = entry.getAmount()
+                buffer[rows, 2] = <double>entry.getUpdateId()
+                rows += 1
+        return rows
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -184,6 +705,13 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_raw_diffs(self, bids: List[List[str]], asks: List[List[str]], int64_t update_id):
+        """
+        Applies diffs in the exchange's raw [[price, amount, ...], ...] form, e.g. straight from a diff message's
+        content, without building OrderBookRow lists first.
+        """
+        self.c_apply_diffs(c_parse_raw_entries(bids, update_id), c_parse_raw_entries(asks, update_id), update_id)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -263,6 +791,13 @@ cdef class OrderBook(PubSub):
         cdef:
             set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
             OrderBookEntry entry
+            size_t depth = 0
+        if self._flat:
+            while depth < self._flat_bid_book.size():
+                entry = self._flat_bid_book.top(depth)
+                yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+                depth += 1
+            return
         while it != self._bid_book.rend():
             entry = deref(it)
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
@@ -272,6 +807,13 @@ cdef class OrderBook(PubSub):
         cdef:
             set[OrderBookEntry].iterator it = self._ask_book.begin()
             OrderBookEntry entry
+            size_t depth = 0
+        if self._flat:
+            while depth < self._flat_ask_book.size():
+                entry = self._flat_ask_book.top(depth)
+                yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+                depth += 1
+            return
         while it != self._ask_book.end():
             entry = deref(it)
             yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
@@ -306,153 +848,142 @@ cdef class OrderBook(PubSub):
         return retval
 
     cdef double c_get_price(self, bint is_buy) except? -1:
-        cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
-        if deref(book).size() < 1:
+        if self.c_get_side_size(is_buy) < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
         return self._best_ask if is_buy else self._best_bid
 
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
 
-    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+    cdef set[OrderBookEntry] *c_get_query_book(self, bint is_buy):
+        """
+        Returns the book side that depth queries walk - the ask book for buys and the bid book for sells. Subclasses
+        that present adjusted entries through bid_entries() / ask_entries() override this to return the adjusted side.
+        """
+        return ref(self._ask_book) if is_buy else ref(self._bid_book)
+
+    cdef OrderBookFlatSide *c_get_flat_side(self, bint is_buy):
+        """
+        Returns the side walked by depth queries if the book uses the flat backend, NULL otherwise.
+        """
+        if not self._flat:
+            return NULL
+        return ref(self._flat_ask_book) if is_buy else ref(self._flat_bid_book)
+
+    cdef size_t c_get_side_size(self, bint is_buy):
+        cdef:
+            OrderBookFlatSide *flat_side = self.c_get_flat_side(is_buy)
+        if flat_side != NULL:
+            return deref(flat_side).size()
+        return deref(self.c_get_query_book(is_buy)).size()
+
+    cdef OrderBookDepthIndex *c_get_depth_index(self, bint is_buy):
+        """
+        Returns the up to date cumulative depth index for the side walked by depth queries, or NULL if the index is
+        disabled.
+        """
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            OrderBookDepthIndex *depth_index = ref(self._ask_depth_index) if is_buy else ref(self._bid_depth_index)
+        if not self._depth_index_enabled:
+            return NULL
+        if self._flat:
+            deref(depth_index).update(deref(self.c_get_flat_side(is_buy)))
         else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            deref(depth_index).update(deref(self.c_get_query_book(is_buy)))
+        return depth_index
 
-        return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
+    cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume):
+        cdef:
+            set[OrderBookEntry] *book = self.c_get_query_book(is_buy)
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            OrderBookFlatSide *flat_side = self.c_get_flat_side(is_buy)
+            DepthQueryResult result
+        with nogil:
+            if depth_index != NULL:
+                result = deref(depth_index).getPriceForVolume(volume)
+            elif flat_side != NULL:
+                result = getPriceForVolume(deref(flat_side), is_buy, volume)
+            else:
+                result = getPriceForVolume(deref(book), is_buy, volume)
+        return OrderBookQueryResult(NaN, volume, result.price, min(result.volume, volume))
 
     cdef OrderBookQueryResult c_get_vwap_for_volume(self, bint is_buy, double volume):
         cdef:
-            double total_cost = 0
-            double total_volume = 0
-            double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-
-        return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
+            set[OrderBookEntry] *book = self.c_get_query_book(is_buy)
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            OrderBookFlatSide *flat_side = self.c_get_flat_side(is_buy)
+            DepthQueryResult result
+        if volume == 0 and self.c_get_side_size(is_buy) > 0:
+            # A zero volume VWAP is undefined. Callers like XEMM rely on this raising, as the generator walk did.
+            raise ZeroDivisionError("float division")
+        with nogil:
+            if depth_index != NULL:
+                result = deref(depth_index).getVWAPForVolume(volume)
+            elif flat_side != NULL:
+                result = getVWAPForVolume(deref(flat_side), is_buy, volume)
+            else:
+                result = getVWAPForVolume(deref(book), is_buy, volume)
+        return OrderBookQueryResult(NaN, volume, result.price, min(result.volume, volume))
 
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-
-        return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
+            set[OrderBookEntry] *book = self.c_get_query_book(is_buy)
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            OrderBookFlatSide *flat_side = self.c_get_flat_side(is_buy)
+            DepthQueryResult result
+        with nogil:
+            if depth_index != NULL:
+                result = deref(depth_index).getPriceForQuoteVolume(quote_volume)
+            elif flat_side != NULL:
+                result = getPriceForQuoteVolume(deref(flat_side), is_buy, quote_volume)
+            else:
+                result = getPriceForQuoteVolume(deref(book), is_buy, quote_volume)
+        return OrderBookQueryResult(NaN, quote_volume, result.price, min(result.volume, quote_volume))
 
     cdef OrderBookQueryResult c_get_quote_volume_for_base_amount(self, bint is_buy, double base_amount):
         cdef:
-            double cumulative_volume = 0
-            double cumulative_base_amount = 0
-            double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-
-        return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
+            set[OrderBookEntry] *book = self.c_get_query_book(is_buy)
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            OrderBookFlatSide *flat_side = self.c_get_flat_side(is_buy)
+            DepthQueryResult result
+        with nogil:
+            if depth_index != NULL:
+                result = deref(depth_index).getQuoteVolumeForBaseAmount(base_amount)
+            elif flat_side != NULL:
+                result = getQuoteVolumeForBaseAmount(deref(flat_side), is_buy, base_amount)
+            else:
+                result = getQuoteVolumeForBaseAmount(deref(book), is_buy, base_amount)
+        return OrderBookQueryResult(NaN, base_amount, NaN, result.volume)
 
     cdef OrderBookQueryResult c_get_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+            set[OrderBookEntry] *book = self.c_get_query_book(is_buy)
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            OrderBookFlatSide *flat_side = self.c_get_flat_side(is_buy)
+            DepthQueryResult result
+        with nogil:
+            if depth_index != NULL:
+                result = deref(depth_index).getVolumeForPrice(price)
+            elif flat_side != NULL:
+                result = getVolumeForPrice(deref(flat_side), is_buy, price)
+            else:
+                result = getVolumeForPrice(deref(book), is_buy, price)
+        return OrderBookQueryResult(price, NaN, result.price, result.volume)
 
     cdef OrderBookQueryResult c_get_quote_volume_for_price(self, bint is_buy, double price):
         cdef:
-            double cumulative_volume = 0
-            double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-
-        return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
+            set[OrderBookEntry] *book = self.c_get_query_book(is_buy)
+            OrderBookDepthIndex *depth_index = self.c_get_depth_index(is_buy)
+            OrderBookFlatSide *flat_side = self.c_get_flat_side(is_buy)
+            DepthQueryResult result
+        with nogil:
+            if depth_index != NULL:
+                result = deref(depth_index).getQuoteVolumeForPrice(price)
+            elif flat_side != NULL:
+                result = getQuoteVolumeForPrice(deref(flat_side), is_buy, price)
+            else:
+                result = getQuoteVolumeForPrice(deref(book), is_buy, price)
+        return OrderBookQueryResult(price, NaN, result.price, result.volume)
 
     def get_price_for_volume(self, is_buy: bool, volume: float) -> OrderBookQueryResult:
         return self.c_get_price_for_volume(is_buy, volume)
@@ -498,3 +1029,232 @@ cdef class OrderBook(PubSub):
         self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
         for diff in replay_diffs:
             self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+
+    def restore_from_snapshot_and_numpy_diffs(self, snapshot: OrderBookMessage, diff_rows: np.ndarray):
+        """
+        Same as restore_from_snapshot_and_diffs(), for past diffs kept as rows of an OrderBookDiffRing.
+        """
+        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.c_apply_diff_rows(diff_rows, snapshot.update_id)
+
+    def apply_numpy_diff_rows(self, diff_rows: np.ndarray, int64_t min_update_id=-1) -> int:
+        """
+        Applies float64 [side, price, amount, update_id] rows, see OrderBookDiffRing, as a single diff. Rows are
+        applied in order, so later rows for a price level overwrite earlier ones.
+
+        :param min_update_id: skip rows with an update id at or below this one, e.g. the ones a snapshot covers
+        :return: number of rows applied
+        """
+        return self.c_apply_diff_rows(diff_rows, min_update_id)
+
+    cdef Py_ssize_t c_apply_diff_rows(self, const double[:, ::1] diff_rows, int64_t min_update_id) except -1:
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            int64_t update_id
+            int64_t last_update_id = 0
+            Py_ssize_t i
+
+        if diff_rows.shape[1] != 4:
+            raise ValueError(f"Diff rows must have 4 columns, got {diff_rows.shape[1]}.")
+        for i in range(diff_rows.shape[0]):
+            update_id = <int64_t>diff_rows[i, 3]
+            if update_id <= min_update_id:
+                continue
+            if diff_rows[i, 0] == DIFF_ROW_BID:
+                cpp_bids.push_back(OrderBookEntry(diff_rows[i, 1], diff_rows[i, 2], update_id))
+            else:
+                cpp_asks.push_back(OrderBookEntry(diff_rows[i, 1], diff_rows[i, 2], update_id))
+            last_update_id = max(last_update_id, update_id)
+        if cpp_bids.size() + cpp_asks.size() > 0:
+            self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
+        return cpp_bids.size() + cpp_asks.size()
+
+
+cdef class OrderBookDiffRing:
+    """
+    The latest diff levels of a book, in a preallocated float64 array of [side, price, amount, update_id] rows, with
+    side 0 for bids and 1 for asks. Once full, a new diff evicts the oldest diffs as a whole until its rows fit, so
+    that no diff is replayed partially. A diff with more rows than the capacity grows the ring to fit it. Trackers
+    keep one per book to replay against snapshots, see OrderBook.restore_from_snapshot_and_numpy_diffs().
+
+    Update ids are stored as doubles, and are exact up to 2^53.
+    """
+    BID_SIDE = DIFF_ROW_BID
+    ASK_SIDE = DIFF_ROW_ASK
+
+    def __init__(self, Py_ssize_t capacity):
+        if capacity < 1:
+            raise ValueError(f"Diff ring capacity must be at least 1, got {capacity}.")
+        self._rows = np.zeros((capacity, 4), dtype=np.float64)
+        self._rows_view = self._rows
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+        # Row counts of the diffs in the ring, oldest first.
+        self._diff_rows = deque()
+
+    cdef c_evict_for(self, Py_ssize_t row_count):
+        cdef:
+            Py_ssize_t evicted
+        if row_count > self._capacity:
+            self._rows = np.zeros((row_count, 4), dtype=np.float64)
+            self._rows_view = self._rows
+            self._capacity = row_count
+            self.clear()
+            return
+        while self._capacity - self._size < row_count:
+            evicted = self._diff_rows.popleft()
+            self._start = (self._start + evicted) % self._capacity
+            self._size -= evicted
+
+    cdef c_append_row(self, double side, double price, double amount, double update_id):
+        cdef:
+            Py_ssize_t index = (self._start + self._size) % self._capacity
+        self._rows_view[index, 0] = side
+        self._rows_view[index, 1] = price
+        self._rows_view[index, 2] = amount
+        self._rows_view[index, 3] = update_id
+        if self._size < self._capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self._capacity
+
+    def append_levels(self, bids, asks, int64_t update_id):
+        """
+        Appends a diff's levels, given as [price, amount, ...] sequences like the exchange's raw lists or
+        OrderBookRows.
+        """
+        cdef:
+            Py_ssize_t row_count = len(bids) + len(asks)
+        if row_count == 0:
+            return
+        self.c_evict_for(row_count)
+        self._diff_rows.append(row_count)
+        for row in bids:
+            self.c_append_row(DIFF_ROW_BID, c_parse_raw_number(row[0]), c_parse_raw_number(row[1]), update_id)
+        for row in asks:
+            self.c_append_row(DIFF_ROW_ASK, c_parse_raw_number(row[0]), c_parse_raw_number(row[1]), update_id)
+
+    def clear(self):
+        self._start = self._size = 0
+        self._diff_rows.clear()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def update_ids(self) -> np.ndarray:
+        """
+        Distinct update ids in the ring, oldest first.
+        """
+        update_ids = self.to_numpy()[:, 3]
+        changes = np.flatnonzero(np.diff(update_ids)) + 1
+        return update_ids[np.concatenate(([0], changes))] if len(update_ids) > 0 else update_ids
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Copy of the rows, oldest first.
+        """
+        cdef:
+            Py_ssize_t end = self._start + self._size
+        if end <= self._capacity:
+            return self._rows[self._start:end].copy()
+        return np.concatenate((self._rows[self._start:], self._rows[:end - self._capacity]))
+
+
+cdef enum BatchDepthQuery:
+    BATCH_PRICE_FOR_VOLUME
+    BATCH_VWAP_FOR_VOLUME
+
+
+cdef tuple c_batch_depth_query(list order_books, object is_buy, object volumes, BatchDepthQuery query):
+    cdef:
+        Py_ssize_t query_count = len(order_books)
+        const np.uint8_t[:] is_buy_view = np.ascontiguousarray(is_buy, dtype=np.uint8)
+        const double[:] volumes_view = np.ascontiguousarray(volumes, dtype=np.float64)
+        np.ndarray[np.float64_t, ndim=1] result_prices = np.empty(query_count, dtype=np.float64)
+        np.ndarray[np.float64_t, ndim=1] result_volumes = np.empty(query_count, dtype=np.float64)
+        OrderBook order_book
+        set[OrderBookEntry] *book
+        OrderBookDepthIndex *depth_index
+        OrderBookFlatSide *flat_side
+        DepthQueryResult result
+        bint side
+        double volume
+        Py_ssize_t i
+
+    if is_buy_view.shape[0] != query_count or volumes_view.shape[0] != query_count:
+        raise ValueError(f"Expected {query_count} sides and volumes, got {is_buy_view.shape[0]} and "
+                         f"{volumes_view.shape[0]}.")
+    for i in range(query_count):
+        if order_books[i] is None:
+            result_prices[i] = NaN
+            result_volumes[i] = 0
+            continue
+        order_book = order_books[i]
+        side = is_buy_view[i]
+        volume = volumes_view[i]
+        book = order_book.c_get_query_book(side)
+        depth_index = order_book.c_get_depth_index(side)
+        flat_side = order_book.c_get_flat_side(side)
+        with nogil:
+            if query == BATCH_PRICE_FOR_VOLUME:
+                if depth_index != NULL:
+                    result = deref(depth_index).getPriceForVolume(volume)
+                elif flat_side != NULL:
+                    result = getPriceForVolume(deref(flat_side), side, volume)
+                else:
+                    result = getPriceForVolume(deref(book), side, volume)
+            else:
+                if depth_index != NULL:
+                    result = deref(depth_index).getVWAPForVolume(volume)
+                elif flat_side != NULL:
+                    result = getVWAPForVolume(deref(flat_side), side, volume)
+                else:
+                    result = getVWAPForVolume(deref(book), side, volume)
+        result_prices[i] = result.price
+        result_volumes[i] = min(result.volume, volume)
+    return result_prices, result_volumes
+
+
+def get_batch_mid_prices(list order_books) -> np.ndarray:
+    """
+    Mid prices of many order books in one call. None entries and books with an empty side give NaN.
+    """
+    cdef:
+        Py_ssize_t i
+        OrderBook order_book
+        np.ndarray[np.float64_t, ndim=1] mid_prices = np.empty(len(order_books), dtype=np.float64)
+    for i in range(len(order_books)):
+        if order_books[i] is None:
+            mid_prices[i] = NaN
+            continue
+        order_book = order_books[i]
+        if order_book.c_get_side_size(True) < 1 or order_book.c_get_side_size(False) < 1:
+            mid_prices[i] = NaN
+        else:
+            mid_prices[i] = (order_book._best_bid + order_book._best_ask) / 2
+    return mid_prices
+
+
+def get_batch_prices_for_volume(list order_books, is_buy, volumes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batched OrderBook.get_price_for_volume(). The i-th query runs on order_books[i], with is_buy[i] and volumes[i].
+
+    :return: result prices and result volumes, NaN and 0 for None entries
+    """
+    return c_batch_depth_query(order_books, is_buy, volumes, BATCH_PRICE_FOR_VOLUME)
+
+
+def get_batch_vwaps_for_volume(list order_books, is_buy, volumes) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batched OrderBook.get_vwap_for_volume(). Unlike the single book query, a zero volume gives NaN instead of raising.
+
+    :return: result prices and result volumes, NaN and 0 for None entries
+    """
+    return c_batch_depth_query(order_books, is_buy, volumes, BATCH_VWAP_FOR_VOLUME)
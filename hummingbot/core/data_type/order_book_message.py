@@ -70,6 +70,17 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def raw_bids(self) -> List[List[any]]:
+        """
+        Bid levels as the exchange sent them, see OrderBook.apply_raw_diffs().
+        """
+        return self.content["bids"]
+
+    @property
+    def raw_asks(self) -> List[List[any]]:
+        return self.content["asks"]
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
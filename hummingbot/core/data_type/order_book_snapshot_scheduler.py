@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+import asyncio
+import logging
+import time
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set
+)
+
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.logger import HummingbotLogger
+
+SnapshotFetcher = Callable[[str], Awaitable[OrderBookMessage]]
+
+
+class OrderBookSnapshotScheduler:
+    """
+    Refreshes the order book snapshots of a data source's pairs. Every pair is refreshed once per refresh interval,
+    with the pairs spread evenly over the interval, and up to max_concurrent_requests requests run at once.
+
+    request_snapshot() moves a pair to the front, e.g. after a sequence gap, at most once until it's refreshed.
+    Otherwise overdue pairs go in order of their last refresh, so the stalest book is refreshed first. Requests go
+    through the exchange's throttler, see use_throttler(), so refreshes share its weight budget with trading.
+    """
+    _obss_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._obss_logger is None:
+            cls._obss_logger = logging.getLogger(__name__)
+        return cls._obss_logger
+
+    def __init__(self,
+                 trading_pairs: Optional[List[str]],
+                 refresh_interval: float = 3600.0,
+                 max_concurrent_requests: int = 4,
+                 retry_interval: float = 5.0):
+        self._refresh_interval: float = refresh_interval
+        self._max_concurrent_requests: int = max_concurrent_requests
+        self._retry_interval: float = retry_interval
+        # Conservative until the tracker shares the exchange's throttler.
+        self._throttler: Throttler = Throttler(rate_limit=(2, 1.0))
+        self._request_weight: int = 1
+        self._due_times: Dict[str, float] = {}
+        # Pairs requested out of turn, with the earliest time to request them, in request order.
+        self._requested: Dict[str, float] = {}
+        self._in_flight: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._wakeup: asyncio.Event = asyncio.Event()
+        trading_pairs = trading_pairs or []
+        now: float = time.time()
+        for index, trading_pair in enumerate(trading_pairs):
+            self._due_times[trading_pair] = now + refresh_interval * (index + 1) / len(trading_pairs)
+
+    @property
+    def due_times(self) -> Dict[str, float]:
+        """
+        Next scheduled refresh of every pair, in seconds since the epoch.
+        """
+        return dict(self._due_times)
+
+    def use_throttler(self, throttler: Throttler, request_weight: int):
+        """
+        :param throttler: the exchange's REST throttler
+        :param request_weight: throttler weight of one snapshot request
+        """
+        self._throttler = throttler
+        self._request_weight = request_weight
+
+    def add_trading_pair(self, trading_pair: str):
+        """
+        Refreshes a pair added at runtime, a refresh interval from now.
+        """
+        self._due_times.setdefault(trading_pair, time.time() + self._refresh_interval)
+        self._wakeup.set()
+
+    def request_snapshot(self, trading_pair: str):
+        """
+        Refreshes the pair as soon as a request slot is free, ahead of scheduled refreshes. Does nothing if the pair
+        is already requested or being refreshed.
+        """
+        if trading_pair in self._requested or trading_pair in self._in_flight:
+            return
+        self._requested[trading_pair] = time.time()
+        self._due_times.setdefault(trading_pair, time.time() + self._refresh_interval)
+        self._wakeup.set()
+
+    def is_snapshot_requested(self, trading_pair: str) -> bool:
+        return trading_pair in self._requested or trading_pair in self._in_flight
+
+    def _next_trading_pair(self, now: float) -> Optional[str]:
+        for trading_pair, not_before in self._requested.items():
+            if not_before <= now:
+                return trading_pair
+        overdue: List[str] = [trading_pair for trading_pair, due_time in self._due_times.items()
+                              if due_time <= now and trading_pair not in self._in_flight]
+        if len(overdue) == 0:
+            return None
+        return min(overdue, key=self._due_times.get)
+
+    def _next_wakeup(self, now: float) -> Optional[float]:
+        # With every request slot taken, the next finished request wakes the loop up.
+        if len(self._in_flight) >= self._max_concurrent_requests:
+            return None
+        times: List[float] = list(self._requested.values()) + [
+            due_time for trading_pair, due_time in self._due_times.items() if trading_pair not in self._in_flight
+        ]
+        return max(0.0, min(times) - now) if len(times) > 0 else None
+
+    async def _refresh(self, trading_pair: str, fetch_snapshot: SnapshotFetcher, output: asyncio.Queue):
+        try:
+            async with self._throttler.weighted_task(self._request_weight):
+                snapshot_message: OrderBookMessage = await fetch_snapshot(trading_pair)
+            output.put_nowait(snapshot_message)
+            self._due_times[trading_pair] = time.time() + self._refresh_interval
+            self.logger().debug(f"Saved order book snapshot for {trading_pair}")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._due_times[trading_pair] = time.time() + self._retry_interval
+            self.logger().network(
+                f"Unexpected error fetching the order book snapshot for {trading_pair}.",
+                exc_info=True,
+                app_warning_msg=f"Unexpected error fetching the order book snapshot for {trading_pair}. "
+                                f"Retrying after {self._retry_interval:.0f} seconds."
+            )
+        finally:
+            self._in_flight.discard(trading_pair)
+            self._wakeup.set()
+
+    async def run(self, fetch_snapshot: SnapshotFetcher, output: asyncio.Queue):
+        """
+        Puts refreshed snapshot messages into output, forever.
+
+        :param fetch_snapshot: coroutine function fetching a pair's snapshot message
+        """
+        try:
+            while True:
+                now: float = time.time()
+                while len(self._in_flight) < self._max_concurrent_requests:
+                    trading_pair: Optional[str] = self._next_trading_pair(now)
+                    if trading_pair is None:
+                        break
+                    self._requested.pop(trading_pair, None)
+                    self._in_flight.add(trading_pair)
+                    refresh_task: asyncio.Task = safe_ensure_future(
+                        self._refresh(trading_pair, fetch_snapshot, output)
+                    )
+                    self._refresh_tasks.add(refresh_task)
+                    refresh_task.add_done_callback(self._refresh_tasks.discard)
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self._next_wakeup(now))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for refresh_task in self._refresh_tasks:
+                refresh_task.cancel()
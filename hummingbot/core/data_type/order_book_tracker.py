@@ -1,26 +1,42 @@
 #!/usr/bin/env python
 import asyncio
 from abc import ABC
-from collections import deque
+from collections import deque, defaultdict
+from decimal import Decimal
 from enum import Enum
 import logging
+import numpy as np
 import pandas as pd
 import re
 from typing import (
+    Any,
     Dict,
     Deque,
     Optional,
     Tuple,
-    List)
+    List,
+    Sequence)
 import time
 from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
 from hummingbot.logger import HummingbotLogger
-from hummingbot.core.data_type.order_book import OrderBook
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.data_type.order_book import (
+    OrderBook,
+    OrderBookDiffRing,
+    get_batch_mid_prices,
+    get_batch_prices_for_volume,
+    get_batch_vwaps_for_volume
+)
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from .order_book_tracker_metrics import (
+    OrderBookTrackerPairMetrics,
+    ReceiveTimeQueue,
+)
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
 )
+from .order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 
 TRADING_PAIR_FILTER = re.compile(r"(BTC|ETH|USDT)$")
@@ -34,6 +50,20 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    # Diff levels kept per book to replay against snapshots, in trackers using the shared _track_single_book() logic.
+    PAST_DIFF_WINDOW_ROWS: int = 2048
+    # Throttler weight of one snapshot request. Trackers sharing their exchange's throttler set it in that
+    # throttler's units.
+    SNAPSHOT_REQUEST_WEIGHT: int = 1
+    # Snapshot requests per second without an exchange throttler, the pace of sequential initialization.
+    DEFAULT_SNAPSHOTS_PER_SECOND: int = 1
+    # Upper bound on the diff messages merged into one batch when a pair's queue has a backlog.
+    MAX_COALESCED_DIFFS: int = 256
+    # Whether diff messages chain their update ids, i.e. every diff's first_update_id is the previous diff's update_id
+    # plus one. Trackers of such exchanges resync a book from a new snapshot when diffs go missing.
+    SEQUENCE_GAP_DETECTION: bool = False
+    # Diff messages buffered per pair while it waits for its resync snapshot.
+    GAP_BUFFER_SIZE: int = 1000
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -42,16 +72,36 @@ class OrderBookTracker(ABC):
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 throttler: Optional[Throttler] = None):
+        """
+        :param throttler: the exchange's REST throttler, which bounds concurrent snapshot requests during
+                          initialization. A conservative private throttler is used if None.
+        """
         self._domain: Optional[str] = domain
+        # Throttler admits a request only if it leaves some capacity unused, hence the extra unit of weight.
+        self._throttler: Throttler = throttler or Throttler(
+            rate_limit=(self.DEFAULT_SNAPSHOTS_PER_SECOND * self.SNAPSHOT_REQUEST_WEIGHT + 1, 1.0)
+        )
         self._data_source: OrderBookTrackerDataSource = data_source
+        if self._data_source is not None:
+            self._data_source.snapshot_scheduler.use_throttler(self._throttler, self.SNAPSHOT_REQUEST_WEIGHT)
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        # Diff messages received before the pair's snapshot is ready.
+        self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
-        self._past_diffs_windows: Dict[str, Deque] = {}
-        self._order_book_diff_stream: asyncio.Queue = asyncio.Queue()
+        self._past_diffs_windows: Dict[str, OrderBookDiffRing] = {}
+        # Diff messages received since a sequence gap, for pairs waiting for a resync snapshot.
+        self._gap_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._pair_metrics: Dict[str, OrderBookTrackerPairMetrics] = defaultdict(OrderBookTrackerPairMetrics)
+        self._order_book_diff_stream: asyncio.Queue = ReceiveTimeQueue()
         self._order_book_snapshot_stream: asyncio.Queue = asyncio.Queue()
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
@@ -77,6 +127,59 @@ class OrderBookTracker(ABC):
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        """
+        Whether the pair's order book is initialized and tracked, possibly before all other pairs are.
+        """
+        return self._order_book_ready_events[trading_pair].is_set()
+
+    def is_order_book_healthy(self, trading_pair: str) -> bool:
+        """
+        Whether the pair's order book is ready and in sync with the exchange. A book isn't healthy from a sequence gap
+        in its diffs until a new snapshot restores it, see SEQUENCE_GAP_DETECTION, and strategies shouldn't quote
+        from it in the meantime.
+        """
+        return self.is_order_book_ready(trading_pair) and trading_pair not in self._gap_buffers
+
+    async def wait_for_order_book(self, trading_pair: str) -> OrderBook:
+        await self._order_book_ready_events[trading_pair].wait()
+        return self._order_books[trading_pair]
+
+    @property
+    def diff_coalescing_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per pair number of diff messages applied, batches they were applied in, and messages saved by merging them.
+        """
+        return {
+            trading_pair: {
+                "messages": metrics.diffs_applied,
+                "batches": metrics.diff_batches_applied,
+                "merged": metrics.diffs_applied - metrics.diff_batches_applied
+            }
+            for trading_pair, metrics in self._pair_metrics.items()
+            if metrics.diff_batches_applied > 0
+        }
+
+    def get_tracking_metrics(self, trading_pairs: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Per pair lag and throughput of order book tracking, to see which pairs fall behind under load.
+
+        queue_depth is the number of messages waiting in the pair's tracking queue. Latencies are in milliseconds
+        from receiving a diff message to applying it, see OrderBookTrackerPairMetrics. They're measured from the
+        trackers' diff stream when it's a ReceiveTimeQueue, and from routing into the pair's queue otherwise.
+
+        :param trading_pairs: pairs to report, all tracked pairs if None
+        """
+        if trading_pairs is None:
+            trading_pairs = list(self._order_books.keys())
+        tracking_metrics: Dict[str, Dict[str, Any]] = {}
+        for trading_pair in trading_pairs:
+            message_queue: Optional[asyncio.Queue] = self._tracking_message_queues.get(trading_pair)
+            queue_depth: int = message_queue.qsize() if message_queue is not None else 0
+            metrics: OrderBookTrackerPairMetrics = self._pair_metrics.get(trading_pair, OrderBookTrackerPairMetrics())
+            tracking_metrics[trading_pair] = metrics.to_dict(queue_depth)
+        return tracking_metrics
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -84,6 +187,64 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def order_book_sizes(self) -> Dict[str, Dict[str, int]]:
+        """
+        Level counts and estimated memory use of every tracked book, for sizing hosts that track many pairs.
+        """
+        sizes: Dict[str, Dict[str, int]] = {}
+        for trading_pair, order_book in self._order_books.items():
+            bid_levels, ask_levels = order_book.level_counts
+            sizes[trading_pair] = {
+                "bid_levels": bid_levels,
+                "ask_levels": ask_levels,
+                "estimated_bytes": order_book.estimated_memory_bytes
+            }
+        return sizes
+
+    def set_price_increments(self, price_increments: Dict[str, Decimal]):
+        """
+        Snaps each tracked book's prices to its pair's tick size, see OrderBook.price_increment. Exchanges call this
+        whenever trading rules are refreshed, so books created in between pick up their increment on the next refresh.
+        """
+        for trading_pair, order_book in self._order_books.items():
+            if trading_pair in price_increments:
+                order_book.price_increment = float(price_increments[trading_pair])
+
+    def get_mid_prices(self, trading_pairs: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Mid prices of many tracked pairs in one call, NaN for pairs without a book or with an empty side.
+
+        :param trading_pairs: pairs to query, all tracked pairs in order_books order if None
+        """
+        if trading_pairs is None:
+            trading_pairs = list(self._order_books.keys())
+        return get_batch_mid_prices([self._order_books.get(trading_pair) for trading_pair in trading_pairs])
+
+    def get_prices_for_volume(self,
+                              trading_pairs: List[str],
+                              is_buy: Sequence[bool],
+                              volumes: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Answers a batch of (pair, side, volume) price for volume queries in one call.
+
+        :return: result prices and result volumes, NaN and 0 for pairs without a book
+        """
+        return get_batch_prices_for_volume([self._order_books.get(trading_pair) for trading_pair in trading_pairs],
+                                           is_buy, volumes)
+
+    def get_vwaps_for_volume(self,
+                             trading_pairs: List[str],
+                             is_buy: Sequence[bool],
+                             volumes: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Answers a batch of (pair, side, volume) VWAP queries in one call.
+
+        :return: result prices and result volumes, NaN and 0 for pairs without a book
+        """
+        return get_batch_vwaps_for_volume([self._order_books.get(trading_pair) for trading_pair in trading_pairs],
+                                          is_buy, volumes)
+
     def start(self):
         self.stop()
         self._init_order_books_task = safe_ensure_future(
@@ -141,12 +302,14 @@ class OrderBookTracker(ABC):
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        self._gap_buffers.clear()
         self._order_books_initialized.clear()
 
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
-        fall-back mechanism for when the web socket update channel fails.
+        fall-back mechanism for when the web socket update channel fails. Data sources fetch all outdated pairs at
+        once, with one all-tickers request where the exchange supports it, see LastTradedPriceCache.
         '''
         await self._order_books_initialized.wait()
         while True:
@@ -162,8 +325,8 @@ class OrderBookTracker(ABC):
                     for trading_pair, last_price in last_prices.items():
                         self._order_books[trading_pair].last_trade_price = last_price
                         self._order_books[trading_pair].last_trade_price_rest_updated = time.perf_counter()
-                else:
-                    await asyncio.sleep(1)
+                # Pairs the exchange didn't report stay outdated, and are asked for again on the next pass.
+                await asyncio.sleep(1)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -172,32 +335,52 @@ class OrderBookTracker(ABC):
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books concurrently. The throttler paces the snapshot requests, and each pair is tracked as
+        soon as its own snapshot arrives.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._data_source.get_new_order_book(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
+        await safe_gather(*[self._init_order_book(trading_pair) for trading_pair in self._trading_pairs])
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str):
+        while True:
+            try:
+                async with self._throttler.weighted_task(self.SNAPSHOT_REQUEST_WEIGHT):
+                    order_book: OrderBook = await self._data_source.get_new_order_book(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing the order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error initializing the order book for {trading_pair}. "
+                                    f"Retrying after 5 seconds."
+                )
+                await asyncio.sleep(5.0)
+        self._order_books[trading_pair] = order_book
+        self._tracking_message_queues[trading_pair] = ReceiveTimeQueue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{len(self._tracking_message_queues)}/{len(self._trading_pairs)} completed.")
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
         """
         last_message_timestamp: float = time.time()
+        messages_queued: int = 0
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_diff_stream.get()
                 trading_pair: str = ob_message.trading_pair
 
                 if trading_pair not in self._tracking_message_queues:
-                    messages_rejected += 1
+                    messages_queued += 1
+                    # Save diff messages received before snapshots are ready
+                    self._saved_message_queues[trading_pair].append(ob_message)
                     continue
                 message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
                 # Check the order book's initial update ID. If it's larger, don't bother.
@@ -205,16 +388,19 @@ class OrderBookTracker(ABC):
 
                 if order_book.snapshot_uid > ob_message.update_id:
                     messages_rejected += 1
+                    self._pair_metrics[trading_pair].rejected_messages += 1
                     continue
-                await message_queue.put(ob_message)
+                self._route_diff_message(message_queue, ob_message)
                 messages_accepted += 1
 
                 # Log some statistics.
                 now: float = time.time()
                 if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}")
+                    self.logger().debug(f"Diff messages processed: {messages_accepted}, rejected: {messages_rejected}, "
+                                        f"queued: {messages_queued}")
                     messages_accepted = 0
                     messages_rejected = 0
+                    messages_queued = 0
 
                 last_message_timestamp = now
             except asyncio.CancelledError:
@@ -227,7 +413,6 @@ class OrderBookTracker(ABC):
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -242,8 +427,148 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _route_diff_message(self, message_queue: asyncio.Queue, message: OrderBookMessage):
+        """
+        Queues a diff message taken from the diff stream for its pair, with the time the stream received it.
+        """
+        if isinstance(message_queue, ReceiveTimeQueue):
+            message_queue.put_received_nowait(message, self._last_receive_time(self._order_book_diff_stream))
+        else:
+            message_queue.put_nowait(message)
+
+    @staticmethod
+    def _last_receive_time(message_queue: asyncio.Queue) -> Optional[float]:
+        """
+        Receive time of the message last taken out of the queue, None if the queue doesn't record it.
+        """
+        if isinstance(message_queue, ReceiveTimeQueue):
+            return message_queue.last_receive_time
+        return None
+
+    def _drain_diff_messages(self,
+                             message_queue: asyncio.Queue,
+                             message: OrderBookMessage) -> Tuple[List[OrderBookMessage], Optional[OrderBookMessage]]:
+        """
+        Collects the diff messages already queued behind a diff message, so that a backlog is applied as one batch.
+        Stops at the first message that isn't a diff, and returns it for the caller to process next.
+        """
+        diff_messages: List[OrderBookMessage] = [message]
+        while not message_queue.empty() and len(diff_messages) < self.MAX_COALESCED_DIFFS:
+            next_message: OrderBookMessage = message_queue.get_nowait()
+            if next_message.type is not OrderBookMessageType.DIFF:
+                return diff_messages, next_message
+            diff_messages.append(next_message)
+        return diff_messages, None
+
+    @staticmethod
+    def _merge_diff_messages(diff_messages: List[OrderBookMessage]) -> Tuple[List[OrderBookRow], List[OrderBookRow]]:
+        """
+        Merges diff messages in arrival order into one diff, keeping the last update of every price level.
+        """
+        bids: Dict[float, OrderBookRow] = {}
+        asks: Dict[float, OrderBookRow] = {}
+        for message in diff_messages:
+            for row in message.bids:
+                bids[row.price] = row
+            for row in message.asks:
+                asks[row.price] = row
+        return list(bids.values()), list(asks.values())
+
+    @staticmethod
+    def _merge_raw_diff_messages(diff_messages: List[OrderBookMessage]) -> Tuple[List[List[str]], List[List[str]]]:
+        """
+        Same as _merge_diff_messages(), for messages whose content holds raw [price, amount] lists, see
+        OrderBook.apply_raw_diffs().
+        """
+        if len(diff_messages) == 1:
+            return diff_messages[0].raw_bids, diff_messages[0].raw_asks
+        bids: Dict[str, List[str]] = {}
+        asks: Dict[str, List[str]] = {}
+        for message in diff_messages:
+            for row in message.raw_bids:
+                bids[row[0]] = row
+            for row in message.raw_asks:
+                asks[row[0]] = row
+        return list(bids.values()), list(asks.values())
+
+    def _apply_diff_batch(self, order_book: OrderBook, diff_messages: List[OrderBookMessage]):
+        if len(diff_messages) == 1:
+            order_book.apply_diffs(diff_messages[0].bids, diff_messages[0].asks, diff_messages[0].update_id)
+        else:
+            bids, asks = self._merge_diff_messages(diff_messages)
+            order_book.apply_diffs(bids, asks, diff_messages[-1].update_id)
+
+    def _append_past_diffs(self, past_diffs_window: OrderBookDiffRing, diff_messages: List[OrderBookMessage]):
+        for message in diff_messages:
+            past_diffs_window.append_levels(message.bids, message.asks, message.update_id)
+
+    def _in_sequence_diff_messages(self,
+                                   trading_pair: str,
+                                   order_book: OrderBook,
+                                   diff_messages: List[OrderBookMessage]) -> List[OrderBookMessage]:
+        """
+        The diff messages continuing the book's update id sequence, skipping the ones it already covers. From the
+        first message skipping update ids on, messages are buffered until a resync snapshot arrives, see
+        _restore_from_snapshot().
+        """
+        gap_buffer: Optional[Deque[OrderBookMessage]] = self._gap_buffers.get(trading_pair)
+        if gap_buffer is not None:
+            gap_buffer.extend(diff_messages)
+            return []
+        last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        in_sequence: List[OrderBookMessage] = []
+        for index, message in enumerate(diff_messages):
+            if message.update_id <= last_update_id:
+                self._pair_metrics[trading_pair].rejected_messages += 1
+                continue
+            if message.first_update_id > last_update_id + 1:
+                self._start_resync(trading_pair, last_update_id, diff_messages[index:])
+                break
+            in_sequence.append(message)
+            last_update_id = message.update_id
+        return in_sequence
+
+    def _start_resync(self, trading_pair: str, last_update_id: int, diff_messages: List[OrderBookMessage]):
+        self.logger().warning(f"Order book diffs for {trading_pair} skipped from update id {last_update_id + 1} to "
+                              f"{diff_messages[0].first_update_id}. Resyncing the order book from a new snapshot.")
+        self._gap_buffers[trading_pair] = deque(diff_messages, maxlen=self.GAP_BUFFER_SIZE)
+        self._pair_metrics[trading_pair].sequence_gaps += 1
+        self._data_source.request_snapshot(trading_pair)
+
+    def _apply_diff_messages(self,
+                             trading_pair: str,
+                             order_book: OrderBook,
+                             diff_messages: List[OrderBookMessage],
+                             past_diffs_window: OrderBookDiffRing,
+                             receive_time: Optional[float] = None):
+        """
+        :param receive_time: time.perf_counter() time the first message was received, see ReceiveTimeQueue
+        """
+        if self.SEQUENCE_GAP_DETECTION:
+            diff_messages = self._in_sequence_diff_messages(trading_pair, order_book, diff_messages)
+            if len(diff_messages) == 0:
+                return
+        self._apply_diff_batch(order_book, diff_messages)
+        # The window keeps every message's levels with its own update id, snapshots are replayed against them.
+        self._append_past_diffs(past_diffs_window, diff_messages)
+        self._pair_metrics[trading_pair].record_diffs_applied(len(diff_messages), receive_time)
+
+    def _restore_from_snapshot(self,
+                               trading_pair: str,
+                               order_book: OrderBook,
+                               snapshot_message: OrderBookMessage,
+                               past_diffs_window: OrderBookDiffRing):
+        order_book.restore_from_snapshot_and_numpy_diffs(snapshot_message, past_diffs_window.to_numpy())
+        self._pair_metrics[trading_pair].snapshot_restores += 1
+        gap_buffer: Optional[Deque[OrderBookMessage]] = self._gap_buffers.pop(trading_pair, None)
+        if gap_buffer is not None:
+            # A snapshot older than the gap leaves it open, and the replay starts another resync.
+            self._apply_diff_messages(trading_pair, order_book, list(gap_buffer), past_diffs_window)
+            if trading_pair not in self._gap_buffers:
+                self.logger().info(f"Resynced the order book for {trading_pair}.")
+
     async def _track_single_book(self, trading_pair: str):
-        past_diffs_window: Deque[OrderBookMessage] = deque()
+        past_diffs_window: OrderBookDiffRing = OrderBookDiffRing(self.PAST_DIFF_WINDOW_ROWS)
         self._past_diffs_windows[trading_pair] = past_diffs_window
 
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
@@ -251,26 +576,48 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
+        diff_messages_merged: int = 0
+        pending_message: Optional[OrderBookMessage] = None
+        pending_receive_time: Optional[float] = None
+
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues.pop(trading_pair, deque())
+
         while True:
             try:
-                message: OrderBookMessage = await message_queue.get()
+                message: OrderBookMessage = None
+                receive_time: Optional[float] = None
+                # Process saved messages first, skipping the ones the initial snapshot already covers.
+                if len(saved_messages) > 0:
+                    message = saved_messages.popleft()
+                    if message.update_id < order_book.snapshot_uid:
+                        continue
+                elif pending_message is not None:
+                    message, pending_message = pending_message, None
+                    receive_time = pending_receive_time
+                else:
+                    message = await message_queue.get()
+                    receive_time = self._last_receive_time(message_queue)
+
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages: List[OrderBookMessage] = [message]
+                    if len(saved_messages) == 0:
+                        diff_messages, pending_message = self._drain_diff_messages(message_queue, message)
+                        pending_receive_time = self._last_receive_time(message_queue)
+                    self._apply_diff_messages(trading_pair, order_book, diff_messages, past_diffs_window,
+                                              receive_time)
+                    diff_messages_accepted += len(diff_messages)
+                    diff_messages_merged += len(diff_messages) - 1
 
                     # Output some statistics periodically.
                     now: float = time.time()
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
-                        self.logger().debug("Processed %d order book diffs for %s.",
-                                            diff_messages_accepted, trading_pair)
+                        self.logger().debug("Processed %d order book diffs for %s, %d merged into earlier batches.",
+                                            diff_messages_accepted, trading_pair, diff_messages_merged)
                         diff_messages_accepted = 0
+                        diff_messages_merged = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._restore_from_snapshot(trading_pair, order_book, message, past_diffs_window)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
             except asyncio.CancelledError:
                 raise
@@ -282,7 +629,6 @@ class OrderBookTracker(ABC):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
                 trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
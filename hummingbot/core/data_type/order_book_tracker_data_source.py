@@ -11,6 +11,10 @@ from typing import (
     List,
 )
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_snapshot_scheduler import (
+    OrderBookSnapshotScheduler,
+    SnapshotFetcher
+)
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
@@ -18,6 +22,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def __init__(self, trading_pairs: List[str]):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
+        self._snapshot_scheduler: OrderBookSnapshotScheduler = OrderBookSnapshotScheduler(trading_pairs)
 
     @staticmethod
     @abstractmethod
@@ -36,6 +41,27 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def snapshot_scheduler(self) -> OrderBookSnapshotScheduler:
+        """
+        Refresh schedule of data sources that refresh snapshots with _listen_for_scheduled_snapshots().
+        """
+        return self._snapshot_scheduler
+
+    def request_snapshot(self, trading_pair: str):
+        """
+        Asks for a fresh snapshot of the pair ahead of its turn, e.g. after missing diffs.
+        """
+        self._snapshot_scheduler.request_snapshot(trading_pair)
+
+    async def _listen_for_scheduled_snapshots(self, fetch_snapshot: SnapshotFetcher, output: asyncio.Queue):
+        """
+        listen_for_order_book_snapshots() implementation for data sources fetching snapshots over REST.
+
+        :param fetch_snapshot: coroutine function fetching a pair's snapshot message
+        """
+        await self._snapshot_scheduler.run(fetch_snapshot, output)
+
     @classmethod
     async def get_last_traded_prices(cls, trading_pairs: List[str]) -> Dict[str, float]:
         raise NotImplementedError
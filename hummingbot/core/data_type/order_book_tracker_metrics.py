@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+import asyncio
+from collections import deque
+import math
+import time
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+
+class ReceiveTimeQueue(asyncio.Queue):
+    """
+    asyncio.Queue remembering when each item was put into it, in time.perf_counter() seconds. After get() or
+    get_nowait(), last_receive_time is the put time of the item just taken out.
+    """
+
+    def _init(self, maxsize: int):
+        super()._init(maxsize)
+        self._receive_times: Deque[float] = deque()
+        self._next_receive_time: Optional[float] = None
+        self.last_receive_time: Optional[float] = None
+
+    def _put(self, item):
+        super()._put(item)
+        self._receive_times.append(self._next_receive_time or time.perf_counter())
+
+    def _get(self):
+        self.last_receive_time = self._receive_times.popleft()
+        return super()._get()
+
+    def put_received_nowait(self, item, receive_time: Optional[float]):
+        """
+        put_nowait() keeping the time an upstream queue received the item, so waiting times add up across queues.
+        """
+        self._next_receive_time = receive_time
+        try:
+            self.put_nowait(item)
+        finally:
+            self._next_receive_time = None
+
+
+class OrderBookTrackerPairMetrics:
+    """
+    Lag and throughput counters of one tracked pair, see OrderBookTracker.get_tracking_metrics().
+
+    Latency is the time from receiving a diff message to finishing applying the batch it was applied in. Batches
+    record the latency of their oldest message, which is the one that waited the longest.
+    """
+    # Upper bounds of the latency histogram buckets in milliseconds. The last bucket is unbounded.
+    LATENCY_BUCKETS_MS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+    # Seconds of history diffs_per_second averages over.
+    RATE_WINDOW: int = 10
+
+    def __init__(self):
+        self.diffs_applied: int = 0
+        self.diff_batches_applied: int = 0
+        self.rejected_messages: int = 0
+        self.snapshot_restores: int = 0
+        self.sequence_gaps: int = 0
+        self.latency_counts: List[int] = [0] * (len(self.LATENCY_BUCKETS_MS) + 1)
+        self.latency_max_ms: float = 0.0
+        self._latency_sum_ms: float = 0.0
+        # [second, diffs applied in that second], oldest first.
+        self._rate_buckets: Deque[List[int]] = deque()
+
+    def record_diffs_applied(self, message_count: int, receive_time: Optional[float] = None):
+        """
+        :param receive_time: time.perf_counter() time the batch's oldest message was received, None if unknown
+        """
+        self.diffs_applied += message_count
+        self.diff_batches_applied += 1
+        second: int = int(time.time())
+        if len(self._rate_buckets) > 0 and self._rate_buckets[-1][0] == second:
+            self._rate_buckets[-1][1] += message_count
+        else:
+            self._rate_buckets.append([second, message_count])
+            while self._rate_buckets[0][0] <= second - self.RATE_WINDOW:
+                self._rate_buckets.popleft()
+        if receive_time is not None:
+            self.record_latency((time.perf_counter() - receive_time) * 1e3)
+
+    def record_latency(self, latency_ms: float):
+        bucket: int = 0
+        while bucket < len(self.LATENCY_BUCKETS_MS) and latency_ms > self.LATENCY_BUCKETS_MS[bucket]:
+            bucket += 1
+        self.latency_counts[bucket] += 1
+        self._latency_sum_ms += latency_ms
+        self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+
+    @property
+    def diffs_per_second(self) -> float:
+        oldest_second: int = int(time.time()) - self.RATE_WINDOW
+        return sum(count for second, count in self._rate_buckets if second > oldest_second) / self.RATE_WINDOW
+
+    @property
+    def latency_mean_ms(self) -> float:
+        latency_count: int = sum(self.latency_counts)
+        return self._latency_sum_ms / latency_count if latency_count > 0 else math.nan
+
+    def latency_percentile_ms(self, percentile: float) -> float:
+        """
+        Upper bound of the histogram bucket holding the percentile, the maximum latency for the unbounded bucket,
+        and NaN without any recorded latency.
+        """
+        latency_count: int = sum(self.latency_counts)
+        if latency_count == 0:
+            return math.nan
+        rank: float = latency_count * percentile / 100.0
+        cumulative_count: int = 0
+        for bound, count in zip(self.LATENCY_BUCKETS_MS, self.latency_counts):
+            cumulative_count += count
+            if cumulative_count >= rank:
+                return min(bound, self.latency_max_ms)
+        return self.latency_max_ms
+
+    @property
+    def latency_histogram(self) -> Dict[str, int]:
+        """
+        Batch counts keyed by bucket label, e.g. "<=5ms", and ">5000ms" for the unbounded bucket.
+        """
+        labels: List[str] = [f"<={bound:g}ms" for bound in self.LATENCY_BUCKETS_MS]
+        labels.append(f">{self.LATENCY_BUCKETS_MS[-1]:g}ms")
+        return dict(zip(labels, self.latency_counts))
+
+    def to_dict(self, queue_depth: int) -> Dict[str, Any]:
+        return {
+            "queue_depth": queue_depth,
+            "diffs_applied": self.diffs_applied,
+            "diff_batches_applied": self.diff_batches_applied,
+            "diffs_per_second": self.diffs_per_second,
+            "rejected_messages": self.rejected_messages,
+            "snapshot_restores": self.snapshot_restores,
+            "sequence_gaps": self.sequence_gaps,
+            "latency_mean_ms": self.latency_mean_ms,
+            "latency_p50_ms": self.latency_percentile_ms(50),
+            "latency_p99_ms": self.latency_percentile_ms(99),
+            "latency_max_ms": self.latency_max_ms,
+            "latency_histogram": self.latency_histogram
+        }
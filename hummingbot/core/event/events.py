@@ -51,6 +51,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    BestPriceChangeEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -95,6 +96,8 @@ class PriceType(Enum):
     BestAsk = 3
     LastTrade = 4
     LastOwnTrade = 5
+    MicroPrice = 6
+    WeightedMidPrice = 7
 
 
 class MarketTransactionFailureEvent(NamedTuple):
@@ -284,6 +287,13 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookBestPriceChangeEvent(NamedTuple):
+    timestamp: float
+    update_id: int
+    best_bid: float
+    best_ask: float
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -2,12 +2,21 @@
 
 import asyncio
 from async_timeout import timeout
+from collections import defaultdict
+from enum import IntEnum
+from functools import partial
+import itertools
 import logging
 from typing import (
+    Awaitable,
+    Dict,
+    Iterator,
+    List,
     Optional,
-    Coroutine,
     NamedTuple,
-    Callable
+    Callable,
+    Set,
+    Tuple
 )
 
 import hummingbot
@@ -15,21 +24,50 @@ from hummingbot.logger import HummingbotLogger
 from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
+class CallPriority(IntEnum):
+    """
+    Priority classes of scheduled calls. Calls of a lower value start first, e.g. order placement and cancels ahead
+    of polling.
+    """
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+# Creates the awaitable of a call once the call starts, e.g. a coroutine function without arguments.
+CallFactory = Callable[[], Awaitable]
+
+
 class AsyncCallSchedulerItem(NamedTuple):
     future: asyncio.Future
-    coroutine: Coroutine
+    call_factory: CallFactory
     timeout_seconds: float
     app_warning_msg: str = "API call error."
+    priority: int = CallPriority.NORMAL
+    lane: Optional[str] = None
 
 
 class AsyncCallScheduler:
+    """
+    Runs scheduled calls, at most max_concurrency at once. A call's coroutine or executor job is only created when the
+    call starts. Every call keeps its slot for call_interval seconds
+    after it finishes, which paces the calls of each slot.
+
+    Waiting calls start in priority order, then in scheduling order. Calls with a lane key, e.g. an endpoint or a
+    trading pair, run at most lane_concurrency at once within their lane, and in order within a priority class, without
+    holding up calls of other lanes.
+
+    With the default max_concurrency of 1, calls run one at a time, as a single serial queue.
+    """
     _acs_shared_instance: Optional["AsyncCallScheduler"] = None
     _acs_logger: Optional[HummingbotLogger] = None
 
+    SHARED_MAX_CONCURRENCY = 4
+
     @classmethod
     def shared_instance(cls):
         if cls._acs_shared_instance is None:
-            cls._acs_shared_instance = AsyncCallScheduler()
+            cls._acs_shared_instance = AsyncCallScheduler(max_concurrency=cls.SHARED_MAX_CONCURRENCY)
         return cls._acs_shared_instance
 
     @classmethod
@@ -38,91 +76,138 @@ class AsyncCallScheduler:
             cls._acs_logger = logging.getLogger(__name__)
         return cls._acs_logger
 
-    def __init__(self, call_interval: float = 0.01):
-        self._coro_queue: asyncio.Queue = asyncio.Queue()
-        self._coro_scheduler_task: Optional[asyncio.Task] = None
+    def __init__(self, call_interval: float = 0.01, max_concurrency: int = 1, lane_concurrency: int = 1):
+        """
+        :param call_interval: seconds a call's slot stays taken after the call finishes
+        :param max_concurrency: maximum number of calls running at once
+        :param lane_concurrency: maximum number of calls of one lane running at once
+        """
         self._call_interval: float = call_interval
+        self._max_concurrency: int = max_concurrency
+        self._lane_concurrency: int = lane_concurrency
+        self._pending_calls: List[Tuple[int, int, AsyncCallSchedulerItem]] = []
+        self._sequence: Iterator[int] = itertools.count()
+        self._running_calls: Set[asyncio.Task] = set()
+        self._lane_call_counts: Dict[str, int] = defaultdict(int)
+        self._started: bool = False
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @property
-    def coro_queue(self) -> asyncio.Queue:
-        return self._coro_queue
+    def pending_call_count(self) -> int:
+        return len(self._pending_calls)
 
     @property
-    def coro_scheduler_task(self) -> Optional[asyncio.Task]:
-        return self._coro_scheduler_task
+    def running_call_count(self) -> int:
+        return len(self._running_calls)
 
     @property
     def started(self) -> bool:
-        return self._coro_scheduler_task is not None
+        return self._started
 
     def start(self):
-        if self._coro_scheduler_task is not None:
-            self.stop()
-        self._coro_scheduler_task = safe_ensure_future(
-            self._coro_scheduler(
-                self._coro_queue,
-                self._call_interval
-            )
-        )
+        self._started = True
+        self._dispatch()
 
     def stop(self):
-        if self._coro_scheduler_task is not None:
-            self._coro_scheduler_task.cancel()
-            self._coro_scheduler_task = None
-
-    async def _coro_scheduler(self, coro_queue: asyncio.Queue, interval: float = 0.01):
-        while True:
-            app_warning_msg = "API call error."
-            try:
-                fut, coro, timeout_seconds, app_warning_msg = await coro_queue.get()
-                async with timeout(timeout_seconds):
-                    fut.set_result(await coro)
-            except asyncio.CancelledError:
-                try:
-                    fut.cancel()
-                except Exception:
-                    pass
-                raise
-            except asyncio.InvalidStateError:
-                # The future is already cancelled from outside. Ignore.
-                pass
-            except Exception as e:
-                # Add exception information.
-                app_warning_msg += f" [[Got exception: {str(e)}]]"
-                self.logger().debug(app_warning_msg,
-                                    exc_info=True,
-                                    app_warning_msg=app_warning_msg)
-                try:
-                    fut.set_exception(e)
-                except Exception:
-                    pass
-
-            try:
-                await asyncio.sleep(interval)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().error("Scheduler sleep interrupted.", exc_info=True)
+        """
+        Cancels the running calls. Waiting calls stay scheduled, and run after the next start().
+        """
+        self._started = False
+        for call_task in list(self._running_calls):
+            call_task.cancel()
+
+    def _dispatch(self):
+        if not self._started or len(self._pending_calls) == 0:
+            return
+        waiting_calls: List[Tuple[int, int, AsyncCallSchedulerItem]] = []
+        for entry in sorted(self._pending_calls):
+            item: AsyncCallSchedulerItem = entry[2]
+            if item.future.done():
+                # The caller gave up on the call before it started.
+                continue
+            if len(self._running_calls) < self._max_concurrency and \
+                    (item.lane is None or self._lane_call_counts[item.lane] < self._lane_concurrency):
+                self._start_call(item)
+            else:
+                waiting_calls.append(entry)
+        self._pending_calls = waiting_calls
+
+    def _start_call(self, item: AsyncCallSchedulerItem):
+        call_task: asyncio.Task = safe_ensure_future(self._run_call(item))
+        self._running_calls.add(call_task)
+        if item.lane is not None:
+            self._lane_call_counts[item.lane] += 1
+        call_task.add_done_callback(partial(self._call_done, item))
+        # Stops the call if the caller is cancelled.
+        item.future.add_done_callback(lambda fut: call_task.cancel() if fut.cancelled() else None)
+
+    def _call_done(self, item: AsyncCallSchedulerItem, call_task: asyncio.Task):
+        self._running_calls.discard(call_task)
+        if item.lane is not None:
+            self._lane_call_counts[item.lane] -= 1
+            if self._lane_call_counts[item.lane] == 0:
+                del self._lane_call_counts[item.lane]
+        self._dispatch()
+
+    async def _run_call(self, item: AsyncCallSchedulerItem):
+        fut: asyncio.Future = item.future
+        try:
+            async with timeout(item.timeout_seconds):
+                result: any = await item.call_factory()
+            if not fut.done():
+                fut.set_result(result)
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as e:
+            # Add exception information.
+            app_warning_msg: str = item.app_warning_msg + f" [[Got exception: {str(e)}]]"
+            self.logger().debug(app_warning_msg,
+                                exc_info=True,
+                                app_warning_msg=app_warning_msg)
+            if not fut.done():
+                fut.set_exception(e)
+
+        try:
+            await asyncio.sleep(self._call_interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error("Scheduler sleep interrupted.", exc_info=True)
 
     async def schedule_async_call(self,
-                                  coro: Coroutine,
+                                  call_factory: CallFactory,
                                   timeout_seconds: float,
-                                  app_warning_msg: str = "API call error.") -> any:
+                                  app_warning_msg: str = "API call error.",
+                                  priority: int = CallPriority.NORMAL,
+                                  lane: Optional[str] = None) -> any:
+        """
+        :param call_factory: creates the awaitable once the call starts, e.g. functools.partial(coro_func, arg)
+        :param timeout_seconds: time limit of the call once it's started, not counting the time spent waiting
+        :param priority: CallPriority of the call
+        :param lane: key of the calls that run at most lane_concurrency at once, None for no limit
+        """
         fut: asyncio.Future = self._ev_loop.create_future()
-        self._coro_queue.put_nowait(AsyncCallSchedulerItem(fut, coro, timeout_seconds,
-                                                           app_warning_msg=app_warning_msg))
-        if self._coro_scheduler_task is None:
+        item: AsyncCallSchedulerItem = AsyncCallSchedulerItem(fut, call_factory, timeout_seconds,
+                                                              app_warning_msg=app_warning_msg,
+                                                              priority=priority,
+                                                              lane=lane)
+        self._pending_calls.append((priority, next(self._sequence), item))
+        if not self._started:
             self.start()
+        else:
+            self._dispatch()
         return await fut
 
     async def call_async(self,
                          func: Callable, *args,
                          timeout_seconds: float = 5.0,
-                         app_warning_msg: str = "API call error.") -> any:
-        coro: Coroutine = self._ev_loop.run_in_executor(
-            hummingbot.get_executor(),
-            func,
-            *args,
-        )
-        return await self.schedule_async_call(coro, timeout_seconds, app_warning_msg=app_warning_msg)
+                         app_warning_msg: str = "API call error.",
+                         priority: int = CallPriority.NORMAL,
+                         lane: Optional[str] = None) -> any:
+        """
+        Runs func(*args) on the executor once the call starts.
+        """
+        call_factory: CallFactory = partial(self._ev_loop.run_in_executor, hummingbot.get_executor(), func, *args)
+        return await self.schedule_async_call(call_factory, timeout_seconds, app_warning_msg=app_warning_msg,
+                                              priority=priority, lane=lane)
@@ -3,9 +3,12 @@ import time
 import asyncio
 from collections import deque
 from typing import (
+    Deque,
+    Dict,
+    List,
+    NamedTuple,
     Optional,
-    Tuple,
-    Deque
+    Tuple
 )
 
 RequestWeight = int
@@ -13,29 +16,175 @@ Seconds = float
 Timestamp_s = float
 TaskLog = Tuple[Timestamp_s, RequestWeight]
 
+# Limit id of the request weight passed to Throttler.weighted_task().
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+
+
+class RateLimit(NamedTuple):
+    """
+    Max weight of the tasks counted against limit_id in any period, e.g. RateLimit("ORDERS", 10, 1.0).
+    """
+    limit_id: str
+    limit: RequestWeight
+    period: Seconds
+
+
+class RateLimitLog:
+    """
+    Task logs of one rate limit over a sliding window, with the running total of their weights.
+    """
+
+    def __init__(self, rate_limit: RateLimit, period_safety_margin: Seconds):
+        self._rate_limit: RateLimit = rate_limit
+        self._window: float = rate_limit.period - period_safety_margin
+        self._task_logs: Deque[TaskLog] = deque()
+        self._total_weight: RequestWeight = 0
+
+    @property
+    def rate_limit(self) -> RateLimit:
+        return self._rate_limit
+
+    @property
+    def total_weight(self) -> RequestWeight:
+        return self._total_weight
+
+    def flush(self, now: float):
+        """
+        Remove task logs that have passed rate limit periods
+        """
+        while self._task_logs and now - self._task_logs[0][0] >= self._window:
+            self._total_weight -= self._task_logs.popleft()[1]
+
+    def has_capacity(self, request_weight: RequestWeight) -> bool:
+        # A task heavier than the limit runs once nothing else is logged, instead of never.
+        return self._total_weight + request_weight <= self._rate_limit.limit or self._total_weight == 0
+
+    def capacity_time(self, request_weight: RequestWeight) -> float:
+        """
+        Time the logged tasks have expired enough for a task of request_weight, assuming nothing else is logged.
+        """
+        if self.has_capacity(request_weight):
+            return time.time()
+        remaining_weight: RequestWeight = self._total_weight
+        for task_ts, weight in self._task_logs:
+            remaining_weight -= weight
+            if remaining_weight + request_weight <= self._rate_limit.limit or remaining_weight == 0:
+                return task_ts + self._window
+        return time.time()
+
+    def log(self, now: float, request_weight: RequestWeight):
+        self._task_logs.append((now, request_weight))
+        self._total_weight += request_weight
+
 
 class Throttler:
+    """
+    Paces tasks by several rate limits at once, e.g. the request weight per minute, orders per second and orders per
+    day of an exchange. Each task counts its weights against the limits it names, and runs once all of them have
+    capacity. Tasks run in the order they arrive: a waiting task holds up later ones, and is woken up when the task
+    logs blocking it expire.
+
+    Exchanges share one throttler between the exchange class and its order book and user stream data sources.
+    """
+
     def __init__(self,
-                 rate_limit: Tuple[RequestWeight, Seconds],
+                 rate_limit: Optional[Tuple[RequestWeight, Seconds]] = None,
                  period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+                 rate_limits: Optional[List[RateLimit]] = None):
+        """
+        :param rate_limit: Max weight allowed in the given period, minus one, for REQUEST_WEIGHT
+        :param period_safety_margin: estimate for the network latency
+        :param rate_limits: limits counted by id, see weighted_task()
         """
-        :param rate_limit: Max weight allowed in the given period
-        :param retry_interval: Time between each limit check
+        rate_limits = list(rate_limits or [])
+        if rate_limit is not None:
+            # Kept as before: the weight logged in a period stays below rate_limit[0].
+            rate_limits.append(RateLimit(REQUEST_WEIGHT, rate_limit[0] - 1, rate_limit[1]))
+        self._rate_limit_logs: Dict[str, RateLimitLog] = {
+            limit.limit_id: RateLimitLog(limit, period_safety_margin) for limit in rate_limits
+        }
+        self._waiters: Deque[Tuple[Dict[str, RequestWeight], asyncio.Future]] = deque()
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def rate_limits(self) -> List[RateLimit]:
+        return [rate_limit_log.rate_limit for rate_limit_log in self._rate_limit_logs.values()]
+
+    @property
+    def waiter_count(self) -> int:
+        return len(self._waiters)
+
+    def used_weight(self, limit_id: str = REQUEST_WEIGHT) -> RequestWeight:
         """
-        self._rate_limit_weight: int = rate_limit[0]
-        self._period: float = rate_limit[1]
-        self._retry_interval: float = retry_interval
-        self._period_safety_margin = period_safety_margin
-        self._task_logs: Deque[TaskLog] = deque()
+        Weight logged against the limit in its current period.
+        """
+        rate_limit_log: RateLimitLog = self._rate_limit_logs[limit_id]
+        rate_limit_log.flush(time.time())
+        return rate_limit_log.total_weight
 
     def weighted_task(self,
-                      request_weight):
-        return ThrottlerContextManager(
-            rate_limit=self._rate_limit_weight,
-            period=self._period,
-            request_weight=request_weight,
-            task_logs=self._task_logs)
+                      request_weight: RequestWeight = 1,
+                      limit_weights: Optional[Dict[str, RequestWeight]] = None) -> "ThrottlerContextManager":
+        """
+        :param request_weight: weight counted against REQUEST_WEIGHT
+        :param limit_weights: weights counted against other limits by id, e.g. {"ORDERS": 1}. Ids the throttler
+                              has no limit for are ignored.
+        """
+        weights: Dict[str, RequestWeight] = {REQUEST_WEIGHT: request_weight}
+        weights.update(limit_weights or {})
+        return ThrottlerContextManager(self, weights)
+
+    def _try_acquire(self, weights: Dict[str, RequestWeight]) -> bool:
+        now: float = time.time()
+        rate_limit_logs: List[Tuple[RateLimitLog, RequestWeight]] = [
+            (self._rate_limit_logs[limit_id], weight)
+            for limit_id, weight in weights.items()
+            if weight > 0 and limit_id in self._rate_limit_logs
+        ]
+        for rate_limit_log, weight in rate_limit_logs:
+            rate_limit_log.flush(now)
+            if not rate_limit_log.has_capacity(weight):
+                return False
+        for rate_limit_log, weight in rate_limit_logs:
+            rate_limit_log.log(now, weight)
+        return True
+
+    def _capacity_time(self, weights: Dict[str, RequestWeight]) -> float:
+        return max(self._rate_limit_logs[limit_id].capacity_time(weight)
+                   for limit_id, weight in weights.items()
+                   if weight > 0 and limit_id in self._rate_limit_logs)
+
+    def _wake_waiters(self):
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+        while self._waiters:
+            weights, fut = self._waiters[0]
+            if fut.done():
+                self._waiters.popleft()
+            elif self._try_acquire(weights):
+                self._waiters.popleft()
+                fut.set_result(None)
+            else:
+                delay: float = max(0.0, self._capacity_time(weights) - time.time())
+                self._wakeup_handle = asyncio.get_event_loop().call_later(delay, self._wake_waiters)
+                break
+
+    async def acquire(self, weights: Dict[str, RequestWeight]):
+        if len(self._waiters) == 0 and self._try_acquire(weights):
+            return
+        fut: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._waiters.append((weights, fut))
+        if len(self._waiters) == 1:
+            self._wake_waiters()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if len(self._waiters) > 0 and self._waiters[0][1] is fut:
+                # The next waiter may fit now.
+                self._waiters.popleft()
+                self._wake_waiters()
+            raise
 
 
 class ThrottlerContextManager:
@@ -47,55 +196,19 @@ class ThrottlerContextManager:
             cls.throttler_logger = logging.getLogger(__name__)
         return cls.throttler_logger
 
-    def __init__(self,
-                 task_logs: Deque[TaskLog],
-                 rate_limit: RequestWeight,
-                 request_weight: RequestWeight = 1,
-                 period_safety_margin: Seconds = 0.1,
-                 period: Seconds = 1.0,
-                 retry_interval: Seconds = 0.1):
-        """
-        :param task_logs: Shared task logs
-        :param rate_limit: Max weight allowed in the given period
-        :param request_weight: Weight of the request of the added task
-        :param period_safety_margin: estimate for the network latency
-        :param period: Time interval of the rate limit
-        :param retry_interval: Time between each limit check
-        """
-        self._period_safety_margin = period_safety_margin
-        self._lock = asyncio.Lock()
-        self._request_weight: RequestWeight = request_weight
-        self._rate_limit: int = rate_limit
-        self._period: float = period
-        self._retry_interval: float = retry_interval
-        self._task_logs: Deque[TaskLog] = task_logs
-
-    def flush(self):
+    def __init__(self, throttler: Throttler, weights: Dict[str, RequestWeight]):
         """
-        Remove task logs that have passed rate limit periods
-        :return:
+        :param throttler: Shared throttler
+        :param weights: Weights of the added task by limit id
         """
-        now: float = time.time()
-        while self._task_logs:
-            task_ts, _ = self._task_logs[0]
-            elapsed: float = now - task_ts
-            if elapsed > self._period - self._period_safety_margin:
-                self._task_logs.popleft()
-            else:
-                break
+        self._throttler: Throttler = throttler
+        self._weights: Dict[str, RequestWeight] = weights
 
     async def acquire(self):
-        while True:
-            self.flush()
-            current_capacity: int = self._rate_limit - sum(weight for (ts, weight) in self._task_logs)
-            if current_capacity - self._request_weight > 0:
-                break
-            await asyncio.sleep(self._retry_interval)
-        self._task_logs.append((time.time(), self._request_weight))
+        await self._throttler.acquire(self._weights)
 
     async def __aenter__(self):
-        async with self._lock:
-            await self.acquire()
+        await self.acquire()
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
@@ -104,15 +217,15 @@ class ThrottlerContextManager:
 # Dev only
 if __name__ == "__main__":
 
-    throttler = Throttler(rate_limit=(20, 1.0))
+    throttler = Throttler(rate_limits=[RateLimit(REQUEST_WEIGHT, 20, 1.0), RateLimit("ORDERS", 2, 1.0)])
 
-    async def task(task_id, weight):
-        async with throttler.weighted_task(weight):
-            print(int(time.time()), f"Cat {task_id}: Meow {weight}")
+    async def task(task_id, weight, orders=0):
+        async with throttler.weighted_task(weight, limit_weights={"ORDERS": orders}):
+            print(int(time.time()), f"Cat {task_id}: Meow {weight} {orders}")
 
     async def test_main():
         tasks = [
-            task(1, 5), task(2, 15), task(3, 1), task(4, 10), task(5, 5), task(6, 5)
+            task(1, 5), task(2, 15), task(3, 1, 1), task(4, 10, 1), task(5, 5, 1), task(6, 5)
         ]
         await asyncio.gather(*tasks)
 
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+import asyncio
+from typing import Optional
+import weakref
+
+import aiohttp
+
+
+class HttpSessionManager:
+    """
+    Process wide aiohttp client sessions, one per event loop, for connectors and order book data sources. Requests
+    through the same session reuse keep-alive connections from per host pools and cached DNS lookups, instead of
+    paying DNS, TCP and TLS setup for a new session per call.
+
+    Sessions from get_session() are shared, so callers must not close them, e.g. with `async with` on the session
+    itself. Request contexts like `async with client.get(url) as response` release connections back to the pool.
+    """
+    _hsm_shared_instance: Optional["HttpSessionManager"] = None
+
+    @classmethod
+    def get_instance(cls) -> "HttpSessionManager":
+        if cls._hsm_shared_instance is None:
+            cls._hsm_shared_instance = HttpSessionManager()
+        return cls._hsm_shared_instance
+
+    def __init__(self,
+                 limit: int = 100,
+                 limit_per_host: int = 20,
+                 ttl_dns_cache: int = 300,
+                 keepalive_timeout: float = 30.0):
+        """
+        :param limit: maximum number of open connections of a session, 0 for no limit
+        :param limit_per_host: maximum number of open connections to one host, 0 for no limit
+        :param ttl_dns_cache: seconds to cache DNS lookups for
+        :param keepalive_timeout: seconds to keep idle connections open for
+        """
+        self._limit: int = limit
+        self._limit_per_host: int = limit_per_host
+        self._ttl_dns_cache: int = ttl_dns_cache
+        self._keepalive_timeout: float = keepalive_timeout
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = \
+            weakref.WeakKeyDictionary()
+
+    def configure(self,
+                  limit: Optional[int] = None,
+                  limit_per_host: Optional[int] = None,
+                  ttl_dns_cache: Optional[int] = None,
+                  keepalive_timeout: Optional[float] = None):
+        """
+        Changes the connection limits of sessions created from now on, see __init__(). Open sessions keep theirs.
+        """
+        if limit is not None:
+            self._limit = limit
+        if limit_per_host is not None:
+            self._limit_per_host = limit_per_host
+        if ttl_dns_cache is not None:
+            self._ttl_dns_cache = ttl_dns_cache
+        if keepalive_timeout is not None:
+            self._keepalive_timeout = keepalive_timeout
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        The shared session of the running event loop, created on first use and after close().
+        """
+        ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        session: Optional[aiohttp.ClientSession] = self._sessions.get(ev_loop)
+        if session is None or session.closed:
+            connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=self._limit,
+                                                                   limit_per_host=self._limit_per_host,
+                                                                   use_dns_cache=True,
+                                                                   ttl_dns_cache=self._ttl_dns_cache,
+                                                                   keepalive_timeout=self._keepalive_timeout)
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[ev_loop] = session
+        return session
+
+    async def close(self):
+        """
+        Closes the shared session of the running event loop, e.g. on shutdown.
+        """
+        session: Optional[aiohttp.ClientSession] = self._sessions.pop(asyncio.get_event_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+def get_shared_client() -> aiohttp.ClientSession:
+    """
+    Shorthand for HttpSessionManager.get_instance().get_session().
+    """
+    return HttpSessionManager.get_instance().get_session()
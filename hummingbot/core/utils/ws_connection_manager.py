@@ -0,0 +1,325 @@
+#!/usr/bin/env python
+import asyncio
+import logging
+import time
+from typing import (
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set
+)
+
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+
+class WSConnectionMetrics:
+    """
+    Counters of one WSConnection, summed over its connections by WSConnectionManager.metrics.
+    """
+    __slots__ = ("connects", "disconnects", "failovers", "connect_failures", "messages_received",
+                 "subscription_frames", "last_message_timestamp")
+
+    def __init__(self):
+        self.connects: int = 0
+        self.disconnects: int = 0
+        self.failovers: int = 0
+        self.connect_failures: int = 0
+        self.messages_received: int = 0
+        self.subscription_frames: int = 0
+        self.last_message_timestamp: float = 0.0
+
+
+class WSConnection:
+    """
+    One websocket connection of a WSConnectionManager, the topics assigned to it and its hot standby connection.
+    """
+
+    def __init__(self, index: int):
+        self.index: int = index
+        self.topics: Set[str] = set()
+        self.subscribed_topics: Set[str] = set()
+        self.ws: Optional[websockets.WebSocketClientProtocol] = None
+        self.standby_ws: Optional[websockets.WebSocketClientProtocol] = None
+        self.task: Optional[asyncio.Task] = None
+        self.standby_task: Optional[asyncio.Task] = None
+        self.subscription_lock: asyncio.Lock = asyncio.Lock()
+        self.metrics: WSConnectionMetrics = WSConnectionMetrics()
+
+
+class WSConnectionManager:
+    """
+    Websocket connections subscribed to a set of topics, e.g. the market data streams of an exchange's pairs.
+
+    Topics are sharded over as few connections as MAX_TOPICS_PER_CONNECTION allows, and each connection subscribes
+    its topics in frames of MAX_TOPICS_PER_FRAME, FRAME_INTERVAL apart. add_topics() and remove_topics() change the
+    subscriptions of one connection without reconnecting it.
+
+    A connection that goes quiet for MESSAGE_TIMEOUT is pinged, and reconnects if the pong takes more than
+    PING_TIMEOUT. Reconnects start after RECONNECT_INITIAL_DELAY and back off exponentially up to
+    RECONNECT_MAX_DELAY while connecting keeps failing. With hot_standby, every connection keeps a second, idle
+    connection open, and a dropped connection fails over to it right away. Either way the topics of the connection
+    are subscribed again on the new connection.
+
+    Subclasses send the exchange's subscription frames in _send_subscription() and handle incoming messages in
+    _process_message(). Exchanges that need application level heartbeats set HEARTBEAT_INTERVAL and send them in
+    _send_heartbeat().
+    """
+    MAX_TOPICS_PER_CONNECTION = 1024
+    MAX_TOPICS_PER_FRAME = 200
+    FRAME_INTERVAL = 0.25
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+    HEARTBEAT_INTERVAL: Optional[float] = None
+    RECONNECT_INITIAL_DELAY = 0.01
+    RECONNECT_MAX_DELAY = 30.0
+    RECONNECT_BACKOFF_FACTOR = 2.0
+
+    _wscm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wscm_logger is None:
+            cls._wscm_logger = logging.getLogger(__name__)
+        return cls._wscm_logger
+
+    def __init__(self, hot_standby: bool = False):
+        """
+        :param hot_standby: keep a standby connection open per connection, to fail over to on disconnects
+        """
+        self._hot_standby: bool = hot_standby
+        self._connections: List[WSConnection] = []
+        self._topic_connections: Dict[str, WSConnection] = {}
+        self._running: bool = False
+
+    @property
+    def connections(self) -> List[WSConnection]:
+        return list(self._connections)
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def hot_standby(self) -> bool:
+        return self._hot_standby
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        metrics: Dict[str, float] = {slot: 0 for slot in WSConnectionMetrics.__slots__}
+        for connection in self._connections:
+            for slot in WSConnectionMetrics.__slots__:
+                if slot == "last_message_timestamp":
+                    metrics[slot] = max(metrics[slot], connection.metrics.last_message_timestamp)
+                else:
+                    metrics[slot] += getattr(connection.metrics, slot)
+        metrics["connections"] = len(self._connections)
+        metrics["connected"] = sum(1 for connection in self._connections if connection.ws is not None)
+        metrics["standby_connected"] = sum(1 for connection in self._connections
+                                           if connection.standby_ws is not None)
+        metrics["topics"] = len(self._topic_connections)
+        return metrics
+
+    def add_topics(self, topics: Iterable[str]) -> WSConnection:
+        """
+        Assigns the topics to the first connection with room for all of them, or to a new connection, so topics
+        added together, e.g. the streams of one pair, share a connection.
+        """
+        topics = [topic for topic in topics if topic not in self._topic_connections]
+        for connection in self._connections:
+            if len(connection.topics) + len(topics) <= self.MAX_TOPICS_PER_CONNECTION:
+                break
+        else:
+            connection = WSConnection(len(self._connections))
+            self._connections.append(connection)
+        connection.topics.update(topics)
+        for topic in topics:
+            self._topic_connections[topic] = connection
+        if self._running:
+            if connection.task is None:
+                self._start_connection(connection)
+            elif connection.ws is not None:
+                # A connecting connection subscribes its topics once connected.
+                safe_ensure_future(self._sync_subscriptions(connection))
+        return connection
+
+    def remove_topics(self, topics: Iterable[str]):
+        changed_connections: Set[WSConnection] = set()
+        for topic in topics:
+            connection: Optional[WSConnection] = self._topic_connections.pop(topic, None)
+            if connection is not None:
+                connection.topics.discard(topic)
+                changed_connections.add(connection)
+        for connection in changed_connections:
+            if connection.ws is not None:
+                safe_ensure_future(self._sync_subscriptions(connection))
+
+    def start(self):
+        self._running = True
+        for connection in self._connections:
+            if connection.task is None:
+                self._start_connection(connection)
+
+    def stop(self):
+        self._running = False
+        for connection in self._connections:
+            for task in (connection.task, connection.standby_task):
+                if task is not None:
+                    task.cancel()
+            connection.task = None
+            connection.standby_task = None
+
+    def _start_connection(self, connection: WSConnection):
+        connection.task = safe_ensure_future(self._run_connection(connection))
+        if self._hot_standby:
+            connection.standby_task = safe_ensure_future(self._run_standby(connection))
+
+    async def _connect(self) -> websockets.WebSocketClientProtocol:
+        raise NotImplementedError
+
+    async def _send_subscription(self, ws: websockets.WebSocketClientProtocol, topics: List[str], subscribe: bool):
+        """
+        Sends one (un)subscription frame for up to MAX_TOPICS_PER_FRAME topics.
+        """
+        raise NotImplementedError
+
+    def _process_message(self, connection: WSConnection, raw_msg: str):
+        raise NotImplementedError
+
+    async def _send_heartbeat(self, ws: websockets.WebSocketClientProtocol):
+        pass
+
+    def _next_delay(self, delay: float) -> float:
+        return min(delay * self.RECONNECT_BACKOFF_FACTOR, self.RECONNECT_MAX_DELAY)
+
+    async def _sync_subscriptions(self, connection: WSConnection):
+        async with connection.subscription_lock:
+            for subscribe in (True, False):
+                ws: Optional[websockets.WebSocketClientProtocol] = connection.ws
+                if ws is None:
+                    return
+                if subscribe:
+                    topics: List[str] = sorted(connection.topics - connection.subscribed_topics)
+                else:
+                    topics = sorted(connection.subscribed_topics - connection.topics)
+                for index in range(0, len(topics), self.MAX_TOPICS_PER_FRAME):
+                    frame_topics: List[str] = topics[index:index + self.MAX_TOPICS_PER_FRAME]
+                    if connection.ws is not ws:
+                        # The connection dropped, its replacement subscribes all topics again.
+                        return
+                    try:
+                        await self._send_subscription(ws, frame_topics, subscribe)
+                    except ConnectionClosed:
+                        return
+                    connection.metrics.subscription_frames += 1
+                    if subscribe:
+                        connection.subscribed_topics.update(frame_topics)
+                    else:
+                        connection.subscribed_topics.difference_update(frame_topics)
+                    await asyncio.sleep(self.FRAME_INTERVAL)
+
+    async def _heartbeat_loop(self, ws: websockets.WebSocketClientProtocol):
+        while True:
+            try:
+                await self._send_heartbeat(ws)
+            except ConnectionClosed:
+                return
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+
+    async def _inner_messages(self, ws: websockets.WebSocketClientProtocol) -> AsyncIterable[str]:
+        # Raises asyncio.TimeoutError as soon as a ping timed out, so the caller can reconnect. The caller closes ws.
+        heartbeat_task: Optional[asyncio.Task] = None
+        if self.HEARTBEAT_INTERVAL is not None:
+            heartbeat_task = safe_ensure_future(self._heartbeat_loop(ws))
+        try:
+            while True:
+                try:
+                    yield await asyncio.wait_for(ws.recv(), timeout=self.MESSAGE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    pong_waiter = await ws.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
+        finally:
+            if heartbeat_task is not None:
+                heartbeat_task.cancel()
+
+    async def _take_standby(self, connection: WSConnection) -> Optional[websockets.WebSocketClientProtocol]:
+        ws: Optional[websockets.WebSocketClientProtocol] = connection.standby_ws
+        if ws is None:
+            return None
+        connection.standby_ws = None
+        # Stop the standby task reading from ws before reading from it here, and open a new standby connection.
+        standby_task: asyncio.Task = connection.standby_task
+        standby_task.cancel()
+        try:
+            await asyncio.wait([standby_task])
+        except asyncio.CancelledError:
+            safe_ensure_future(ws.close())
+            raise
+        connection.standby_task = safe_ensure_future(self._run_standby(connection))
+        return ws
+
+    async def _run_connection(self, connection: WSConnection):
+        delay: float = self.RECONNECT_INITIAL_DELAY
+        while True:
+            ws: Optional[websockets.WebSocketClientProtocol] = None
+            try:
+                ws = await self._take_standby(connection)
+                if ws is not None:
+                    connection.metrics.failovers += 1
+                else:
+                    ws = await self._connect()
+                connection.metrics.connects += 1
+                connection.ws = ws
+                connection.subscribed_topics.clear()
+                safe_ensure_future(self._sync_subscriptions(connection))
+                async for raw_msg in self._inner_messages(ws):
+                    connection.metrics.messages_received += 1
+                    connection.metrics.last_message_timestamp = time.time()
+                    delay = self.RECONNECT_INITIAL_DELAY
+                    self._process_message(connection, raw_msg)
+            except asyncio.CancelledError:
+                raise
+            except (asyncio.TimeoutError, ConnectionClosed) as e:
+                self.logger().warning(f"WebSocket connection {connection.index} dropped "
+                                      f"({type(e).__name__}). Reconnecting...")
+            except Exception:
+                if connection.ws is None:
+                    connection.metrics.connect_failures += 1
+                self.logger().error(f"Unexpected error with WebSocket connection {connection.index}. "
+                                    f"Reconnecting...", exc_info=True)
+            finally:
+                if connection.ws is not None:
+                    connection.metrics.disconnects += 1
+                    connection.ws = None
+                if ws is not None:
+                    safe_ensure_future(ws.close())
+            if connection.standby_ws is None:
+                await asyncio.sleep(delay)
+                delay = self._next_delay(delay)
+
+    async def _run_standby(self, connection: WSConnection):
+        delay: float = self.RECONNECT_INITIAL_DELAY
+        while True:
+            ws: Optional[websockets.WebSocketClientProtocol] = None
+            try:
+                ws = await self._connect()
+                connection.standby_ws = ws
+                delay = self.RECONNECT_INITIAL_DELAY
+                # Keeps the standby connection alive until it is taken over, discarding welcome and pong messages.
+                async for _ in self._inner_messages(ws):
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().debug(f"Standby WebSocket connection {connection.index} failed.", exc_info=True)
+            finally:
+                if ws is not None and connection.standby_ws is ws:
+                    connection.standby_ws = None
+                    safe_ensure_future(ws.close())
+            await asyncio.sleep(delay)
+            delay = self._next_delay(delay)
@@ -132,7 +132,7 @@ class TelegramNotifier(NotifierBase):
                 pd.set_option('display.max_columns', 500)
                 pd.set_option('display.width', 1000)
 
-                await async_scheduler.call_async(self._hb._handle_command, input_text)
+                await async_scheduler.call_async(self._hb._handle_command, input_text, lane="telegram_commands")
 
                 # Reset to normal, so that pandas's default autodetect width still works
                 pd.set_option('display.max_rows', 0)
@@ -184,7 +184,7 @@ class TelegramNotifier(NotifierBase):
                     text=formatted_msg,
                     parse_mode=ParseMode.HTML,
                     reply_markup=reply_markup
-                ))
+                ), lane="telegram_messages")
             except NetworkError as network_err:
                 # Sometimes the telegram server resets the current connection,
                 # if this is the case we send the message again.
@@ -195,7 +195,7 @@ class TelegramNotifier(NotifierBase):
                     text=msg,
                     parse_mode=ParseMode.MARKDOWN,
                     reply_markup=reply_markup
-                ))
+                ), lane="telegram_messages")
         except TelegramError as telegram_err:
             self.logger().network(f"TelegramError: {telegram_err.message}! Giving up on that message.",
                                   exc_info=True)
@@ -1237,5 +1237,9 @@ cdef class PerpetualMarketMakingStrategy(StrategyBase):
             return PriceType.LastTrade
         elif price_type_str == 'last_own_trade_price':
             return PriceType.LastOwnTrade
+        elif price_type_str == "micro_price":
+            return PriceType.MicroPrice
+        elif price_type_str == "weighted_mid_price":
+            return PriceType.WeightedMidPrice
         else:
             raise ValueError(f"Unrecognized price type string {price_type_str}.")
@@ -341,7 +341,8 @@ perpetual_market_making_config_map = {
                   on_validated=on_validate_price_source),
     "price_type":
         ConfigVar(key="price_type",
-                  prompt="Which price type to use? (mid_price/last_price/last_own_trade_price/best_bid/best_ask) >>> ",
+                  prompt="Which price type to use? (mid_price/last_price/last_own_trade_price/best_bid/best_ask/"
+                         "micro_price/weighted_mid_price) >>> ",
                   type_str="str",
                   required_if=lambda: perpetual_market_making_config_map.get("price_source").value != "custom_api",
                   default="mid_price",
@@ -349,7 +350,9 @@ perpetual_market_making_config_map = {
                                                     "last_price",
                                                     "last_own_trade_price",
                                                     "best_bid",
-                                                    "best_ask"} else
+                                                    "best_ask",
+                                                    "micro_price",
+                                                    "weighted_mid_price"} else
                   "Invalid price type."),
     "price_source_derivative":
         ConfigVar(key="price_source_derivative",
@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 
 import asyncio
-from typing import (
-    Coroutine,
-    Callable
-)
+from typing import Callable
 from web3 import Web3
 
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    CallFactory
+)
 from hummingbot.core.pubsub import PubSub
 
 
@@ -18,8 +18,8 @@ class BaseWatcher(PubSub):
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
 
     @staticmethod
-    async def schedule_async_call(coro: Coroutine, timeout_seconds: float, **kwargs) -> any:
-        return await AsyncCallScheduler.shared_instance().schedule_async_call(coro, timeout_seconds, **kwargs)
+    async def schedule_async_call(call_factory: CallFactory, timeout_seconds: float, **kwargs) -> any:
+        return await AsyncCallScheduler.shared_instance().schedule_async_call(call_factory, timeout_seconds, **kwargs)
 
     @staticmethod
     async def call_async(func: Callable, *args, **kwargs):
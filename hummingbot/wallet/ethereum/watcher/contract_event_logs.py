@@ -21,7 +21,10 @@ from eth_abi.codec import (
 )
 from eth_abi.registry import registry
 
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    CallPriority
+)
 from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.logger import HummingbotLogger
 
@@ -125,7 +128,8 @@ class ContractEventLogger:
                     )
                     break
                 logs = await async_scheduler.call_async(
-                    functools.partial(self._w3.eth.getLogs, event_filter_params)
+                    functools.partial(self._w3.eth.getLogs, event_filter_params),
+                    priority=CallPriority.LOW
                 )
                 break
             except asyncio.CancelledError:
@@ -19,7 +19,10 @@ from hummingbot.core.event.events import (
     IncomingEthWatcherEvent,
     WalletReceivedAssetEvent
 )
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    CallPriority
+)
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
@@ -70,7 +73,7 @@ class IncomingEthWatcher(BaseWatcher):
                                                               (t.get("value", 0) > 0))]
 
         get_receipt_tasks: List[Coroutine] = [
-            async_scheduler.call_async(self._w3.eth.getTransactionReceipt, t.hash)
+            async_scheduler.call_async(self._w3.eth.getTransactionReceipt, t.hash, priority=CallPriority.LOW)
             for t in incoming_eth_transactions
         ]
         try:
@@ -31,7 +31,10 @@ from hummingbot.core.event.events import (
     ZeroExFillEvent
 )
 from hummingbot.core.event.event_forwarder import EventForwarder
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    CallPriority
+)
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from .base_watcher import BaseWatcher
 # from .new_blocks_watcher import NewBlocksWatcher
@@ -159,7 +162,8 @@ class ZeroExFillWatcher(BaseWatcher):
                     )
                     break
                 logs = await async_scheduler.call_async(
-                    functools.partial(self._w3.eth.getLogs, event_filter_params)
+                    functools.partial(self._w3.eth.getLogs, event_filter_params),
+                    priority=CallPriority.LOW
                 )
                 break
             except asyncio.CancelledError:
@@ -27,7 +27,10 @@ from web3.exceptions import (
     TransactionNotFound
 )
 
-from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    CallPriority
+)
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.events import (
@@ -67,6 +70,8 @@ s_decimal_0 = Decimal(0)
 class Web3WalletBackend(PubSub):
     DEFAULT_GAS_PRICE = 1e9  # 1 gwei = 1e9 wei
     TRANSACTION_RECEIPT_POLLING_TICK = 10.0
+    # Keeps nonce lookups and outgoing transactions in order on the shared AsyncCallScheduler.
+    TRANSACTIONS_LANE = "web3_transactions"
 
     _w3wb_logger: Optional[HummingbotLogger] = None
 
@@ -229,7 +234,9 @@ class Web3WalletBackend(PubSub):
 
         # Fetch blockchain data.
         self._local_nonce = await async_scheduler.call_async(
-            lambda: self.get_remote_nonce()
+            lambda: self.get_remote_nonce(),
+            priority=CallPriority.HIGH,
+            lane=self.TRANSACTIONS_LANE
         )
 
         # Create event watchers.
@@ -448,7 +455,9 @@ class Web3WalletBackend(PubSub):
             signed_transaction: AttributeDict = await self._outgoing_transactions_queue.get()
             tx_hash: str = signed_transaction.hash.hex()
             try:
-                await async_scheduler.call_async(self._w3.eth.sendRawTransaction, signed_transaction.rawTransaction)
+                await async_scheduler.call_async(self._w3.eth.sendRawTransaction, signed_transaction.rawTransaction,
+                                                 priority=CallPriority.HIGH,
+                                                 lane=self.TRANSACTIONS_LANE)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -0,0 +1,29 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from hummingbot.connector.exchange.binance.binance_order_book_tracker import BinanceOrderBookTracker
+
+
+class BinanceOrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+
+    async def init_order_book(self, trading_pair: str):
+        pass
+
+    def test_add_trading_pair_without_initial_pairs(self):
+        tracker = BinanceOrderBookTracker(trading_pairs=None)
+        self.assertEqual(tracker._trading_pairs, [])
+        with patch.object(tracker, "_init_order_book", self.init_order_book):
+            tracker.add_trading_pair("BTC-USDT")
+            tracker.add_trading_pair("BTC-USDT")
+            self.ev_loop.run_until_complete(asyncio.sleep(0))
+        self.assertEqual(tracker._trading_pairs, ["BTC-USDT"])
+        self.assertEqual(tracker.data_source._trading_pairs, ["BTC-USDT"])
+        self.assertEqual(list(tracker.data_source.stream_manager._pair_connections.keys()), ["BTC-USDT"])
+        tracker.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List
+)
+from unittest.mock import patch
+
+import websockets
+
+from hummingbot.connector.exchange.binance.binance_stream_manager import (
+    BinanceStreamManager,
+    DEPTH_STREAM,
+    TRADE_STREAM
+)
+
+
+class BinanceStreamManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        # Frames received by every server side connection, in connection order.
+        self.frames: List[List[Dict[str, Any]]] = []
+
+        async def handle(ws, *args):
+            frames: List[Dict[str, Any]] = []
+            self.frames.append(frames)
+            async for raw_frame in ws:
+                frame: Dict[str, Any] = json.loads(raw_frame)
+                frames.append(frame)
+                await ws.send(json.dumps({"result": None, "id": frame["id"]}))
+                if frame["method"] == "SUBSCRIBE":
+                    for stream in frame["params"]:
+                        await ws.send(json.dumps({"stream": stream, "data": {"s": stream.split("@")[0].upper()}}))
+
+        async def serve():
+            return await websockets.serve(handle, "127.0.0.1", 0)
+
+        self.server = self.ev_loop.run_until_complete(serve())
+        port: int = list(self.server.sockets)[0].getsockname()[1]
+        self.url_patcher = patch("hummingbot.connector.exchange.binance.binance_stream_manager.COMBINED_STREAM_URL",
+                                 f"ws://127.0.0.1:{port}/stream")
+        self.url_patcher.start()
+
+    def tearDown(self):
+        self.url_patcher.stop()
+        self.server.close()
+        self.ev_loop.run_until_complete(self.server.wait_closed())
+
+    @staticmethod
+    async def get_messages(output: asyncio.Queue, count: int) -> List[Dict[str, Any]]:
+        return [await asyncio.wait_for(output.get(), timeout=5) for _ in range(count)]
+
+    def test_sharding_and_demultiplexing(self):
+        with patch.object(BinanceStreamManager, "MAX_TOPICS_PER_CONNECTION", 4), \
+                patch.object(BinanceStreamManager, "MAX_TOPICS_PER_FRAME", 3), \
+                patch.object(BinanceStreamManager, "FRAME_INTERVAL", 0.01):
+            manager = BinanceStreamManager(["AAA-BTC", "BBB-BTC", "CCC-BTC"], hot_standby=False)
+            # Two streams per pair, so the three pairs fit on two connections.
+            self.assertEqual([{"aaabtc@trade", "aaabtc@depth", "bbbbtc@trade", "bbbbtc@depth"},
+                              {"cccbtc@trade", "cccbtc@depth"}],
+                             [connection.topics for connection in manager.connections])
+
+            trades, diffs = asyncio.Queue(), asyncio.Queue()
+            listen_tasks = [
+                asyncio.ensure_future(manager.listen(TRADE_STREAM, trades, lambda data: ("trade", data["s"]))),
+                asyncio.ensure_future(manager.listen(DEPTH_STREAM, diffs, lambda data: ("diff", data["s"]))),
+            ]
+            trade_messages = self.ev_loop.run_until_complete(self.get_messages(trades, 3))
+            diff_messages = self.ev_loop.run_until_complete(self.get_messages(diffs, 3))
+            self.assertEqual({("trade", "AAABTC"), ("trade", "BBBBTC"), ("trade", "CCCBTC")}, set(trade_messages))
+            self.assertEqual({("diff", "AAABTC"), ("diff", "BBBBTC"), ("diff", "CCCBTC")}, set(diff_messages))
+            self.assertEqual(2, len(self.frames))
+            # Subscriptions go in frames of at most MAX_TOPICS_PER_FRAME streams.
+            self.assertEqual([3, 1], [len(frame["params"]) for frame in self.frames[0]])
+
+            # A pair added at runtime goes on the connection with room, without reconnecting.
+            manager.add_trading_pair("DDD-BTC")
+            self.assertEqual(("trade", "DDDBTC"), self.ev_loop.run_until_complete(self.get_messages(trades, 1))[0])
+            self.assertEqual(("diff", "DDDBTC"), self.ev_loop.run_until_complete(self.get_messages(diffs, 1))[0])
+            self.assertEqual(2, len(self.frames))
+            self.assertEqual({"method": "SUBSCRIBE", "params": ["dddbtc@depth", "dddbtc@trade"]},
+                             {key: self.frames[1][-1][key] for key in ("method", "params")})
+
+            manager.remove_trading_pair("AAA-BTC")
+            self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+            self.assertEqual({"method": "UNSUBSCRIBE", "params": ["aaabtc@depth", "aaabtc@trade"]},
+                             {key: self.frames[0][-1][key] for key in ("method", "params")})
+
+            for task in listen_tasks:
+                task.cancel()
+            self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+            self.assertTrue(all(connection.task is None for connection in manager.connections))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import asyncio
+import json
+import time
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple
+)
+from unittest.mock import patch
+
+from hummingbot.connector.exchange.kucoin.kucoin_stream_manager import KucoinStreamManager
+from hummingbot.core.utils.ws_connection_manager import WSConnection
+
+
+class MockWebSocket:
+    def __init__(self):
+        # Send times and messages.
+        self.sent: List[Tuple[float, Dict[str, Any]]] = []
+
+    async def send(self, raw_msg: str):
+        self.sent.append((time.perf_counter(), json.loads(raw_msg)))
+
+
+class KucoinStreamManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+
+    def test_subscription_messages_are_paced(self):
+        with patch.object(KucoinStreamManager, "FRAME_INTERVAL", 0.05), \
+                patch.object(KucoinStreamManager, "MAX_TOPICS_PER_FRAME", 6):
+            manager = KucoinStreamManager([f"PAIR{i}-USDT" for i in range(4)], hot_standby=False)
+            connection: WSConnection = manager.connections[0]
+            ws = MockWebSocket()
+            connection.ws = ws
+            self.ev_loop.run_until_complete(manager._sync_subscriptions(connection))
+
+        # A frame of 6 topics, sent as a level 2 and a match message, then a frame of the remaining 2 topics.
+        self.assertEqual([msg["topic"] for _, msg in ws.sent],
+                         ["/market/level2:PAIR0-USDT,PAIR1-USDT,PAIR2-USDT,PAIR3-USDT",
+                          "/market/match:PAIR0-USDT,PAIR1-USDT",
+                          "/market/match:PAIR2-USDT,PAIR3-USDT"])
+        send_times: List[float] = [send_time for send_time, _ in ws.sent]
+        for previous, current in zip(send_times, send_times[1:]):
+            self.assertGreaterEqual(current - previous, 0.045)
+        self.assertEqual(connection.subscribed_topics, connection.topics)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import hashlib
+import hmac
+import json
+import statistics
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List
+)
+from urllib.parse import urlencode
+from urllib.request import (
+    Request,
+    urlopen
+)
+
+from aiohttp import web
+
+from hummingbot.connector.exchange.binance.binance_rest_client import BinanceRESTClient
+from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
+from hummingbot.core.utils.http_session_manager import HttpSessionManager
+
+SEQUENTIAL_CALLS = 500
+CONCURRENT_CALLS = 20
+# Call interval of BinanceExchange's AsyncCallScheduler.
+EXCHANGE_CALL_INTERVAL = 0.5
+API_KEY = "key"
+API_SECRET = "secret"
+ORDER = {"symbol": "LINKETH", "orderId": 1, "clientOrderId": "buy-LINKETH-1", "price": "0.01", "origQty": "1",
+         "executedQty": "0", "status": "NEW", "type": "LIMIT", "side": "BUY"}
+
+
+async def start_mock_server() -> web.AppRunner:
+    async def get_order(request: web.Request) -> web.Response:
+        return web.json_response(dict(ORDER, symbol=request.query["symbol"]))
+
+    app = web.Application()
+    app.router.add_get("/api/v1/ping", lambda request: web.json_response({}))
+    app.router.add_get("/api/v3/order", get_order)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def blocking_get_order(api_url: str) -> Callable[..., Dict[str, Any]]:
+    """
+    The current path: python-binance's blocking Client if installed, otherwise a blocking signed urllib request in its
+    place, each run on the executor by AsyncCallScheduler.call_async().
+    """
+    try:
+        from binance.client import Client
+        # The client pings API_URL on creation.
+        Client.API_URL = api_url
+        return Client(API_KEY, API_SECRET).get_order
+    except ImportError:
+        pass
+
+    def get_order(**params) -> Dict[str, Any]:
+        params["timestamp"] = int(time.time() * 1e3)
+        query: str = urlencode(params)
+        signature: str = hmac.new(API_SECRET.encode("utf-8"), query.encode("utf-8"), hashlib.sha256).hexdigest()
+        request: Request = Request(f"{api_url}/v3/order?{query}&signature={signature}",
+                                   headers={"X-MBX-APIKEY": API_KEY})
+        with urlopen(request, timeout=5) as response:
+            return json.loads(response.read())
+    return get_order
+
+
+def summary(name: str, latencies: List[float]):
+    latencies = sorted(latencies)
+    print(f"  {name:<36} p50 {statistics.median(latencies) * 1e3:7.3f} ms   "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1e3:7.3f} ms")
+
+
+async def main():
+    runner: web.AppRunner = await start_mock_server()
+    api_url: str = f"http://127.0.0.1:{runner.addresses[0][1]}/api"
+
+    rest_client: BinanceRESTClient = BinanceRESTClient(API_KEY, API_SECRET)
+    rest_client._api_url = api_url
+    old_get_order: Callable[..., Dict[str, Any]] = blocking_get_order(api_url)
+    print(f"get_order against a local mock server, {SEQUENTIAL_CALLS} sequential calls, "
+          f"then {CONCURRENT_CALLS} concurrent calls.")
+
+    async def new_call():
+        return await rest_client.get_order(symbol="LINKETH", origClientOrderId="buy-LINKETH-1")
+
+    def old_call(scheduler: AsyncCallScheduler):
+        return scheduler.call_async(lambda: old_get_order(symbol="LINKETH", origClientOrderId="buy-LINKETH-1"),
+                                    timeout_seconds=10)
+
+    # Without the scheduler's call interval, so that only the thread hop and blocking client are measured.
+    unpaced_scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0)
+    for name, call in (("executor + blocking client", lambda: old_call(unpaced_scheduler)),
+                       ("BinanceRESTClient", new_call)):
+        await call()
+        latencies: List[float] = []
+        for _ in range(SEQUENTIAL_CALLS):
+            start: float = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+        summary(name, latencies)
+    unpaced_scheduler.stop()
+
+    exchange_scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=EXCHANGE_CALL_INTERVAL)
+    for name, call in ((f"call_async, {EXCHANGE_CALL_INTERVAL}s call interval", lambda: old_call(exchange_scheduler)),
+                       ("BinanceRESTClient", new_call)):
+        start = time.perf_counter()
+        await asyncio.gather(*[call() for _ in range(CONCURRENT_CALLS)])
+        print(f"  {name:<36} {CONCURRENT_CALLS} concurrent calls done in {time.perf_counter() - start:7.3f} s")
+    exchange_scheduler.stop()
+
+    await HttpSessionManager.get_instance().close()
+    await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.get_event_loop().run_until_complete(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import multiprocessing
+import numpy as np
+import resource
+import time
+from typing import (
+    List,
+    Tuple
+)
+from hummingbot.core.data_type.order_book import OrderBook
+
+LEVELS = 5000
+DIFFS = 20000
+BOOKS_FOR_MEMORY = 50
+TICK = 0.01
+MID = 100.0
+
+
+def make_snapshot(rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    offsets = np.arange(1, LEVELS + 1) * TICK
+    bids = np.column_stack((MID - offsets, rng.uniform(0.1, 10, LEVELS), np.zeros(LEVELS)))
+    asks = np.column_stack((MID + offsets, rng.uniform(0.1, 10, LEVELS), np.zeros(LEVELS)))
+    return bids, asks
+
+
+def make_diffs(rng: np.random.Generator) -> List[Tuple[List[List[str]], List[List[str]], int]]:
+    """
+    Synthetic depth stream shaped like Binance's @depth@100ms traffic: ~20 levels per side per message, touching the
+    top of the book far more often than the tail, with about one level in ten removed.
+    """
+    diffs = []
+    for update_id in range(1, DIFFS + 1):
+        sides = []
+        for sign in (-1, 1):
+            levels = np.minimum(rng.geometric(0.05, rng.integers(5, 35)), LEVELS)
+            amounts = np.where(rng.random(len(levels)) < 0.1, 0, rng.uniform(0.1, 10, len(levels)))
+            sides.append([[f"{MID + sign * level * TICK:.2f}", f"{amount:.8f}"]
+                          for level, amount in zip(levels, amounts)])
+        diffs.append((sides[0], sides[1], update_id))
+    return diffs
+
+
+def memory_per_book_kb(bids: np.ndarray, asks: np.ndarray, flat: bool, result: multiprocessing.Queue):
+    # Runs in a fresh process, so the peak RSS growth is only due to the books built here.
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    order_books = [OrderBook(flat=flat) for _ in range(BOOKS_FOR_MEMORY)]
+    for order_book in order_books:
+        order_book.apply_numpy_snapshot(bids, asks)
+    result.put((resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before) / BOOKS_FOR_MEMORY)
+
+
+def main():
+    rng = np.random.default_rng(42)
+    bids, asks = make_snapshot(rng)
+    diffs = make_diffs(rng)
+    print(f"{LEVELS} levels per side, {DIFFS} synthetic diff messages.")
+
+    for name, flat in (("set", False), ("flat", True)):
+        order_book = OrderBook(flat=flat)
+        order_book.apply_numpy_snapshot(bids, asks)
+        start = time.perf_counter()
+        for bid_rows, ask_rows, update_id in diffs:
+            order_book.apply_raw_diffs(bid_rows, ask_rows, update_id)
+        elapsed = time.perf_counter() - start
+        print(f"  {name:<5} apply: {DIFFS / elapsed:10.0f} diffs/s  ({elapsed / DIFFS * 1e6:6.2f} us per diff)")
+
+    for name, flat in (("set", False), ("flat", True)):
+        result = multiprocessing.Queue()
+        process = multiprocessing.Process(target=memory_per_book_kb, args=(bids, asks, flat, result))
+        process.start()
+        book_kb = result.get()
+        process.join()
+        print(f"  {name:<5} memory: ~{book_kb:7.1f} KB per book ({book_kb * 1024 / (2 * LEVELS):5.1f} bytes per level)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import numpy as np
+import timeit
+from hummingbot.core.data_type.order_book import OrderBook
+
+LEVELS = 5000
+ITERATIONS = 200
+
+
+def generator_price_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    # The pre-native implementation: walk the book through the OrderBookRow generators.
+    cumulative_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        cumulative_volume += row.amount
+        if cumulative_volume >= volume:
+            return row.price
+    return float("nan")
+
+
+def generator_vwap_for_volume(order_book: OrderBook, is_buy: bool, volume: float) -> float:
+    total_cost = 0
+    total_volume = 0
+    for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+        incremental_amount = min(row.amount, volume - total_volume)
+        total_cost += incremental_amount * row.price
+        total_volume += incremental_amount
+        if total_volume >= volume:
+            return total_cost / total_volume
+    return float("nan")
+
+
+def make_order_book(levels: int) -> OrderBook:
+    prices = np.arange(1, levels + 1, dtype=np.float64) * 0.01
+    amounts = np.random.uniform(0.5, 1.5, levels)
+    update_ids = np.ones(levels)
+    bids = np.column_stack((100.0 - prices, amounts, update_ids))
+    asks = np.column_stack((100.0 + prices, amounts, update_ids))
+    order_book = OrderBook()
+    order_book.apply_numpy_snapshot(bids, asks)
+    return order_book
+
+
+def main():
+    order_book = make_order_book(LEVELS)
+    # Ask for more volume than the book holds, so every query walks all levels.
+    volume = LEVELS * 2.0
+    benchmarks = [
+        ("price_for_volume", lambda: generator_price_for_volume(order_book, True, volume),
+         lambda: order_book.get_price_for_volume(True, volume)),
+        ("vwap_for_volume", lambda: generator_vwap_for_volume(order_book, False, volume),
+         lambda: order_book.get_vwap_for_volume(False, volume)),
+    ]
+    print(f"Order book with {LEVELS} levels per side, {ITERATIONS} full-depth queries each.")
+    for name, generator_query, native_query in benchmarks:
+        generator_time = timeit.timeit(generator_query, number=ITERATIONS) / ITERATIONS
+        native_time = timeit.timeit(native_query, number=ITERATIONS) / ITERATIONS
+        order_book.depth_index_enabled = True
+        indexed_time = timeit.timeit(native_query, number=ITERATIONS) / ITERATIONS
+        order_book.depth_index_enabled = False
+        print(f"  {name:<20} generator: {generator_time * 1e6:10.1f} us   native: {native_time * 1e6:8.1f} us   "
+              f"indexed: {indexed_time * 1e6:6.2f} us   speedup: {generator_time / native_time:6.1f}x / "
+              f"{generator_time / indexed_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
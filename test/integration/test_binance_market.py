@@ -11,7 +11,6 @@ import time
 import math
 from typing import (
     List,
-    Dict,
     Optional
 )
 import unittest
@@ -43,7 +42,6 @@ from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 from hummingbot.connector.exchange.binance.binance_exchange import (
     BinanceExchange,
     BinanceTime,
-    binance_client_module
 )
 from hummingbot.connector.exchange.binance.binance_utils import convert_to_exchange_trading_pair
 from hummingbot.connector.markets_recorder import MarketsRecorder
@@ -121,7 +119,7 @@ class BinanceExchangeUnitTest(unittest.TestCase):
             ws_base_url = "wss://stream.binance.com:9443/ws"
             cls._ws_user_url = f"{ws_base_url}/{FixtureBinance.LISTEN_KEY['listenKey']}"
             HummingWsServerFactory.start_new_server(cls._ws_user_url)
-            HummingWsServerFactory.start_new_server(f"{ws_base_url}/linketh@depth/zrxeth@depth")
+            HummingWsServerFactory.start_new_server("wss://stream.binance.com:9443/stream")
             cls._ws_patcher = unittest.mock.patch("websockets.connect", autospec=True)
             cls._ws_mock = cls._ws_patcher.start()
             cls._ws_mock.side_effect = HummingWsServerFactory.reroute_ws_connect
@@ -433,10 +431,10 @@ class BinanceExchangeUnitTest(unittest.TestCase):
         [order_created_event] = self.run_parallel(
             self.market_logger.wait_for(BuyOrderCreatedEvent, timeout_seconds=10)
         )
-        order_data: Dict[str, any] = binance_client.get_order(
+        [order_data] = self.run_parallel(binance_client.get_order(
             symbol=trading_pair,
             origClientOrderId=bid_order_id
-        )
+        ))
         quantized_bid_price: Decimal = self.market.quantize_order_price(trading_pair, Decimal(bid_price))
         bid_size_quantum: Decimal = self.market.get_order_size_quantum(trading_pair, Decimal(bid_amount))
         self.assertEqual(quantized_bid_price, Decimal(order_data["price"]))
@@ -461,10 +459,10 @@ class BinanceExchangeUnitTest(unittest.TestCase):
         [order_created_event] = self.run_parallel(
             self.market_logger.wait_for(SellOrderCreatedEvent, timeout_seconds=10)
         )
-        order_data = binance_client.get_order(
+        [order_data] = self.run_parallel(binance_client.get_order(
             symbol=trading_pair,
             origClientOrderId=ask_order_id
-        )
+        ))
         quantized_ask_price: Decimal = self.market.quantize_order_price(trading_pair, Decimal(ask_price))
         quantized_ask_size: Decimal = self.market.quantize_order_amount(trading_pair, Decimal(amount))
         self.assertEqual(quantized_ask_price, Decimal(order_data["price"]))
@@ -483,7 +481,7 @@ class BinanceExchangeUnitTest(unittest.TestCase):
             self.assertEqual(cr.success, True)
 
     def test_server_time_offset(self):
-        time_obj: BinanceTime = binance_client_module.time
+        time_obj: BinanceTime = BinanceTime.get_instance()
         old_check_interval: float = time_obj._server_time_offset_check_interval
         time_obj._server_time_offset_check_interval = 1.0
         time_obj.stop()
@@ -5,7 +5,14 @@ import sys; sys.path.insert(0, realpath(join(__file__, "../../../")))
 
 import logging
 import unittest
-from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.compact_order_book_message import CompactOrderBookMessage
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook, OrderBookDiffRing
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderFilledEvent, TradeType
 import numpy as np
 
 
@@ -53,6 +60,396 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_depth_queries(self):
+        order_book = OrderBook()
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        result = order_book.get_price_for_volume(True, 2)
+        self.assertEqual((result.result_price, result.result_volume), (12, 2))
+        result = order_book.get_price_for_volume(False, 100)
+        self.assertTrue(np.isnan(result.result_price))
+        self.assertEqual(result.result_volume, 6)
+
+        result = order_book.get_vwap_for_volume(True, 2)
+        self.assertEqual((result.result_price, result.result_volume), (11.5, 2))
+        result = order_book.get_vwap_for_volume(False, 4)
+        self.assertEqual((result.result_price, result.result_volume), (9, 4))
+        with self.assertRaises(ZeroDivisionError):
+            order_book.get_vwap_for_volume(True, 0)
+
+        result = order_book.get_price_for_quote_volume(True, 30)
+        self.assertEqual((result.result_price, result.result_volume), (12, 30))
+        result = order_book.get_price_for_quote_volume(False, 20)
+        self.assertEqual((result.result_price, result.result_volume), (9, 20))
+
+        result = order_book.get_quote_volume_for_base_amount(True, 2)
+        self.assertEqual(result.result_volume, 23)
+        result = order_book.get_quote_volume_for_base_amount(False, 4)
+        self.assertEqual(result.result_volume, 36)
+
+        result = order_book.get_volume_for_price(True, 12.5)
+        self.assertEqual((result.result_price, result.result_volume), (12, 3))
+        result = order_book.get_volume_for_price(False, 9)
+        self.assertEqual((result.result_price, result.result_volume), (9, 3))
+
+        result = order_book.get_quote_volume_for_price(True, 11)
+        self.assertEqual((result.result_price, result.result_volume), (11, 11))
+        result = order_book.get_quote_volume_for_price(False, 8)
+        self.assertEqual((result.result_price, result.result_volume), (8, 52))
+
+    def test_depth_index(self):
+        order_book = OrderBook()
+        indexed_order_book = OrderBook()
+        indexed_order_book.depth_index_enabled = True
+        bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1], [7, 4, 1]], dtype=np.float64)
+        asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1], [14, 4, 1]], dtype=np.float64)
+        diffs = [
+            (np.array([[9, 5, 2]], dtype=np.float64), np.array([[13, 0, 2]], dtype=np.float64)),
+            (np.array([[10.5, 1, 3], [7, 0, 3]], dtype=np.float64), np.array([[11, 0.5, 3]], dtype=np.float64)),
+            (np.array([[11.5, 1, 4]], dtype=np.float64), np.array([[15, 1, 4]], dtype=np.float64)),
+        ]
+        for ob in (order_book, indexed_order_book):
+            ob.apply_numpy_snapshot(bids_array, asks_array)
+
+        for bids_diff, asks_diff in diffs:
+            for ob in (order_book, indexed_order_book):
+                ob.apply_numpy_diffs(bids_diff, asks_diff)
+            for is_buy in (True, False):
+                for volume in (0.5, 2, 6, 100):
+                    expected = order_book.get_price_for_volume(is_buy, volume)
+                    result = indexed_order_book.get_price_for_volume(is_buy, volume)
+                    np.testing.assert_equal((expected.result_price, expected.result_volume),
+                                            (result.result_price, result.result_volume))
+                    expected = order_book.get_vwap_for_volume(is_buy, volume)
+                    result = indexed_order_book.get_vwap_for_volume(is_buy, volume)
+                    np.testing.assert_almost_equal(expected.result_price, result.result_price)
+                    expected = order_book.get_quote_volume_for_base_amount(is_buy, volume)
+                    result = indexed_order_book.get_quote_volume_for_base_amount(is_buy, volume)
+                    self.assertAlmostEqual(expected.result_volume, result.result_volume)
+                for price in (8.5, 10, 12, 20):
+                    expected = order_book.get_quote_volume_for_price(is_buy, price)
+                    result = indexed_order_book.get_quote_volume_for_price(is_buy, price)
+                    self.assertEqual(np.isnan(expected.result_price), np.isnan(result.result_price))
+                    self.assertAlmostEqual(expected.result_volume, result.result_volume)
+
+    def test_to_numpy(self):
+        order_book = OrderBook()
+        bids_array = np.array([[8, 3, 1], [10, 1, 2], [9, 2, 3]], dtype=np.float64)
+        asks_array = np.array([[12, 2, 1], [11, 1, 2]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        bids, asks = order_book.to_numpy()
+        np.testing.assert_array_equal(bids, [[10, 1, 2], [9, 2, 3], [8, 3, 1]])
+        np.testing.assert_array_equal(asks, [[11, 1, 2], [12, 2, 1]])
+        self.assertTrue(bids.flags.c_contiguous)
+
+        bids, asks = order_book.to_numpy(depth=1)
+        np.testing.assert_array_equal(bids, [[10, 1, 2]])
+        np.testing.assert_array_equal(asks, [[11, 1, 2]])
+
+        bids_buffer = np.zeros((2, 3), dtype=np.float64)
+        asks_buffer = np.zeros((4, 3), dtype=np.float64)
+        self.assertEqual(order_book.to_numpy_into(bids_buffer, asks_buffer), (2, 2))
+        np.testing.assert_array_equal(bids_buffer, [[10, 1, 2], [9, 2, 3]])
+        np.testing.assert_array_equal(asks_buffer[:2], [[11, 1, 2], [12, 2, 1]])
+
+        bids_df, asks_df = order_book.snapshot
+        self.assertEqual(list(bids_df.columns), ["price", "amount", "update_id"])
+        self.assertEqual(bids_df.iloc[0].tolist(), [10., 1., 2.])
+
+    def test_apply_raw_diffs(self):
+        order_book = OrderBook()
+        raw_order_book = OrderBook()
+        bids = [["10.01", "1.5"], ["9.99", "2"]]
+        asks = [["10.02", "0.1", []], ["10.5", "3"]]
+        order_book.apply_diffs([OrderBookRow(float(p), float(a), 1) for p, a, *_ in bids],
+                               [OrderBookRow(float(p), float(a), 1) for p, a, *_ in asks], 1)
+        raw_order_book.apply_raw_diffs(bids, asks, 1)
+        self.assertEqual(list(order_book.bid_entries()), list(raw_order_book.bid_entries()))
+        self.assertEqual(list(order_book.ask_entries()), list(raw_order_book.ask_entries()))
+
+        raw_order_book.apply_raw_diffs([["10.01", "0.00000000"]], [[10.5, 1]], 2)
+        self.assertEqual(list(raw_order_book.bid_entries()), [OrderBookRow(9.99, 2, 1)])
+        self.assertEqual(list(raw_order_book.ask_entries()), [OrderBookRow(10.02, 0.1, 1), OrderBookRow(10.5, 1, 2)])
+        self.assertEqual(raw_order_book.last_diff_uid, 2)
+        with self.assertRaises(ValueError):
+            raw_order_book.apply_raw_diffs([["not a price", "1"]], [], 3)
+
+    def test_flat_backend(self):
+        order_book = OrderBook()
+        flat_order_book = OrderBook(flat=True)
+        self.assertTrue(flat_order_book.flat)
+        bids_array = np.array([[8, 3, 1], [10, 1, 1], [9, 2, 1]], dtype=np.float64)
+        asks_array = np.array([[12, 2, 1], [11, 1, 1], [13, 3, 1]], dtype=np.float64)
+        diffs = [
+            (np.array([[9.5, 1, 2], [8, 0, 2]], dtype=np.float64), np.array([[11, 0, 2]], dtype=np.float64)),
+            (np.array([[12.5, 1, 3]], dtype=np.float64), np.array([[14, 1, 3]], dtype=np.float64)),
+        ]
+        for ob in (order_book, flat_order_book):
+            ob.apply_numpy_snapshot(bids_array, asks_array)
+        for bids_diff, asks_diff in diffs:
+            for ob in (order_book, flat_order_book):
+                ob.apply_numpy_diffs(bids_diff, asks_diff)
+            self.assertEqual(list(order_book.bid_entries()), list(flat_order_book.bid_entries()))
+            self.assertEqual(list(order_book.ask_entries()), list(flat_order_book.ask_entries()))
+            for is_buy in (True, False):
+                self.assertEqual(order_book.get_price(is_buy), flat_order_book.get_price(is_buy))
+                np.testing.assert_equal(order_book.get_vwap_for_volume(is_buy, 2.5).result_price,
+                                        flat_order_book.get_vwap_for_volume(is_buy, 2.5).result_price)
+        self.assertEqual(flat_order_book.to_numpy()[1].tolist(), [[13, 3, 1], [14, 1, 3]])
+
+    def test_depth_limits(self):
+        for flat in (False, True):
+            order_book = OrderBook(flat=flat, max_depth=2)
+            bids_array = np.array([[10, 1, 1], [9, 2, 1], [8, 3, 1], [7, 4, 1]], dtype=np.float64)
+            asks_array = np.array([[11, 1, 1], [12, 2, 1], [13, 3, 1], [14, 4, 1]], dtype=np.float64)
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+            self.assertEqual(order_book.level_counts, (2, 2))
+            self.assertEqual(order_book.trimmed_prices, (8, 13))
+            self.assertGreater(order_book.estimated_memory_bytes, 0)
+
+            # Levels in the trimmed region are unknown until the next snapshot, so diffs there are ignored.
+            order_book.apply_numpy_diffs(np.array([[10, 0, 2], [8, 5, 2]], dtype=np.float64),
+                                         np.array([[12.5, 1, 2]], dtype=np.float64))
+            self.assertEqual(order_book.to_numpy()[0].tolist(), [[9, 2, 1]])
+            self.assertEqual(order_book.to_numpy()[1].tolist(), [[11, 1, 1], [12, 2, 1]])
+            self.assertEqual(order_book.trimmed_prices, (8, 12.5))
+
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+            self.assertEqual(order_book.to_numpy()[0].tolist(), [[10, 1, 1], [9, 2, 1]])
+
+            order_book.max_depth = 0
+            order_book.max_mid_distance = 0.25
+            order_book.apply_numpy_snapshot(bids_array, asks_array)
+            self.assertEqual(order_book.level_counts, (3, 3))
+            self.assertEqual(order_book.trimmed_prices, (7, 14))
+
+    def test_best_price_change_events(self):
+        for flat in (False, True):
+            order_book = OrderBook(flat=flat)
+            event_logger = EventLogger()
+            order_book.add_listener(OrderBookEvent.BestPriceChangeEvent, event_logger)
+            order_book.apply_numpy_snapshot(np.array([[10, 1, 1], [9, 2, 1]], dtype=np.float64),
+                                            np.array([[11, 1, 1], [12, 2, 1]], dtype=np.float64))
+            # Changes below the top of the book don't move the best prices.
+            order_book.apply_numpy_diffs(np.array([[9, 3, 2]], dtype=np.float64),
+                                         np.array([[12, 0, 2]], dtype=np.float64))
+            order_book.apply_numpy_diffs(np.array([[10, 0, 3]], dtype=np.float64),
+                                         np.array([[10.5, 1, 3]], dtype=np.float64))
+            events = event_logger.event_log
+            self.assertEqual([(e.update_id, e.best_bid, e.best_ask) for e in events], [(1, 10, 11), (3, 9, 10.5)])
+
+    def test_metrics(self):
+        def expected_metrics(order_book, depth):
+            bids, asks = order_book.to_numpy(depth)
+            bid_volume, ask_volume = bids[:, 1].sum(), asks[:, 1].sum()
+            bid_price = (bids[:, 0] * bids[:, 1]).sum() / bid_volume
+            ask_price = (asks[:, 0] * asks[:, 1]).sum() / ask_volume
+            return [
+                (bid_volume - ask_volume) / (bid_volume + ask_volume),
+                (bids[0, 0] * asks[0, 1] + asks[0, 0] * bids[0, 1]) / (bids[0, 1] + asks[0, 1]),
+                (bid_price * ask_volume + ask_price * bid_volume) / (bid_volume + ask_volume),
+                (asks[0, 0] - bids[0, 0]) / (asks[0, 0] + bids[0, 0]) * 20000
+            ]
+
+        rng = np.random.RandomState(7)
+        for flat in (False, True):
+            order_book = OrderBook(flat=flat)
+            order_book.metrics_enabled = True
+            order_book.metrics_depth = 3
+            order_book.apply_numpy_snapshot(np.array([[100 - i, 1 + i, 1] for i in range(20)], dtype=np.float64),
+                                            np.array([[101 + i, 1 + i, 1] for i in range(20)], dtype=np.float64))
+            for update_id in range(2, 200):
+                bids = np.array([[rng.randint(85, 101), rng.choice([0, 1, 2.5]), update_id]], dtype=np.float64)
+                asks = np.array([[rng.randint(101, 117), rng.choice([0, 1, 2.5]), update_id]], dtype=np.float64)
+                order_book.apply_numpy_diffs(bids, asks)
+                np.testing.assert_allclose([order_book.get_imbalance(), order_book.get_micro_price(),
+                                            order_book.get_weighted_mid_price(), order_book.get_spread_bps()],
+                                           expected_metrics(order_book, 3))
+            counts = order_book.level_change_counts
+            self.assertGreater(sum(counts["bids"].values()) + sum(counts["asks"].values()), 0)
+            order_book.reset_level_change_counts()
+            order_book.apply_numpy_diffs(np.array([[50, 1, 300], [50, 2, 300], [50, 0, 300]], dtype=np.float64),
+                                         np.empty((0, 3), dtype=np.float64))
+            self.assertEqual(order_book.level_change_counts["bids"], {"inserted": 1, "updated": 1, "deleted": 1})
+            with self.assertRaises(ValueError):
+                order_book.metrics_depth = 0
+
+    def test_batch_queries(self):
+        tracker = OrderBookTracker(None, ["A-USDT", "B-USDT", "C-USDT"])
+        for i, trading_pair in enumerate(["A-USDT", "B-USDT"]):
+            order_book = OrderBook(flat=i == 1)
+            order_book.apply_numpy_snapshot(np.array([[10 - j, 1 + i, 1] for j in range(5)], dtype=np.float64),
+                                            np.array([[11 + j, 2 + i, 1] for j in range(5)], dtype=np.float64))
+            tracker.order_books[trading_pair] = order_book
+        tracker.order_books["B-USDT"].depth_index_enabled = True
+
+        np.testing.assert_equal(tracker.get_mid_prices(["A-USDT", "B-USDT", "C-USDT"]), [10.5, 10.5, np.nan])
+        trading_pairs = ["A-USDT", "B-USDT", "A-USDT", "B-USDT", "C-USDT"]
+        is_buy = [True, True, False, False, True]
+        volumes = [3, 3, 2.5, 10, 1]
+        prices, result_volumes = tracker.get_vwaps_for_volume(trading_pairs, is_buy, volumes)
+        for i in range(4):
+            expected = tracker.order_books[trading_pairs[i]].get_vwap_for_volume(is_buy[i], volumes[i])
+            self.assertAlmostEqual(prices[i], expected.result_price)
+            self.assertAlmostEqual(result_volumes[i], expected.result_volume)
+        self.assertTrue(np.isnan(prices[4]))
+        prices, result_volumes = tracker.get_prices_for_volume(trading_pairs, is_buy, volumes)
+        for i in range(4):
+            expected = tracker.order_books[trading_pairs[i]].get_price_for_volume(is_buy[i], volumes[i])
+            self.assertEqual(prices[i], expected.result_price)
+        with self.assertRaises(ValueError):
+            tracker.get_vwaps_for_volume(trading_pairs, is_buy[:2], volumes)
+
+    def test_price_increment(self):
+        for flat in (False, True):
+            order_book = OrderBook(flat=flat, price_increment=0.01)
+            order_book.apply_raw_diffs([["1.23", "1"], ["1.22", "1"]], [["1.24", "1"]], 1)
+            # 1.1 + 0.13 and 1.23 are different doubles, but the same price level.
+            order_book.apply_numpy_diffs(np.array([[1.1 + 0.13, 2, 2]], dtype=np.float64),
+                                         np.array([[1.2400001, 0, 2]], dtype=np.float64))
+            bids, asks = order_book.to_numpy()
+            self.assertEqual(bids[:, :2].tolist(), [[1.23, 2], [1.22, 1]])
+            self.assertEqual(len(asks), 0)
+            self.assertEqual(order_book.price_to_ticks(1.23), 123)
+            self.assertEqual(order_book.ticks_to_price(123), 1.23)
+
+            order_book.price_increment = 0.05
+            self.assertEqual(order_book.to_numpy()[0][:, :2].tolist(), [[1.25, 2], [1.2, 1]])
+            order_book.price_increment = 0
+            with self.assertRaises(ValueError):
+                order_book.price_to_ticks(1.23)
+            # Levels are rekeyed by price when the grid is removed.
+            order_book.apply_numpy_diffs(np.array([[1.25, 0, 3], [1.21, 1, 3]], dtype=np.float64),
+                                         np.empty((0, 3), dtype=np.float64))
+            self.assertEqual(order_book.to_numpy()[0][:, :2].tolist(), [[1.21, 1], [1.2, 1]])
+
+    def test_price_increment_depth_index(self):
+        for flat in (False, True):
+            indexed = OrderBook(flat=flat, price_increment=0.5)
+            indexed.depth_index_enabled = True
+            walked = OrderBook(flat=flat, price_increment=0.5)
+            for order_book in (indexed, walked):
+                order_book.apply_numpy_snapshot(np.array([[99.5, 1, 1], [99.0, 2, 1], [98.5, 3, 1]]),
+                                                np.array([[100.0, 1, 1], [100.5, 2, 1], [101.0, 3, 1]]))
+                order_book.apply_numpy_diffs(np.array([[99.0 + 1e-9, 4, 2]]), np.array([[100.5 - 1e-9, 0, 2]]))
+            for order_book in (indexed, walked):
+                # Off grid prices only take the levels at or better than them.
+                self.assertEqual(order_book.get_volume_for_price(True, 100.9).result_volume, 1)
+                self.assertEqual(order_book.get_volume_for_price(True, 101.0).result_volume, 4)
+                self.assertEqual(order_book.get_volume_for_price(False, 99.1).result_volume, 1)
+                self.assertEqual(order_book.get_volume_for_price(False, 98.9).result_volume, 5)
+                self.assertEqual(order_book.get_price_for_volume(False, 4).result_price, 99.0)
+
+    def test_compact_order_book_message(self):
+        content = {"trading_pair": "BTC-USDT", "first_update_id": 3, "update_id": 5,
+                   "bids": [["1.5", "2"]], "asks": [["2.5", "1"], ["3", "0"]]}
+        message = OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=1.0)
+        compact_message = CompactOrderBookMessage(OrderBookMessageType.DIFF, "BTC-USDT", update_id=5,
+                                                  first_update_id=3, raw_bids=content["bids"],
+                                                  raw_asks=content["asks"], timestamp=1.0)
+        for attribute in ("type", "timestamp", "trading_pair", "update_id", "first_update_id", "trade_id", "bids",
+                          "asks", "raw_bids", "raw_asks", "has_update_id", "has_trade_id", "content"):
+            self.assertEqual(getattr(compact_message, attribute), getattr(message, attribute), attribute)
+        self.assertIs(compact_message.bids, compact_message.bids)
+        self.assertEqual(compact_message, message)
+        with self.assertRaises(ValueError):
+            CompactOrderBookMessage(OrderBookMessageType.TRADE, "BTC-USDT")
+
+        diffs = [CompactOrderBookMessage(OrderBookMessageType.DIFF, "BTC-USDT", update_id=update_id,
+                                         raw_bids=[[str(update_id), "1"]], raw_asks=[])
+                 for update_id in range(10, 14)]
+        snapshot = CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT, "BTC-USDT", update_id=11,
+                                           raw_bids=[["1", "1"]], raw_asks=[["20", "1"]])
+        self.assertTrue(diffs[0] < snapshot < diffs[2] and message < diffs[0])
+        order_book = OrderBook()
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+        bids, _ = order_book.to_numpy()
+        self.assertEqual(bids[:, 0].tolist(), [13, 12, 1])
+        self.assertEqual(order_book.last_diff_uid, 13)
+
+    def test_diff_ring_replay(self):
+        ring = OrderBookDiffRing(4)
+        ring.append_levels([["1", "1"]], [["3", "1"]], 10)
+        ring.append_levels([OrderBookRow(1.5, 2, 11)], [], 11)
+        ring.append_levels([["1", "0"]], [["2.5", "4"], ["3", "2"]], 12)
+        # The ring holds the last 4 rows, the first two rows were overwritten.
+        self.assertEqual(len(ring), 4)
+        self.assertEqual(ring.to_numpy().tolist(), [[0, 1.5, 2, 11], [0, 1, 0, 12], [1, 2.5, 4, 12], [1, 3, 2, 12]])
+        self.assertEqual(ring.update_ids.tolist(), [11, 12])
+
+        diffs = [OrderBookMessage(OrderBookMessageType.DIFF,
+                                  {"trading_pair": "BTC-USDT", "update_id": update_id, "bids": bids, "asks": asks})
+                 for update_id, bids, asks in ((10, [["1", "1"]], [["3", "1"]]), (11, [["1.5", "2"]], []),
+                                               (12, [["1", "0"]], [["2.5", "4"], ["3", "2"]]))]
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                    {"trading_pair": "BTC-USDT", "update_id": 10, "bids": [["1", "5"]],
+                                     "asks": [["3", "5"]]})
+        ring = OrderBookDiffRing(16)
+        for diff in diffs:
+            ring.append_levels(diff.raw_bids, diff.raw_asks, diff.update_id)
+        for flat in (False, True):
+            expected = OrderBook(flat=flat)
+            expected.restore_from_snapshot_and_diffs(snapshot, diffs)
+            order_book = OrderBook(flat=flat)
+            order_book.restore_from_snapshot_and_numpy_diffs(snapshot, ring.to_numpy())
+            for rows, expected_rows in zip(order_book.to_numpy(), expected.to_numpy()):
+                self.assertEqual(rows.tolist(), expected_rows.tolist())
+            self.assertEqual(order_book.last_diff_uid, 12)
+            self.assertEqual(order_book.apply_numpy_diff_rows(ring.to_numpy(), 11), 3)
+        with self.assertRaises(ValueError):
+            order_book.apply_numpy_diff_rows(np.zeros((1, 3)))
+
+    def test_composite_order_book_depth_queries(self):
+        order_book = CompositeOrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 1], [0.5, 2, 1]], dtype=np.float64),
+                                        np.array([[2, 1, 1], [3, 2, 1]], dtype=np.float64))
+        self.assertEqual(order_book.get_vwap_for_volume(True, 2).result_price, 2.5)
+        self.assertEqual(order_book.level_counts, (2, 2))
+
+        # The recorded fill consumes the best ask level, until the traded book is cleared.
+        order_book.record_filled_order(OrderFilledEvent(2, "", "", TradeType.BUY, None, 2, 1, None))
+        self.assertEqual(order_book.get_vwap_for_volume(True, 2).result_price, 3)
+        self.assertEqual(order_book.level_counts, (2, 1))
+        self.assertEqual(order_book.to_numpy()[1].tolist(), [[3, 2, 1]])
+        order_book.clear_traded_order_book()
+        self.assertEqual(order_book.get_vwap_for_volume(True, 2).result_price, 2.5)
+
+        # Diffs to the book show up in the next query.
+        order_book.apply_numpy_diffs(np.array([[1, 0, 2]], dtype=np.float64), np.empty((0, 3), dtype=np.float64))
+        self.assertEqual(order_book.get_vwap_for_volume(False, 2).result_price, 0.5)
+        self.assertEqual(order_book.level_counts, (1, 2))
+
+    def test_diff_ring_wraps_around_whole_diffs(self):
+        diffs = [OrderBookMessage(OrderBookMessageType.DIFF,
+                                  {"trading_pair": "BTC-USDT", "update_id": update_id, "bids": bids, "asks": asks})
+                 for update_id, bids, asks in ((10, [["1", "1"]], [["3", "1"]]), (11, [["1.5", "2"]], [["2.5", "1"]]),
+                                               (12, [["1", "0"]], [["3", "2"]]))]
+        ring = OrderBookDiffRing(5)
+        for diff in diffs:
+            ring.append_levels(diff.raw_bids, diff.raw_asks, diff.update_id)
+        # The last diff wraps around the end of the array, and evicts the first diff instead of one of its rows.
+        self.assertEqual(len(ring), 4)
+        self.assertEqual(ring.update_ids.tolist(), [11, 12])
+        self.assertEqual(ring.to_numpy().tolist(), [[0, 1.5, 2, 11], [1, 2.5, 1, 11], [0, 1, 0, 12], [1, 3, 2, 12]])
+
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                    {"trading_pair": "BTC-USDT", "update_id": 10, "bids": [["1", "5"]],
+                                     "asks": [["3", "5"]]})
+        expected = OrderBook()
+        expected.restore_from_snapshot_and_diffs(snapshot, diffs)
+        order_book = OrderBook()
+        order_book.restore_from_snapshot_and_numpy_diffs(snapshot, ring.to_numpy())
+        for rows, expected_rows in zip(order_book.to_numpy(), expected.to_numpy()):
+            self.assertEqual(rows.tolist(), expected_rows.tolist())
+
+        # A diff larger than the ring grows it.
+        ring.append_levels([[str(price), "1"] for price in range(1, 7)], [], 13)
+        self.assertEqual((len(ring), ring.capacity), (6, 6))
+        self.assertEqual(ring.update_ids.tolist(), [13])
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+import unittest
+from functools import partial
+from typing import List
+
+from hummingbot.core.utils.async_call_scheduler import (
+    AsyncCallScheduler,
+    CallPriority
+)
+
+
+class AsyncCallSchedulerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        self.started_calls: List[str] = []
+
+    async def call(self, name: str, duration: float = 0.1) -> str:
+        self.started_calls.append(name)
+        await asyncio.sleep(duration)
+        return name
+
+    def test_concurrency(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0, max_concurrency=5)
+
+        async def run_calls():
+            return await asyncio.gather(*[scheduler.schedule_async_call(partial(self.call, str(i)), 1.0)
+                                          for i in range(10)])
+
+        start: float = self.ev_loop.time()
+        results: List[str] = self.ev_loop.run_until_complete(run_calls())
+        elapsed: float = self.ev_loop.time() - start
+        self.assertEqual([str(i) for i in range(10)], results)
+        # Two rounds of five concurrent calls, instead of ten serial ones.
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 0.5)
+        scheduler.stop()
+
+    def test_priority(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0)
+
+        async def run_calls():
+            tasks = [asyncio.ensure_future(scheduler.schedule_async_call(partial(self.call, "first"), 1.0))]
+            await asyncio.sleep(0.01)
+            tasks.append(asyncio.ensure_future(
+                scheduler.schedule_async_call(partial(self.call, "poll"), 1.0, priority=CallPriority.LOW)))
+            tasks.append(asyncio.ensure_future(scheduler.schedule_async_call(partial(self.call, "update"), 1.0)))
+            tasks.append(asyncio.ensure_future(
+                scheduler.schedule_async_call(partial(self.call, "cancel"), 1.0, priority=CallPriority.HIGH)))
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(run_calls())
+        self.assertEqual(["first", "cancel", "update", "poll"], self.started_calls)
+        scheduler.stop()
+
+    def test_lanes(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0, max_concurrency=4)
+
+        async def run_calls():
+            slow_calls = [scheduler.schedule_async_call(partial(self.call, f"trades_{i}", 0.3), 1.0, lane="myTrades")
+                          for i in range(2)]
+            fast_call = scheduler.schedule_async_call(partial(self.call, "cancel", 0.01), 1.0, lane="order")
+            done, _ = await asyncio.wait([asyncio.ensure_future(c) for c in slow_calls + [fast_call]],
+                                         return_when=asyncio.FIRST_COMPLETED)
+            self.assertEqual(["cancel"], [task.result() for task in done])
+            # Calls of one lane run one at a time, in order.
+            self.assertEqual(["trades_0", "cancel"], self.started_calls)
+            await asyncio.sleep(0.35)
+            self.assertEqual(["trades_0", "cancel", "trades_1"], self.started_calls)
+            await asyncio.sleep(0.3)
+
+        self.ev_loop.run_until_complete(run_calls())
+        scheduler.stop()
+
+    def test_timeout_and_errors(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0)
+
+        async def failing_call():
+            raise ValueError("failed")
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(scheduler.schedule_async_call(partial(self.call, "slow", 1.0), 0.1))
+        with self.assertRaises(ValueError):
+            self.ev_loop.run_until_complete(scheduler.schedule_async_call(failing_call, 1.0))
+        # The timeout counts from the start of the call, not from scheduling.
+        self.assertEqual("in time", self.ev_loop.run_until_complete(
+            asyncio.gather(scheduler.schedule_async_call(partial(self.call, "queued", 0.15), 1.0),
+                           scheduler.schedule_async_call(partial(self.call, "in time", 0.15), 0.2)))[1])
+        self.assertEqual(0, scheduler.running_call_count)
+        self.assertEqual(0, scheduler.pending_call_count)
+        scheduler.stop()
+
+    def test_call_async(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0, max_concurrency=2)
+        self.assertEqual(3, self.ev_loop.run_until_complete(scheduler.call_async(sum, [1, 2])))
+        scheduler.stop()
+
+    def test_call_async_blocking_functions(self):
+        scheduler: AsyncCallScheduler = AsyncCallScheduler(call_interval=0.0, max_concurrency=2)
+        lock: threading.Lock = threading.Lock()
+        running_calls: List[int] = [0]
+        max_running_calls: List[int] = [0]
+
+        def blocking_call(name: str) -> str:
+            with lock:
+                self.started_calls.append(name)
+                running_calls[0] += 1
+                max_running_calls[0] = max(max_running_calls[0], running_calls[0])
+            time.sleep(0.1)
+            with lock:
+                running_calls[0] -= 1
+            return name
+
+        async def run_calls():
+            tasks = [asyncio.ensure_future(scheduler.call_async(blocking_call, f"first_{i}")) for i in range(2)]
+            await asyncio.sleep(0.01)
+            tasks.append(asyncio.ensure_future(
+                scheduler.call_async(blocking_call, "poll", priority=CallPriority.LOW)))
+            tasks.append(asyncio.ensure_future(scheduler.call_async(blocking_call, "update")))
+            tasks.append(asyncio.ensure_future(
+                scheduler.call_async(blocking_call, "cancel", priority=CallPriority.HIGH)))
+            return await asyncio.gather(*tasks)
+
+        results: List[str] = self.ev_loop.run_until_complete(run_calls())
+        self.assertEqual(["first_0", "first_1", "poll", "update", "cancel"], results)
+        # The functions only run on the executor once their calls start.
+        self.assertEqual({"first_0", "first_1"}, set(self.started_calls[:2]))
+        self.assertEqual(["cancel", "update", "poll"], self.started_calls[2:])
+        self.assertEqual(2, max_running_calls[0])
+        scheduler.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
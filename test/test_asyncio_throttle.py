@@ -0,0 +1,82 @@
+import asyncio
+import time
+import unittest
+from typing import List
+
+from hummingbot.core.utils.asyncio_throttle import (
+    RateLimit,
+    REQUEST_WEIGHT,
+    Throttler
+)
+
+
+class ThrottlerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        self.start_times: List[float] = []
+        self.task_ids: List[int] = []
+
+    async def task(self, throttler: Throttler, task_id: int, weight: int, orders: int = 0):
+        async with throttler.weighted_task(weight, limit_weights={"ORDERS": orders}):
+            self.start_times.append(time.time())
+            self.task_ids.append(task_id)
+
+    def test_legacy_rate_limit(self):
+        # Weight logged in a period stays below the given limit, as before.
+        throttler = Throttler((11, 0.3), period_safety_margin=0)
+        start = time.time()
+        self.ev_loop.run_until_complete(asyncio.gather(*[self.task(throttler, i, 1) for i in range(21)]))
+        self.assertEqual(list(range(21)), self.task_ids)
+        self.assertLess(self.start_times[9] - start, 0.05)
+        self.assertGreaterEqual(self.start_times[10] - start, 0.3)
+        self.assertGreaterEqual(self.start_times[20] - start, 0.6)
+
+    def test_multiple_limits(self):
+        throttler = Throttler(rate_limits=[RateLimit(REQUEST_WEIGHT, 20, 0.3), RateLimit("ORDERS", 2, 0.2)],
+                              period_safety_margin=0)
+        start = time.time()
+        self.ev_loop.run_until_complete(asyncio.gather(
+            self.task(throttler, 0, 5, 1),
+            self.task(throttler, 1, 1, 1),
+            self.task(throttler, 2, 1, 1),
+            self.task(throttler, 3, 10),
+            self.task(throttler, 4, 5),
+        ))
+        # Task 2 waits for the orders limit, and the later tasks wait behind it.
+        self.assertEqual([0, 1, 2, 3, 4], self.task_ids)
+        self.assertLess(self.start_times[1] - start, 0.05)
+        self.assertGreaterEqual(self.start_times[2] - start, 0.2)
+        self.assertLess(self.start_times[2] - start, 0.25)
+        self.assertLess(self.start_times[3] - self.start_times[2], 0.05)
+        # Task 4 waits for the weight of tasks 0 and 1 to expire.
+        self.assertGreaterEqual(self.start_times[4] - start, 0.3)
+        self.assertLess(self.start_times[4] - start, 0.35)
+        self.assertEqual(throttler.used_weight(REQUEST_WEIGHT), 16)
+        self.assertEqual(throttler.used_weight("ORDERS"), 1)
+
+    def test_cancelled_waiter(self):
+        throttler = Throttler(rate_limits=[RateLimit(REQUEST_WEIGHT, 10, 0.2)], period_safety_margin=0)
+
+        async def run_tasks():
+            await self.task(throttler, 0, 10)
+            heavy_task = asyncio.ensure_future(self.task(throttler, 1, 10))
+            light_task = asyncio.ensure_future(self.task(throttler, 2, 1))
+            await asyncio.sleep(0.05)
+            self.assertEqual(2, throttler.waiter_count)
+            heavy_task.cancel()
+            await light_task
+
+        self.ev_loop.run_until_complete(run_tasks())
+        self.assertEqual([0, 2], self.task_ids)
+        self.assertEqual(0, throttler.waiter_count)
+
+    def test_heavy_task(self):
+        # A task heavier than the limit runs once nothing else is logged.
+        throttler = Throttler(rate_limits=[RateLimit(REQUEST_WEIGHT, 10, 0.2)], period_safety_margin=0)
+        self.ev_loop.run_until_complete(asyncio.gather(self.task(throttler, 0, 1), self.task(throttler, 1, 50)))
+        self.assertEqual([0, 1], self.task_ids)
+        self.assertGreaterEqual(self.start_times[1] - self.start_times[0], 0.2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import asyncio
+import unittest
+from typing import List
+
+import aiohttp
+from aiohttp import web
+
+from hummingbot.core.utils.http_session_manager import HttpSessionManager
+
+
+class HttpSessionManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        self.peer_ports: List[int] = []
+
+        async def handle(request: web.Request) -> web.Response:
+            self.peer_ports.append(request.transport.get_extra_info("peername")[1])
+            return web.json_response({"ok": True})
+
+        app = web.Application()
+        app.router.add_get("/", handle)
+        self.runner = web.AppRunner(app)
+        self.ev_loop.run_until_complete(self.runner.setup())
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        self.ev_loop.run_until_complete(site.start())
+        self.url = f"http://127.0.0.1:{self.runner.addresses[0][1]}/"
+        self.session_manager = HttpSessionManager(limit_per_host=2)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.session_manager.close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+
+    async def get(self, client: aiohttp.ClientSession):
+        async with client.get(self.url) as response:
+            self.assertEqual(await response.json(), {"ok": True})
+
+    def test_connection_reuse(self):
+        async def sequential_requests():
+            for _ in range(5):
+                await self.get(self.session_manager.get_session())
+
+        self.ev_loop.run_until_complete(sequential_requests())
+        self.assertIs(self.session_manager.get_session(), self.session_manager.get_session())
+        # All requests went through one keep-alive connection.
+        self.assertEqual(len(self.peer_ports), 5)
+        self.assertEqual(len(set(self.peer_ports)), 1)
+
+        # Concurrent requests open at most limit_per_host connections, which later requests reuse.
+        self.peer_ports.clear()
+        self.ev_loop.run_until_complete(asyncio.gather(*[self.get(self.session_manager.get_session())
+                                                         for _ in range(6)]))
+        self.assertEqual(len(self.peer_ports), 6)
+        self.assertLessEqual(len(set(self.peer_ports)), 2)
+
+    def test_close(self):
+        session = self.ev_loop.run_until_complete(self.get_session())
+        self.ev_loop.run_until_complete(self.session_manager.close())
+        self.assertTrue(session.closed)
+        new_session = self.ev_loop.run_until_complete(self.get_session())
+        self.assertIsNot(new_session, session)
+        self.assertFalse(new_session.closed)
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        return self.session_manager.get_session()
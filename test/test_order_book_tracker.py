@@ -0,0 +1,316 @@
+import asyncio
+import unittest
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.last_traded_price_cache import LastTradedPriceCache
+from hummingbot.core.data_type.multiprocess_order_book_tracker import MultiprocessOrderBookTracker
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_snapshot_scheduler import OrderBookSnapshotScheduler
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.order_book_tracker_metrics import OrderBookTrackerPairMetrics, ReceiveTimeQueue
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent
+from hummingbot.core.utils.asyncio_throttle import REQUEST_WEIGHT, RateLimit, Throttler
+
+
+class DelayedSnapshotDataSource(OrderBookTrackerDataSource):
+    def __init__(self, trading_pairs: List[str], delays: Dict[str, float]):
+        super().__init__(trading_pairs)
+        self.delays = delays
+        self.requested: List[str] = []
+
+    @staticmethod
+    async def fetch_trading_pairs() -> List[str]:
+        return []
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.requested.append(trading_pair)
+        await asyncio.sleep(self.delays[trading_pair])
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 10]], dtype=np.float64),
+                                        np.array([[2, 1, 10]], dtype=np.float64))
+        return order_book
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class StreamingDataSource(DelayedSnapshotDataSource):
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        await asyncio.sleep(0.5)
+        for trading_pair in self._trading_pairs:
+            output.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": trading_pair, "update_id": 11, "bids": [[1.5, 2]], "asks": []},
+                timestamp=11))
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        # Late enough for the test to subscribe to trade events once the books are ready.
+        await asyncio.sleep(1.5)
+        output.put_nowait(OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": self._trading_pairs[0], "trade_type": 1.0, "trade_id": 1, "update_id": 12,
+             "price": 1.75, "amount": 3},
+            timestamp=12))
+
+
+class StreamingOrderBookTracker(OrderBookTracker):
+    def __init__(self, trading_pairs: List[str], throttler: Optional[Throttler] = None):
+        data_source = StreamingDataSource(trading_pairs, {trading_pair: 0.01 for trading_pair in trading_pairs})
+        super().__init__(data_source, trading_pairs, throttler=throttler or Throttler((100, 1.0)))
+
+    @property
+    def exchange_name(self) -> str:
+        return "streaming"
+
+
+class OrderBookTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        trading_pairs = [f"PAIR{i}-USDT" for i in range(20)] + ["SLOW-USDT"]
+        delays = {trading_pair: 0.05 for trading_pair in trading_pairs}
+        delays["SLOW-USDT"] = 1.0
+        self.data_source = DelayedSnapshotDataSource(trading_pairs, delays)
+        self.tracker = OrderBookTracker(self.data_source, trading_pairs, throttler=Throttler((11, 1.0)))
+
+    def tearDown(self):
+        self.tracker.stop()
+
+    def test_concurrent_initialization(self):
+        self.tracker._order_book_diff_router_task = asyncio.ensure_future(self.tracker._order_book_diff_router())
+        self.tracker._init_order_books_task = asyncio.ensure_future(self.tracker._init_order_books())
+        # Diffs received while the snapshot request is in flight are replayed once the book is ready.
+        for update_id, price in ((9, 1.5), (11, 1.25)):
+            self.tracker._order_book_diff_stream.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": "SLOW-USDT", "update_id": update_id, "bids": [[price, 1]], "asks": []},
+                timestamp=update_id))
+
+        order_book = self.ev_loop.run_until_complete(self.tracker.wait_for_order_book("PAIR0-USDT"))
+        self.assertIsInstance(order_book, OrderBook)
+        self.assertFalse(self.tracker.ready)
+        self.assertFalse(self.tracker.is_order_book_ready("SLOW-USDT"))
+
+        # The throttler allows 10 snapshot requests per period, so the 21 pairs take 3 periods.
+        self.ev_loop.run_until_complete(asyncio.wait_for(self.tracker._order_books_initialized.wait(), 3))
+        self.assertEqual(len(self.tracker.order_books), 21)
+        self.assertEqual(len(self.data_source.requested), 21)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        bids, _ = self.tracker.order_books["SLOW-USDT"].to_numpy()
+        self.assertEqual(bids[:, 0].tolist(), [1.25, 1])
+
+    def test_diff_coalescing(self):
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 10]], dtype=np.float64),
+                                        np.array([[2, 1, 10]], dtype=np.float64))
+        self.tracker._order_books["PAIR0-USDT"] = order_book
+        message_queue = self.tracker._tracking_message_queues["PAIR0-USDT"] = asyncio.Queue()
+        diffs = [(11, [[1, 3]], [[2, 0], [2.5, 1]]), (12, [[1, 0], [0.5, 2]], [[2.5, 4]]), (13, [[1, 5]], [])]
+        for update_id, bids, asks in diffs:
+            message_queue.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": "PAIR0-USDT", "update_id": update_id, "bids": bids, "asks": asks},
+                timestamp=update_id))
+
+        self.tracker._tracking_tasks["PAIR0-USDT"] = asyncio.ensure_future(
+            self.tracker._track_single_book("PAIR0-USDT"))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        bids, asks = order_book.to_numpy()
+        self.assertEqual(bids[:, :2].tolist(), [[1, 5], [0.5, 2]])
+        self.assertEqual(asks[:, :2].tolist(), [[2.5, 4]])
+        self.assertEqual(order_book.last_diff_uid, 13)
+        self.assertEqual(self.tracker.diff_coalescing_stats["PAIR0-USDT"], {"messages": 3, "batches": 1, "merged": 2})
+        self.assertEqual(self.tracker._past_diffs_windows["PAIR0-USDT"].update_ids.tolist(), [11, 12, 13])
+
+    def test_tracking_metrics(self):
+        self.tracker._order_book_diff_router_task = asyncio.ensure_future(self.tracker._order_book_diff_router())
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 10]], dtype=np.float64),
+                                        np.array([[2, 1, 10]], dtype=np.float64))
+        self.tracker._order_books["PAIR0-USDT"] = order_book
+        message_queue = self.tracker._tracking_message_queues["PAIR0-USDT"] = ReceiveTimeQueue()
+        for update_id in (9, 11, 12):
+            self.tracker._order_book_diff_stream.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": "PAIR0-USDT", "update_id": update_id, "bids": [[1, update_id]], "asks": []},
+                timestamp=update_id))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        metrics = self.tracker.get_tracking_metrics(["PAIR0-USDT"])["PAIR0-USDT"]
+        self.assertEqual(metrics["queue_depth"], 2)
+        self.assertEqual(metrics["rejected_messages"], 1)
+
+        self.tracker._tracking_tasks["PAIR0-USDT"] = asyncio.ensure_future(
+            self.tracker._track_single_book("PAIR0-USDT"))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        message_queue.put_nowait(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "PAIR0-USDT", "update_id": 20, "bids": [[1, 2]], "asks": [[2, 2]]},
+            timestamp=20))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+
+        metrics = self.tracker.get_tracking_metrics()["PAIR0-USDT"]
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertEqual(metrics["diffs_applied"], 2)
+        self.assertEqual(metrics["diff_batches_applied"], 1)
+        self.assertEqual(metrics["snapshot_restores"], 1)
+        self.assertAlmostEqual(metrics["diffs_per_second"], 2 / OrderBookTrackerPairMetrics.RATE_WINDOW)
+        # The diffs waited in the pair's queue for at least 50ms before the tracking task started.
+        self.assertGreaterEqual(metrics["latency_max_ms"], 50)
+        self.assertGreaterEqual(metrics["latency_p99_ms"], 50)
+        self.assertEqual(sum(metrics["latency_histogram"].values()), 1)
+        self.assertEqual(metrics["latency_histogram"]["<=50ms"], 0)
+
+    def test_sequence_gap_resync(self):
+        tracker = OrderBookTracker(self.data_source, ["PAIR0-USDT"], throttler=Throttler((11, 1.0)))
+        tracker.SEQUENCE_GAP_DETECTION = True
+        order_book = OrderBook()
+        order_book.apply_numpy_snapshot(np.array([[1, 1, 10]], dtype=np.float64),
+                                        np.array([[2, 1, 10]], dtype=np.float64))
+        tracker._order_books["PAIR0-USDT"] = order_book
+        tracker._order_book_ready_events["PAIR0-USDT"].set()
+        message_queue = tracker._tracking_message_queues["PAIR0-USDT"] = asyncio.Queue()
+        tracker._tracking_tasks["PAIR0-USDT"] = asyncio.ensure_future(tracker._track_single_book("PAIR0-USDT"))
+        self.assertTrue(tracker.is_order_book_healthy("PAIR0-USDT"))
+
+        # Update ids 13 and 14 go missing.
+        for first_update_id, update_id in ((10, 10), (11, 11), (12, 12), (15, 15), (16, 17)):
+            message_queue.put_nowait(OrderBookMessage(
+                OrderBookMessageType.DIFF,
+                {"trading_pair": "PAIR0-USDT", "first_update_id": first_update_id, "update_id": update_id,
+                 "bids": [[1, update_id]], "asks": []},
+                timestamp=update_id))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertFalse(tracker.is_order_book_healthy("PAIR0-USDT"))
+        self.assertTrue(self.data_source.snapshot_scheduler.is_snapshot_requested("PAIR0-USDT"))
+        self.assertEqual(order_book.last_diff_uid, 12)
+        metrics = tracker.get_tracking_metrics()["PAIR0-USDT"]
+        self.assertEqual(metrics["sequence_gaps"], 1)
+        self.assertEqual(metrics["rejected_messages"], 1)
+
+        # A snapshot older than the gap leaves the book unhealthy, the buffered diffs still don't continue it.
+        message_queue.put_nowait(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "PAIR0-USDT", "update_id": 11, "bids": [[1, 11]], "asks": [[2, 1]]},
+            timestamp=11))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertFalse(tracker.is_order_book_healthy("PAIR0-USDT"))
+        self.assertEqual(order_book.last_diff_uid, 12)
+        self.assertEqual(tracker.get_tracking_metrics()["PAIR0-USDT"]["sequence_gaps"], 2)
+
+        message_queue.put_nowait(OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": "PAIR0-USDT", "update_id": 14, "bids": [[1, 14]], "asks": [[2, 1]]},
+            timestamp=14))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.05))
+        self.assertTrue(tracker.is_order_book_healthy("PAIR0-USDT"))
+        self.assertEqual(order_book.last_diff_uid, 17)
+        bids, _ = order_book.to_numpy()
+        self.assertEqual(bids[:, :2].tolist(), [[1, 17]])
+        tracker.stop()
+
+    def test_snapshot_scheduler(self):
+        trading_pairs = [f"PAIR{i}-USDT" for i in range(4)]
+        scheduler = OrderBookSnapshotScheduler(trading_pairs, refresh_interval=0.4, max_concurrent_requests=2,
+                                               retry_interval=0.02)
+        scheduler.use_throttler(Throttler((100, 1.0)), 1)
+        fetched = []
+        in_flight = []
+
+        async def fetch_snapshot(trading_pair: str) -> OrderBookMessage:
+            in_flight.append(trading_pair)
+            self.assertLessEqual(len(in_flight), 2)
+            await asyncio.sleep(0.02)
+            in_flight.remove(trading_pair)
+            fetched.append(trading_pair)
+            if trading_pair == "PAIR3-USDT" and fetched.count(trading_pair) == 1:
+                raise IOError("Snapshot request failed.")
+            return OrderBookMessage(OrderBookMessageType.SNAPSHOT,
+                                    {"trading_pair": trading_pair, "update_id": 1, "bids": [], "asks": []})
+
+        output = asyncio.Queue()
+        # Pairs are due 0.1s apart. The requested pair goes first, only once, and its next refresh moves back.
+        scheduler.request_snapshot("PAIR2-USDT")
+        scheduler.request_snapshot("PAIR2-USDT")
+        self.assertTrue(scheduler.is_snapshot_requested("PAIR2-USDT"))
+        task = asyncio.ensure_future(scheduler.run(fetch_snapshot, output))
+
+        async def wait_for_retry():
+            while fetched.count("PAIR3-USDT") < 2:
+                await asyncio.sleep(0.01)
+
+        # The failed pair is retried after retry_interval rather than after a full refresh_interval.
+        self.ev_loop.run_until_complete(asyncio.wait_for(wait_for_retry(), 5))
+        task.cancel()
+        self.assertEqual(fetched[:4], ["PAIR2-USDT", "PAIR0-USDT", "PAIR1-USDT", "PAIR3-USDT"])
+        self.assertEqual(output.qsize(), len(fetched) - 1)
+        self.assertFalse(scheduler.is_snapshot_requested("PAIR2-USDT"))
+
+    def test_last_traded_price_cache(self):
+        cache = LastTradedPriceCache(ttl=0.2)
+        fetch_count = [0]
+
+        async def fetch_all_prices() -> Dict[str, float]:
+            fetch_count[0] += 1
+            await asyncio.sleep(0.05)
+            return {"PAIR0-USDT": 1.0, "PAIR1-USDT": 2.0 * fetch_count[0]}
+
+        async def get_prices(trading_pairs: List[str]) -> Dict[str, float]:
+            return await cache.get_prices(fetch_all_prices, trading_pairs)
+
+        # Concurrent callers share one request, and pairs the exchange doesn't report are left out.
+        results = self.ev_loop.run_until_complete(asyncio.gather(get_prices(["PAIR0-USDT"]),
+                                                                 get_prices(["PAIR1-USDT", "PAIR2-USDT"])))
+        self.assertEqual(results, [{"PAIR0-USDT": 1.0}, {"PAIR1-USDT": 2.0}])
+        self.assertEqual(self.ev_loop.run_until_complete(get_prices(["PAIR1-USDT"])), {"PAIR1-USDT": 2.0})
+        self.assertEqual(fetch_count[0], 1)
+        self.ev_loop.run_until_complete(asyncio.sleep(0.25))
+        self.assertEqual(self.ev_loop.run_until_complete(get_prices(["PAIR1-USDT"])), {"PAIR1-USDT": 4.0})
+        self.assertEqual(fetch_count[0], 2)
+        self.assertIs(LastTradedPriceCache.get_instance("test"), LastTradedPriceCache.get_instance("test"))
+
+    def test_multiprocess_tracking(self):
+        trading_pairs = ["PAIR0-USDT", "PAIR1-USDT", "PAIR2-USDT"]
+        tracker = MultiprocessOrderBookTracker(StreamingOrderBookTracker, trading_pairs, process_count=2,
+                                               snapshot_rate_limit=RateLimit(REQUEST_WEIGHT, 100, 1.0))
+        self.assertEqual(tracker.exchange_name, "streaming")
+        # The workers split the snapshot budget.
+        self.assertEqual(tracker.worker_rate_limit, RateLimit(REQUEST_WEIGHT, 100, 2.0))
+        self.assertEqual(MultiprocessOrderBookTracker(StreamingOrderBookTracker, trading_pairs).worker_rate_limit,
+                         RateLimit(REQUEST_WEIGHT, 1, 2.0))
+        tracker.set_price_increments({"PAIR1-USDT": Decimal("0.5")})
+        tracker.start()
+        try:
+            self.ev_loop.run_until_complete(asyncio.wait_for(tracker._order_books_initialized.wait(), 30))
+            order_book = tracker.order_books["PAIR0-USDT"]
+            event_logger = EventLogger()
+            order_book.add_listener(OrderBookEvent.TradeEvent, event_logger)
+            self.ev_loop.run_until_complete(asyncio.sleep(2.5))
+            for trading_pair in trading_pairs:
+                bids, asks = tracker.order_books[trading_pair].to_numpy()
+                self.assertEqual(bids[:, :2].tolist(), [[1.5, 2], [1, 1]])
+                self.assertEqual(asks[:, :2].tolist(), [[2, 1]])
+            self.assertEqual([(event.price, event.amount) for event in event_logger.event_log], [(1.75, 3)])
+            self.assertEqual(order_book.last_trade_price, 1.75)
+            self.assertEqual(tracker.order_books["PAIR1-USDT"].price_increment, 0.5)
+            self.assertEqual(tracker.order_books["PAIR0-USDT"].price_increment, 0)
+            for trading_pair in trading_pairs:
+                self.assertTrue(tracker.is_order_book_healthy(trading_pair))
+            self.assertEqual(set(tracker.get_tracking_metrics().keys()), set(trading_pairs))
+            self.assertEqual(tracker.get_tracking_metrics(["PAIR0-USDT"])["PAIR0-USDT"]["diffs_applied"], 1)
+        finally:
+            tracker.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import unittest
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+import websockets
+
+from hummingbot.core.utils.ws_connection_manager import (
+    WSConnection,
+    WSConnectionManager
+)
+
+
+class MockWSConnectionManager(WSConnectionManager):
+    MAX_TOPICS_PER_CONNECTION = 2
+    FRAME_INTERVAL = 0.0
+
+    def __init__(self, url: str, hot_standby: bool):
+        super().__init__(hot_standby=hot_standby)
+        self.url: str = url
+        self.messages: asyncio.Queue = asyncio.Queue()
+
+    async def _connect(self):
+        return await websockets.connect(self.url)
+
+    async def _send_subscription(self, ws, topics: List[str], subscribe: bool):
+        await ws.send(json.dumps({"subscribe": subscribe, "topics": topics}))
+
+    def _process_message(self, connection: WSConnection, raw_msg: str):
+        self.messages.put_nowait((connection.index, raw_msg))
+
+
+class WSConnectionManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop = asyncio.get_event_loop()
+        # Server side connections and the frames they received, in connection order.
+        self.server_connections: List[Any] = []
+        self.frames: List[List[Dict[str, Any]]] = []
+
+        async def handle(ws, *args):
+            frames: List[Dict[str, Any]] = []
+            self.server_connections.append(ws)
+            self.frames.append(frames)
+            async for raw_frame in ws:
+                frame: Dict[str, Any] = json.loads(raw_frame)
+                frames.append(frame)
+                if frame["subscribe"]:
+                    for topic in frame["topics"]:
+                        await ws.send(topic)
+
+        async def serve():
+            return await websockets.serve(handle, "127.0.0.1", 0)
+
+        self.server = self.ev_loop.run_until_complete(serve())
+        self.url: str = f"ws://127.0.0.1:{list(self.server.sockets)[0].getsockname()[1]}"
+
+    def tearDown(self):
+        self.server.close()
+        self.ev_loop.run_until_complete(self.server.wait_closed())
+
+    @staticmethod
+    async def get_messages(output: asyncio.Queue, count: int) -> List[Any]:
+        return [await asyncio.wait_for(output.get(), timeout=5) for _ in range(count)]
+
+    def test_sharding_and_reconnect(self):
+        manager = MockWSConnectionManager(self.url, hot_standby=False)
+        manager.add_topics(["a1", "a2"])
+        manager.add_topics(["b1"])
+        self.assertEqual([{"a1", "a2"}, {"b1"}], [connection.topics for connection in manager.connections])
+        manager.start()
+        messages = self.ev_loop.run_until_complete(self.get_messages(manager.messages, 3))
+        self.assertEqual({(0, "a1"), (0, "a2"), (1, "b1")}, set(messages))
+
+        # A dropped connection reconnects within milliseconds, and subscribes its topics again.
+        start: float = self.ev_loop.time()
+        first_connection = [ws for ws, frames in zip(self.server_connections, self.frames)
+                            if frames[0]["topics"] == ["a1", "a2"]][0]
+        self.ev_loop.run_until_complete(first_connection.close())
+        messages = self.ev_loop.run_until_complete(self.get_messages(manager.messages, 2))
+        self.assertEqual({(0, "a1"), (0, "a2")}, set(messages))
+        self.assertLess(self.ev_loop.time() - start, 0.5)
+        self.assertEqual(3, len(self.server_connections))
+
+        manager.remove_topics(["a1"])
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual({"subscribe": False, "topics": ["a1"]}, self.frames[-1][-1])
+        metrics: Dict[str, float] = manager.metrics
+        self.assertEqual(3, metrics["connects"])
+        self.assertEqual(1, metrics["disconnects"])
+        self.assertEqual(5, metrics["messages_received"])
+        self.assertEqual(2, metrics["topics"])
+        manager.stop()
+
+    def test_hot_standby_failover(self):
+        manager = MockWSConnectionManager(self.url, hot_standby=True)
+        manager.add_topics(["a1"])
+        manager.start()
+        self.assertEqual([(0, "a1")], self.ev_loop.run_until_complete(self.get_messages(manager.messages, 1)))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(2, len(self.server_connections))
+        self.assertEqual(1, manager.metrics["standby_connected"])
+
+        # The standby connection takes over, replays the subscription, and a new standby connection opens.
+        active_ws = [ws for ws, frames in zip(self.server_connections, self.frames) if len(frames) > 0][0]
+        self.ev_loop.run_until_complete(active_ws.close())
+        self.assertEqual([(0, "a1")], self.ev_loop.run_until_complete(self.get_messages(manager.messages, 1)))
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(3, len(self.server_connections))
+        metrics: Dict[str, float] = manager.metrics
+        self.assertEqual(1, metrics["failovers"])
+        self.assertEqual(1, metrics["connected"])
+        self.assertEqual(1, metrics["standby_connected"])
+
+        manager.stop()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.assertEqual(0, manager.metrics["connected"])
+        self.assertEqual(0, manager.metrics["standby_connected"])
+
+    def test_connect_backoff(self):
+        self.server.close()
+        self.ev_loop.run_until_complete(self.server.wait_closed())
+        manager = MockWSConnectionManager(self.url, hot_standby=False)
+        manager.add_topics(["a1"])
+        manager.start()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.5))
+        manager.stop()
+        # Retries after 10, 20, 40, 80, 160 ms... instead of a fixed delay.
+        self.assertGreaterEqual(manager.metrics["connect_failures"], 4)
+        self.assertLessEqual(manager.metrics["connect_failures"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()